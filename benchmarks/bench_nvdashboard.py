@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Benchmark the cost of the nvdashboard samplers and websocket fan-out.
+
+Runs on CPU-only machines by substituting the synthetic NVML backend for
+``pynvml`` in ``jupyterlab_nvdashboard.apps.gpu``, and reports as JSON:
+
+- ``collect``: latency of each sampler's collection (p50/p99, in µs)
+- ``serialize``: cost of encoding a sample as JSON and binary frames
+- ``load``: event-loop lag and delivered throughput with simulated websocket
+  clients subscribed to every metric
+
+Usage::
+
+    python benchmarks/bench_nvdashboard.py --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+
+import tornado
+
+import jupyterlab_nvdashboard
+from jupyterlab_nvdashboard.apps import gpu, wire
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+from jupyterlab_nvdashboard.apps.sampler import samplers
+
+CLIENT_COUNTS = [1, 10, 100]
+GPU_COUNTS = [1, 8, 16]
+
+
+class CountingNVML(SyntheticNVML):
+    """Synthetic NVML backend counting the device readings it serves."""
+
+    calls = 0
+
+    def _load(self, handle):
+        self.calls += 1
+        return super()._load(handle)
+
+
+def use_fake_gpus(ngpus, latency):
+    """Point ``apps.gpu`` at ``ngpus`` synthetic devices and return their backend."""
+    nvml = CountingNVML(ngpus=ngpus, latency=latency)
+    gpu.pynvml = nvml
+    gpu.init_devices()
+    gpu._snapshot = None
+    samplers["nvlink_throughput"].collect.rates.reset()
+    samplers["pci_stats"].collect.rates.reset()
+    nvml.calls = 0
+    return nvml
+
+
+def percentiles(durations):
+    durations = sorted(durations)
+    return {
+        "p50_us": statistics.median(durations) * 1e6,
+        "p99_us": durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1e6,
+    }
+
+
+def bench_collect(iterations):
+    """Time each sampler's blocking collection."""
+    results = {}
+    for name, sampler in samplers.items():
+        durations = []
+        for _ in range(iterations):
+            # Defeat the per-tick DeviceSnapshot cache so every call reads the devices
+            gpu._snapshot = None
+            start = time.perf_counter()
+            sampler.collect()
+            durations.append(time.perf_counter() - start)
+        results[name] = percentiles(durations)
+    return results
+
+
+def bench_serialize(iterations):
+    """Time encoding one sample of each metric in each wire format."""
+    results = {}
+    for name, sampler in samplers.items():
+        sample = sampler.collect()
+        results[name] = {}
+        for wire_format, encoding in [(wire.JSON, wire.encode_json), (wire.BINARY, wire.encode_binary)]:
+            durations = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                encoded = encoding(sample)
+                durations.append(time.perf_counter() - start)
+            frame = encoded[1] if wire_format == wire.BINARY else encoded.encode()
+            results[name][wire_format] = {**percentiles(durations), "bytes": len(frame)}
+    return results
+
+
+class SimulatedClient:
+    """Websocket client that encodes samples like ``CustomWebSocketHandler.send_data`` but discards them."""
+
+    def __init__(self, sampler, wire_format):
+        self.sampler = sampler
+        self.wire_format = wire_format
+        self.messages = 0
+        self.bytes = 0
+
+    def send_data(self, sample):
+        if self.wire_format == wire.BINARY:
+            _, frame = self.sampler.encode(sample, wire.encode_binary)
+        else:
+            frame = self.sampler.encode(sample, wire.encode_json)
+        self.messages += 1
+        self.bytes += len(frame)
+
+
+async def bench_load(nclients, interval, duration, wire_format):
+    """Subscribe ``nclients`` clients to every metric and measure loop lag and throughput."""
+    clients = [SimulatedClient(sampler, wire_format) for _ in range(nclients) for sampler in samplers.values()]
+    for client in clients:
+        client.sampler.subscribe(client.send_data, interval)
+
+    # Measure how late a 10ms timer fires while the samplers are running
+    lags = []
+    probe_interval = 0.01
+    expected = time.perf_counter() + probe_interval
+
+    def probe():
+        nonlocal expected
+        now = time.perf_counter()
+        lags.append(max(0.0, now - expected))
+        expected = now + probe_interval
+
+    probe_callback = tornado.ioloop.PeriodicCallback(probe, probe_interval * 1000)
+    probe_callback.start()
+    await asyncio.sleep(duration)
+    probe_callback.stop()
+
+    for client in clients:
+        client.sampler.unsubscribe(client.send_data)
+    # Let in-flight collections finish before this event loop closes
+    while any(sampler.collecting for sampler in samplers.values()):
+        await asyncio.sleep(0.01)
+    return {
+        "loop_lag": percentiles(lags or [0.0]),
+        "messages_per_s": sum(client.messages for client in clients) / duration,
+        "bytes_per_s": sum(client.bytes for client in clients) / duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1000, help="samples per latency measurement")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per load scenario")
+    parser.add_argument("--interval", type=int, default=100, help="client update frequency in ms")
+    parser.add_argument("--format", choices=[wire.JSON, wire.BINARY], default=wire.JSON, help="wire format")
+    parser.add_argument("--nvml-latency", type=float, default=0.0, help="simulated µs per NVML call")
+    parser.add_argument("--output", help="write results to this file instead of stdout")
+    args = parser.parse_args()
+
+    # Only record history for the scenario being measured
+    for sampler in samplers.values():
+        sampler.history_interval = None
+
+    results = {
+        "version": jupyterlab_nvdashboard.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "parameters": vars(args),
+        "scenarios": [],
+    }
+    for ngpus in GPU_COUNTS:
+        use_fake_gpus(ngpus, args.nvml_latency / 1e6)
+        scenario = {
+            "ngpus": ngpus,
+            "collect": bench_collect(args.iterations),
+            "serialize": bench_serialize(args.iterations),
+            "load": [],
+        }
+        for nclients in CLIENT_COUNTS:
+            nvml = use_fake_gpus(ngpus, args.nvml_latency / 1e6)
+            load = asyncio.run(bench_load(nclients, args.interval, args.duration, args.format))
+            load["nvml_calls_per_s"] = nvml.calls / args.duration
+            scenario["load"].append({"clients": nclients, **load})
+        results["scenarios"].append(scenario)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,30 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: BSD-3-Clause
 
+from . import alerts
 from . import cpu
+from . import diagnostics
+from . import exporter
+from . import federation
 from . import gpu
+from . import health
+from . import processes
+from . import recorder
+from . import sampler
+from . import stream
+from . import topology
 
-__all__ = ["cpu", "gpu"]
+__all__ = [
+    "alerts",
+    "cpu",
+    "diagnostics",
+    "exporter",
+    "federation",
+    "gpu",
+    "health",
+    "processes",
+    "recorder",
+    "sampler",
+    "stream",
+    "topology",
+]
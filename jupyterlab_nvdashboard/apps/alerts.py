@@ -0,0 +1,358 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Alert rules evaluated on the sample stream.
+
+When ``NVDASHBOARD_ALERT_RULES`` names a JSON file, its rules are evaluated by
+the server on every sample of the metrics they reference. Alert events are
+pushed to the ``nvdashboard/alerts/events`` websocket and listed by the
+``nvdashboard/alerts`` HTTP endpoint. Rules look like::
+
+    [
+        {
+            "name": "gpu-memory-high",
+            "when": {"metric": "gpu_usage", "field": "memory_usage", "of": "total_memory", "op": ">", "value": 95},
+            "for": 120
+        },
+        {
+            "name": "nvlink-idle-while-busy",
+            "when": [
+                {"metric": "gpu_utilization", "field": "gpu_utilization", "op": ">", "value": 80},
+                {"metric": "nvlink_throughput", "field": "nvlink_rx", "op": "<", "value": 1e6}
+            ],
+            "for": 60,
+            "severity": "info"
+        }
+    ]
+
+A rule holds while all of its conditions hold, and fires once it has held for
+``for`` seconds. Conditions compare a sample field, optionally as a percentage
+``of`` another field or as its ``rate`` of change per second, to a value.
+Fields holding one value per GPU are compared GPU by GPU, and each GPU fires
+and resolves on its own. Rules only keep the state of the previous sample, so
+a sample costs one comparison per condition and GPU, whatever the history.
+"""
+
+import functools
+import json
+import operator
+import os
+import time
+from collections import deque
+
+from tornado.log import app_log
+from tornado.websocket import WebSocketHandler
+from jupyter_server.base.handlers import JupyterHandler
+
+from jupyterlab_nvdashboard.apps.sampler import samplers
+
+# Environment variable naming the JSON file of alert rules
+ALERT_RULES_ENV = "NVDASHBOARD_ALERT_RULES"
+
+# Cadence in ms at which the metrics referenced by rules are sampled
+RULE_INTERVAL = 1000
+
+# Number of past alert events kept for the HTTP endpoint
+MAX_EVENTS = 1000
+
+OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+SEVERITIES = ("info", "warning", "critical")
+
+
+class Condition:
+    """
+    Comparison of a field of a metric's samples to a threshold.
+
+    Parameters
+    ----------
+    metric : str
+        Name of the sampler whose samples are compared.
+    field : str
+        Key of the sample field, a number or a list of one number per GPU.
+    op : str
+        One of ``>``, ``>=``, ``<`` and ``<=``.
+    value : float
+        Threshold the field is compared to.
+    of : str, optional
+        Key of a field to divide ``field`` by, comparing it as a percentage.
+    rate : bool, optional
+        Compare the change of the field per second instead of the field.
+    """
+
+    def __init__(self, metric, field, op, value, of=None, rate=False):
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator {op!r}, expected one of {', '.join(OPERATORS)}")
+        self.metric = metric
+        self.field = field
+        self.op = op
+        self.compare = OPERATORS[op]
+        self.value = float(value)
+        self.of = of
+        self.rate = bool(rate)
+        # Compared values and their result, as of the latest sample
+        self.values = None
+        self.matches = None
+        self.previous = None
+
+    def update(self, sample, timestamp):
+        """Compare the field of a new ``sample`` taken at ``timestamp`` (ms)."""
+        values = sample.get(self.field)
+        if values is None:
+            self.values = self.matches = None
+            return
+        if self.of is not None:
+            totals = sample.get(self.of)
+            values = _map(lambda value, total: 100 * value / total if total else 0.0, values, totals)
+        if self.rate:
+            previous, self.previous = self.previous, (timestamp, values)
+            if previous is None or timestamp <= previous[0] or _length(values) != _length(previous[1]):
+                self.values = self.matches = None
+                return
+            elapsed = (timestamp - previous[0]) / 1000
+            values = _map(lambda value, last: (value - last) / elapsed, values, previous[1])
+        self.values = values
+        self.matches = _map(lambda value: self.compare(value, self.value), values)
+
+    def describe(self):
+        name = f"{self.metric}.{self.field}"
+        if self.of is not None:
+            name = f"{name} % of {self.of}"
+        if self.rate:
+            name = f"rate({name})"
+        return f"{name} {self.op} {self.value:g}"
+
+
+def _length(values):
+    return len(values) if isinstance(values, list) else None
+
+
+def _map(function, values, *others):
+    """Apply ``function`` to a number, or element-wise to lists of numbers."""
+    if not isinstance(values, list):
+        return function(values, *others)
+    if not others:
+        return [function(value) for value in values]
+    (other,) = others
+    if not isinstance(other, list):
+        other = [other] * len(values)
+    return [function(value, item) for value, item in zip(values, other, strict=False)]
+
+
+class Rule:
+    """
+    Alert raised while all of its ``conditions`` hold, once they have held for ``duration`` seconds.
+
+    Rules over per-GPU fields raise an alert per GPU, with conditions over
+    scalar fields applying to every GPU.
+    """
+
+    def __init__(self, name, conditions, duration=0, severity="warning", message=None):
+        if not conditions:
+            raise ValueError(f"Alert rule {name!r} has no conditions")
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity {severity!r} of alert rule {name!r}")
+        self.name = name
+        self.conditions = conditions
+        self.duration = float(duration)
+        self.severity = severity
+        self.message = message or " and ".join(condition.describe() for condition in conditions)
+        self.metrics = {condition.metric for condition in conditions}
+        # Time (ms) since which the rule holds, and firing alerts, by GPU
+        self.since = {}
+        self.firing = {}
+
+    def evaluate(self, timestamp):
+        """Return the alert events caused by the latest samples, at ``timestamp`` (ms)."""
+        matches = [condition.matches for condition in self.conditions]
+        if any(match is None for match in matches):
+            # Some metric has not been sampled yet, or a rate needs a second sample
+            return []
+        lengths = [len(match) for match in matches if isinstance(match, list)]
+        if lengths:
+            holds = {
+                index: all(match[index] if isinstance(match, list) else match for match in matches)
+                for index in range(min(lengths))
+            }
+        else:
+            holds = {None: all(matches)}
+
+        events = []
+        for index, held in holds.items():
+            if held:
+                since = self.since.setdefault(index, timestamp)
+                if index not in self.firing and timestamp - since >= self.duration * 1000:
+                    self.firing[index] = self._event(index, "firing", timestamp, since)
+                    events.append(self.firing[index])
+            else:
+                since = self.since.pop(index, None)
+                if index in self.firing:
+                    del self.firing[index]
+                    events.append(self._event(index, "resolved", timestamp, since))
+        # GPUs that are no longer reported resolve their alerts
+        for index in [index for index in self.firing if index not in holds]:
+            events.append(self._event(index, "resolved", timestamp, self.since.pop(index, None)))
+            del self.firing[index]
+        return events
+
+    def _event(self, index, state, timestamp, since):
+        values = {}
+        for condition in self.conditions:
+            value = condition.values
+            if isinstance(value, list):
+                value = value[index] if index is not None and index < len(value) else None
+            values[condition.describe()] = value
+        return {
+            "rule": self.name,
+            "severity": self.severity,
+            "message": self.message,
+            "gpu": index,
+            "state": state,
+            "time": timestamp,
+            "since": since,
+            "values": values,
+        }
+
+
+def parse_rules(config):
+    """Return the Rules described by ``config``, a list of rules or ``{"rules": [...]}``."""
+    if isinstance(config, dict):
+        config = config.get("rules", [])
+    if not isinstance(config, list):
+        raise ValueError("Alert rules must be a list of rules")
+    rules = []
+    for index, rule in enumerate(config):
+        if not isinstance(rule, dict):
+            raise ValueError(f"Alert rule {index} is not an object")
+        name = rule.get("name", f"rule-{index}")
+        when = rule.get("when", [])
+        if isinstance(when, dict):
+            when = [when]
+        try:
+            conditions = [Condition(**condition) for condition in when]
+        except TypeError as error:
+            raise ValueError(f"Invalid condition in alert rule {name!r}: {error}") from None
+        rules.append(
+            Rule(
+                name,
+                conditions,
+                duration=rule.get("for", 0),
+                severity=rule.get("severity", "warning"),
+                message=rule.get("message"),
+            )
+        )
+    names = [rule.name for rule in rules]
+    if len(set(names)) != len(names):
+        raise ValueError("Alert rule names must be unique")
+    return rules
+
+
+class AlertEngine:
+    """
+    Evaluate alert rules on the samples of the metrics they reference.
+
+    Each sample only updates the conditions over its own metric and
+    re-evaluates the rules referencing that metric. Alert events are kept
+    in a bounded log, numbered by ``id``, and handed to ``listeners``.
+    """
+
+    def __init__(self, rules, max_events=MAX_EVENTS):
+        self.rules = rules
+        self.conditions = {}
+        self.rules_by_metric = {}
+        for rule in rules:
+            for condition in rule.conditions:
+                self.conditions.setdefault(condition.metric, []).append(condition)
+            for metric in rule.metrics:
+                self.rules_by_metric.setdefault(metric, []).append(rule)
+        self.events = deque(maxlen=max_events)
+        self.next_id = 1
+        self.listeners = set()
+        self.subscribers = {}
+
+    def start(self):
+        """Start evaluating the rules on the samples of their metrics."""
+        for metric in self.rules_by_metric:
+            if metric not in samplers:
+                app_log.warning(f"Alert rules reference unknown metric {metric}")
+                continue
+            subscriber = functools.partial(self.on_sample, metric)
+            samplers[metric].subscribe(subscriber, RULE_INTERVAL)
+            self.subscribers[metric] = subscriber
+
+    def stop(self):
+        """Stop evaluating the rules."""
+        for metric, subscriber in self.subscribers.items():
+            samplers[metric].unsubscribe(subscriber)
+        self.subscribers = {}
+
+    def on_sample(self, metric, sample):
+        timestamp = sample.get("time", time.time() * 1000)
+        for condition in self.conditions[metric]:
+            condition.update(sample, timestamp)
+        for rule in self.rules_by_metric[metric]:
+            for event in rule.evaluate(timestamp):
+                self.emit(event)
+
+    def emit(self, event):
+        event["id"] = self.next_id
+        self.next_id += 1
+        self.events.append(event)
+        for listener in list(self.listeners):
+            try:
+                listener(event)
+            except Exception:
+                app_log.exception("Failed to deliver alert event")
+
+    def active(self):
+        """Return the firing event of every active alert."""
+        return [event for rule in self.rules for event in rule.firing.values()]
+
+    def history(self, after=0):
+        """Return the logged events numbered after ``after``, oldest first."""
+        return [event for event in self.events if event["id"] > after]
+
+
+class AlertsWebSocketHandler(JupyterHandler, WebSocketHandler):
+    """
+    Push alert events to the client as ``{"alert": event}``.
+
+    The alerts active when the client connects are sent first, as
+    ``{"active": [event, ...]}``.
+    """
+
+    def initialize(self, engine):
+        self.engine = engine
+
+    def open(self):
+        if not self.current_user:
+            self.write_message(json.dumps({"error": "Unauthorized access"}))
+            self.close()
+            return
+        self.write_message(json.dumps({"status": "connected"}))
+        self.write_message(json.dumps({"active": self.engine.active()}))
+        self.engine.listeners.add(self.send_event)
+
+    def on_close(self):
+        self.engine.listeners.discard(self.send_event)
+
+    def send_event(self, event):
+        self.write_message(json.dumps({"alert": event}))
+
+
+def from_environment():
+    """
+    Return an AlertEngine for the rules file named by the environment, or None
+    if alerting is disabled. A rules file that cannot be read or parsed is
+    logged and the engine starts without rules, so the dashboard still loads.
+    """
+    path = os.environ.get(ALERT_RULES_ENV)
+    if not path:
+        return None
+    try:
+        with open(path) as f:
+            rules = parse_rules(json.load(f))
+    except (OSError, ValueError) as error:
+        app_log.error(f"Ignoring alert rules in {path}: {error}")
+        rules = []
+    return AlertEngine(rules)
@@ -0,0 +1,561 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+NVML backends for the GPU metrics.
+
+A backend is any object exposing the subset of the ``pynvml`` API used by
+``apps.gpu``. Besides the real ``pynvml`` module, two synthetic backends let
+the GPU paths run without GPUs, for testing, load simulation and profiling:
+
+- ``SyntheticNVML`` generates readings for a configurable number of GPUs,
+  NVLink topology, PCIe generation and utilization waveform.
+- ``ReplayNVML`` plays back a trace recorded with ``record_trace``, e.g.
+  captured on a customer's machine.
+
+The backend is selected with the ``NVDASHBOARD_NVML_BACKEND`` environment
+variable, see ``load_backend``. Traces are recorded with::
+
+    python -m jupyterlab_nvdashboard.apps.backends trace.jsonl --duration 60
+"""
+
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+import pynvml
+
+# Environment variable selecting the NVML backend
+BACKEND_ENV = "NVDASHBOARD_NVML_BACKEND"
+
+WAVEFORMS = {
+    "constant": lambda phase: 0.5,
+    "sine": lambda phase: 0.5 + 0.5 * math.sin(2 * math.pi * phase),
+    "square": lambda phase: 1.0 if phase % 1 < 0.5 else 0.0,
+    "sawtooth": lambda phase: phase % 1,
+    "random": lambda phase: random.random(),  # noqa: S311
+}
+
+# MIG profile names, e.g. "3g.40gb", capturing the memory in GB
+MIG_PROFILE = re.compile(r"\d+g\.(\d+)gb")
+
+# Maximum clocks of the synthetic GPUs in MHz, and their power limit in mW
+SYNTHETIC_CLOCKS = {pynvml.NVML_CLOCK_SM: 1980, pynvml.NVML_CLOCK_MEM: 2619}
+SYNTHETIC_POWER_LIMIT = 700_000
+
+# NVLink speed field IDs mapped to their link index
+NVLINK_SPEED_FIELDS = {
+    getattr(pynvml, f"NVML_FI_DEV_NVLINK_SPEED_MBPS_L{i}"): i
+    for i in range(pynvml.NVML_NVLINK_MAX_LINKS)
+    if hasattr(pynvml, f"NVML_FI_DEV_NVLINK_SPEED_MBPS_L{i}")
+}
+
+
+def _field_value(field, value, status=pynvml.NVML_SUCCESS):
+    field_id, scope_id = field if isinstance(field, tuple) else (field, 0)
+    return SimpleNamespace(
+        fieldId=field_id,
+        scopeId=scope_id,
+        timestamp=int(time.time() * 1e6),
+        latencyUsec=0,
+        valueType=pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG_LONG,
+        nvmlReturn=status,
+        value=SimpleNamespace(ullVal=int(value), uiVal=int(value), dVal=float(value)),
+    )
+
+
+class _FakeNVML:
+    """
+    Base class of the synthetic backends.
+
+    Constants and exception classes are those of ``pynvml``. NVML functions
+    that a backend does not implement raise ``NVMLError_NotSupported``, and
+    field values it does not know have an ``NVML_ERROR_NOT_SUPPORTED`` return
+    code, as they would on a GPU lacking the feature.
+    """
+
+    def __getattr__(self, name):
+        attr = getattr(pynvml, name)
+        if name.startswith("nvml") and callable(attr):
+
+            def not_supported(*args, **kwargs):
+                raise pynvml.NVMLError_NotSupported()
+
+            return not_supported
+        return attr
+
+    def nvmlInit(self):
+        pass
+
+    def nvmlShutdown(self):
+        pass
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        if not 0 <= index < self.nvmlDeviceGetCount():
+            raise pynvml.NVMLError_InvalidArgument()
+        return index
+
+
+class SyntheticNVML(_FakeNVML):
+    """
+    NVML backend generating readings for simulated GPUs.
+
+    Parameters
+    ----------
+    ngpus : int, optional
+        Number of simulated GPUs.
+    nvlinks : int, optional
+        Active NVLink links per GPU, 0 for a PCIe-only system.
+    topology : {"switch", "ring"}, optional
+        How NVLinks connect the GPUs: all GPUs to each other through an
+        NVSwitch, or each GPU to its two neighbours. Either way, the first
+        half of the GPUs are local to the first half of the CPUs, and the
+        rest to the others, as on a two-socket server.
+    pcie_gen, pcie_width : int, optional
+        Maximum PCIe link generation and width.
+    pcie_counters : bool, optional
+        Whether the GPUs have cumulative PCIe byte counters, like recent ones.
+    memory : float, optional
+        Memory of each GPU, in GiB.
+    waveform : str, optional
+        Shape of the utilization of each GPU over time, one of ``WAVEFORMS``.
+        Memory, PCIe and NVLink traffic follow the utilization.
+    period : float, optional
+        Period of the waveform in seconds. Each GPU is offset by a fraction of
+        the period so they do not move in lockstep.
+    latency : float, optional
+        Seconds each NVML call blocks for, to mimic a slow driver.
+    mig : str, optional
+        Profiles of the MIG devices of every GPU separated by ``+``, e.g.
+        ``3g.40gb+2g.20gb``, or empty for GPUs not in MIG mode. The memory of
+        each MIG device is read from its profile, and its load is its GPU's.
+    """
+
+    def __init__(
+        self,
+        ngpus=8,
+        nvlinks=12,
+        topology="switch",
+        pcie_gen=4,
+        pcie_width=16,
+        pcie_counters=True,
+        memory=80,
+        waveform="sine",
+        period=60,
+        latency=0.0,
+        mig="",
+    ):
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"Unknown waveform {waveform}, expected one of {sorted(WAVEFORMS)}")
+        if topology not in ("switch", "ring"):
+            raise ValueError(f"Unknown NVLink topology {topology}, expected 'switch' or 'ring'")
+        self.ngpus = int(ngpus)
+        self.nvlinks = min(int(nvlinks), pynvml.NVML_NVLINK_MAX_LINKS)
+        self.topology = topology
+        self.pcie_gen = int(pcie_gen)
+        self.pcie_width = int(pcie_width)
+        self.pcie_counters = str(pcie_counters).lower() not in ("0", "false", "no")
+        self.memory = int(float(memory) * 2**30)
+        self.waveform = WAVEFORMS[waveform]
+        self.period = float(period)
+        self.latency = float(latency)
+        self.mig_profiles = [profile.strip() for profile in mig.split("+") if profile.strip()]
+        for profile in self.mig_profiles:
+            if not MIG_PROFILE.fullmatch(profile):
+                raise ValueError(f"Unknown MIG profile {profile}, expected e.g. '3g.40gb'")
+        self.start = time.monotonic()
+        # Cumulative NVLink traffic in KiB, as [gpu][direction][link]
+        self.nvlink_counters = [[[0.0] * pynvml.NVML_NVLINK_MAX_LINKS for _ in range(2)] for _ in range(self.ngpus)]
+        # Cumulative PCIe traffic in bytes, as [gpu][tx, rx]
+        self.pcie_byte_counters = [[0.0, 0.0] for _ in range(self.ngpus)]
+        self.counters_updated = [self.start] * self.ngpus
+        self.lock = threading.Lock()
+
+    def _load(self, handle):
+        """Utilization of GPU ``handle`` in [0, 1] at the current time."""
+        if self.latency:
+            time.sleep(self.latency)
+        elapsed = time.monotonic() - self.start
+        return self.waveform(elapsed / self.period + handle / max(self.ngpus, 1))
+
+    def nvlink_peer(self, handle, link):
+        """Index of the GPU at the other end of ``link`` of GPU ``handle``."""
+        if self.topology == "ring":
+            return (handle + (1 if link % 2 == 0 else -1)) % self.ngpus
+        peers = [gpu for gpu in range(self.ngpus) if gpu != handle] or [handle]
+        return peers[link % len(peers)]
+
+    def socket(self, handle):
+        """Index of the simulated CPU socket GPU ``handle`` is attached to."""
+        return 2 * handle // max(self.ngpus, 1)
+
+    def nvmlDeviceGetCount(self):
+        return self.ngpus
+
+    def nvmlDeviceGetName(self, handle):
+        if isinstance(handle, tuple):
+            return f"Synthetic GPU MIG {self.mig_profiles[handle[1]]}"
+        return "Synthetic GPU"
+
+    def nvmlDeviceGetPciInfo(self, handle):
+        return SimpleNamespace(busId=f"00000000:{0x10 + handle:02X}:00.0", domain=0, bus=0x10 + handle, device=0)
+
+    def nvmlDeviceGetTopologyCommonAncestor(self, handle, other):
+        if self.socket(handle) == self.socket(other):
+            return pynvml.NVML_TOPOLOGY_NODE
+        return pynvml.NVML_TOPOLOGY_SYSTEM
+
+    def nvmlDeviceGetCpuAffinity(self, handle, size):
+        ncpus = min(os.cpu_count() or 1, 64 * size)
+        half = max(ncpus // 2, 1)
+        cpus = range(half * self.socket(handle), min(half * (self.socket(handle) + 1), ncpus)) or range(ncpus)
+        mask = [0] * size
+        for cpu in cpus:
+            mask[cpu // 64] |= 1 << cpu % 64
+        return mask
+
+    def nvmlDeviceGetNvLinkRemoteDeviceType(self, handle, link):
+        if link >= self.nvlinks:
+            raise pynvml.NVMLError_NotSupported()
+        if self.topology == "switch":
+            return pynvml.NVML_NVLINK_DEVICE_TYPE_SWITCH
+        return pynvml.NVML_NVLINK_DEVICE_TYPE_GPU
+
+    def nvmlDeviceGetNvLinkRemotePciInfo(self, handle, link):
+        if link >= self.nvlinks:
+            raise pynvml.NVMLError_NotSupported()
+        if self.topology == "switch":
+            return SimpleNamespace(busId=f"00000000:{0x80 + link % 4:02X}:00.0")
+        return self.nvmlDeviceGetPciInfo(self.nvlink_peer(handle, link))
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        load = self._load(handle)
+        return SimpleNamespace(gpu=round(load * 100), memory=round(load * 60))
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        total = self.memory
+        if isinstance(handle, tuple):
+            # MIG device handles are (GPU, MIG device index)
+            total = int(MIG_PROFILE.fullmatch(self.mig_profiles[handle[1]]).group(1)) * 2**30
+            handle = handle[0]
+        used = int(total * (0.1 + 0.8 * self._load(handle)))
+        return SimpleNamespace(total=total, used=used, free=total - used)
+
+    def nvmlDeviceGetUUID(self, handle):
+        if isinstance(handle, tuple):
+            return f"MIG-5e1f{handle[0]:04x}-0000-0000-0000-{handle[1]:012x}"
+        return f"GPU-5e1f0000-0000-0000-0000-{handle:012x}"
+
+    def nvmlDeviceGetMigMode(self, handle):
+        mode = pynvml.NVML_DEVICE_MIG_ENABLE if self.mig_profiles else pynvml.NVML_DEVICE_MIG_DISABLE
+        return [mode, mode]
+
+    def nvmlDeviceGetMaxMigDeviceCount(self, handle):
+        return 7 if self.mig_profiles else 0
+
+    def nvmlDeviceGetMigDeviceHandleByIndex(self, handle, index):
+        if index >= len(self.mig_profiles):
+            raise pynvml.NVMLError_NotFound()
+        return (handle, index)
+
+    def nvmlDeviceGetGpuInstanceId(self, handle):
+        return handle[1] + 1
+
+    def nvmlDeviceGetComputeInstanceId(self, handle):
+        return 0
+
+    def _pcie_throughput(self, counter, load):
+        # KB/s, up to a quarter of the link bandwidth
+        lane_bandwidth = 250 * 2 ** (self.pcie_gen - 1) * 1000
+        share = 0.25 if counter == pynvml.NVML_PCIE_UTIL_TX_BYTES else 0.2
+        return int(lane_bandwidth * self.pcie_width * share * load)
+
+    def nvmlDeviceGetPcieThroughput(self, handle, counter):
+        return self._pcie_throughput(counter, self._load(handle))
+
+    def nvmlDeviceGetMaxPcieLinkGeneration(self, handle):
+        return self.pcie_gen
+
+    def nvmlDeviceGetMaxPcieLinkWidth(self, handle):
+        return self.pcie_width
+
+    def nvmlDeviceGetNvLinkVersion(self, handle, link):
+        if link >= self.nvlinks:
+            raise pynvml.NVMLError_NotSupported()
+        return 4
+
+    def _power(self, load):
+        # mW, capped at the power limit above 90% utilization
+        return min(int(SYNTHETIC_POWER_LIMIT * (0.1 + load)), SYNTHETIC_POWER_LIMIT)
+
+    def _throttle_reasons(self, load):
+        if load < 0.05:
+            return pynvml.nvmlClocksThrottleReasonGpuIdle
+        if self._power(load) >= SYNTHETIC_POWER_LIMIT:
+            return pynvml.nvmlClocksThrottleReasonSwPowerCap
+        return pynvml.nvmlClocksThrottleReasonNone
+
+    def _temperature(self, load):
+        return round(35 + 50 * load)
+
+    def nvmlDeviceGetMaxClockInfo(self, handle, clock):
+        return SYNTHETIC_CLOCKS[clock]
+
+    def nvmlDeviceGetClockInfo(self, handle, clock):
+        reasons = self._throttle_reasons(self._load(handle))
+        if clock == pynvml.NVML_CLOCK_SM and reasons == pynvml.nvmlClocksThrottleReasonSwPowerCap:
+            # Power capping lowers the SM clock
+            return int(SYNTHETIC_CLOCKS[clock] * 0.8)
+        return SYNTHETIC_CLOCKS[clock]
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        return self._temperature(self._load(handle))
+
+    def nvmlDeviceGetTemperatureThreshold(self, handle, threshold):
+        return 87
+
+    def nvmlDeviceGetPowerUsage(self, handle):
+        return self._power(self._load(handle))
+
+    def nvmlDeviceGetEnforcedPowerLimit(self, handle):
+        return SYNTHETIC_POWER_LIMIT
+
+    def nvmlDeviceGetCurrentClocksThrottleReasons(self, handle):
+        return self._throttle_reasons(self._load(handle))
+
+    def nvmlDeviceGetFieldValues(self, handle, fields):
+        load = self._load(handle)
+        health = {
+            pynvml.NVML_FI_DEV_POWER_INSTANT: self._power(load),
+            pynvml.NVML_FI_DEV_POWER_CURRENT_LIMIT: SYNTHETIC_POWER_LIMIT,
+            pynvml.NVML_FI_DEV_MEMORY_TEMP: self._temperature(load) - 5,
+            pynvml.NVML_FI_DEV_ECC_SBE_VOL_TOTAL: 0,
+            pynvml.NVML_FI_DEV_ECC_DBE_VOL_TOTAL: 0,
+            pynvml.NVML_FI_DEV_ECC_SBE_AGG_TOTAL: 0,
+            pynvml.NVML_FI_DEV_ECC_DBE_AGG_TOTAL: 0,
+        }
+        with self.lock:
+            # Advance the NVLink counters at 20 GB/s per link at full load,
+            # and the PCIe counters at the PCIe throughput
+            now = time.monotonic()
+            elapsed = now - self.counters_updated[handle]
+            self.counters_updated[handle] = now
+            traffic = load * 20 * 2**20 * elapsed
+            for direction in self.nvlink_counters[handle]:
+                for link in range(self.nvlinks):
+                    direction[link] += traffic
+            counters = self.nvlink_counters[handle]
+            pcie = self.pcie_byte_counters[handle]
+            pcie[0] += self._pcie_throughput(pynvml.NVML_PCIE_UTIL_TX_BYTES, load) * 1024 * elapsed
+            pcie[1] += self._pcie_throughput(pynvml.NVML_PCIE_UTIL_RX_BYTES, load) * 1024 * elapsed
+
+            values = []
+            for field in fields:
+                field_id, scope_id = field if isinstance(field, tuple) else (field, 0)
+                if field_id in NVLINK_SPEED_FIELDS:
+                    value = 25_000 if NVLINK_SPEED_FIELDS[field_id] < self.nvlinks else 0
+                elif field_id == pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_RX:
+                    value = counters[0][scope_id]
+                elif field_id == pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_TX:
+                    value = counters[1][scope_id]
+                elif field_id == pynvml.NVML_FI_DEV_PCIE_COUNT_TX_BYTES and self.pcie_counters:
+                    value = pcie[0]
+                elif field_id == pynvml.NVML_FI_DEV_PCIE_COUNT_RX_BYTES and self.pcie_counters:
+                    value = pcie[1]
+                elif field_id in health:
+                    value = health[field_id]
+                else:
+                    values.append(_field_value(field, 0, pynvml.NVML_ERROR_NOT_SUPPORTED))
+                    continue
+                values.append(_field_value(field, value))
+        return values
+
+
+class ReplayNVML(_FakeNVML):
+    """
+    NVML backend playing back a trace recorded with ``record_trace``.
+
+    The trace is replayed in real time from when the backend is created and
+    loops when it reaches the end.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON lines trace.
+    """
+
+    def __init__(self, path):
+        with open(path) as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        self.header, frames = lines[0], lines[1:]
+        if not frames:
+            raise ValueError(f"Trace {path} has no frames")
+        self.frames = frames
+        self.times = [frame["time"] - frames[0]["time"] for frame in frames]
+        # Replay the last frame for as long as the gap before it
+        self.duration = self.times[-1] + (self.times[-1] - self.times[-2] if len(frames) > 1 else 1)
+        self.start = time.monotonic()
+
+    def _frame(self):
+        elapsed = (time.monotonic() - self.start) % self.duration
+        index = next((i for i, t in enumerate(self.times) if t > elapsed), len(self.times)) - 1
+        return self.frames[max(index, 0)]
+
+    def nvmlDeviceGetCount(self):
+        return self.header["ngpus"]
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        return SimpleNamespace(gpu=self._frame()["utilization"][handle], memory=0)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        total = self.header["memory_total"][handle]
+        used = self._frame()["memory_used"][handle]
+        return SimpleNamespace(total=total, used=used, free=total - used)
+
+    def nvmlDeviceGetPcieThroughput(self, handle, counter):
+        key = "pci_tx" if counter == pynvml.NVML_PCIE_UTIL_TX_BYTES else "pci_rx"
+        # Traces store B/s, NVML reports KB/s
+        return self._frame()[key][handle] // 1024
+
+    def nvmlDeviceGetMaxPcieLinkGeneration(self, handle):
+        if self.header.get("pcie_gen") is None:
+            raise pynvml.NVMLError_NotSupported()
+        return self.header["pcie_gen"]
+
+    def nvmlDeviceGetMaxPcieLinkWidth(self, handle):
+        if self.header.get("pcie_width") is None:
+            raise pynvml.NVMLError_NotSupported()
+        return self.header["pcie_width"]
+
+    def nvmlDeviceGetNvLinkVersion(self, handle, link):
+        if not self.header.get("nvlink_speed"):
+            raise pynvml.NVMLError_NotSupported()
+        return self.header.get("nvlink_version", 4)
+
+    def nvmlDeviceGetFieldValues(self, handle, fields):
+        frame = self._frame()
+        counters = frame["nvlink_throughput"][handle] if frame["nvlink_throughput"] else []
+        pcie = frame["pci_counters"][handle] if frame.get("pci_counters") else None
+        speeds = self.header.get("nvlink_speed") or []
+        # Counters of the recorded links, RX for every link followed by TX.
+        # Older traces recorded every link.
+        links = self.header.get("nvlink_links", range(pynvml.NVML_NVLINK_MAX_LINKS))
+        link_index = {link: index for index, link in enumerate(links)}
+        values = []
+        for field in fields:
+            field_id, scope_id = field if isinstance(field, tuple) else (field, 0)
+            if field_id in NVLINK_SPEED_FIELDS:
+                index = NVLINK_SPEED_FIELDS[field_id]
+                value = speeds[index] if index < len(speeds) else 0
+            elif field_id == pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_RX:
+                value = counters[link_index[scope_id]] if scope_id in link_index else 0
+            elif field_id == pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_TX:
+                value = counters[len(link_index) + link_index[scope_id]] if scope_id in link_index else 0
+            elif field_id == pynvml.NVML_FI_DEV_PCIE_COUNT_TX_BYTES and pcie is not None:
+                value = pcie[0]
+            elif field_id == pynvml.NVML_FI_DEV_PCIE_COUNT_RX_BYTES and pcie is not None:
+                value = pcie[1]
+            else:
+                values.append(_field_value(field, 0, pynvml.NVML_ERROR_NOT_SUPPORTED))
+                continue
+            values.append(_field_value(field, value))
+        return values
+
+
+def _parse_options(options):
+    kwargs = {}
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        kwargs[key.strip()] = value.strip()
+    return kwargs
+
+
+def load_backend(spec=None):
+    """
+    Return the NVML backend described by ``spec``.
+
+    Parameters
+    ----------
+    spec : str, optional
+        ``pynvml`` for the real library (the default), ``synthetic`` with
+        optional ``SyntheticNVML`` arguments such as
+        ``synthetic:ngpus=16,nvlinks=18,waveform=square``, or
+        ``replay:<path to trace>``. Defaults to the ``NVDASHBOARD_NVML_BACKEND``
+        environment variable.
+    """
+    if spec is None:
+        spec = os.environ.get(BACKEND_ENV, "pynvml")
+    kind, _, options = spec.partition(":")
+    if kind == "pynvml":
+        return pynvml
+    if kind == "synthetic":
+        return SyntheticNVML(**_parse_options(options))
+    if kind == "replay":
+        return ReplayNVML(options)
+    raise ValueError(f"Unknown {BACKEND_ENV} {spec!r}, expected 'pynvml', 'synthetic[:options]' or 'replay:<path>'")
+
+
+def record_trace(path, duration, interval=1.0):
+    """
+    Record the readings of the current backend's GPUs to a trace for ``ReplayNVML``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON lines trace to write.
+    duration : float
+        Seconds to record for.
+    interval : float, optional
+        Seconds between frames.
+    """
+    from jupyterlab_nvdashboard.apps import gpu
+
+    if not gpu.ready():
+        # Outside of the server, nothing discovers the GPUs in the background
+        gpu.init_devices()
+    header = {
+        "ngpus": gpu.ngpus,
+        "memory_total": gpu.total_memory,
+        "pcie_gen": gpu.pci_gen,
+        "pcie_width": gpu.pci_width,
+        "nvlink_version": gpu.nvlink_ver,
+        "nvlink_speed": [],
+        "nvlink_links": gpu.nvlink_links,
+    }
+    if gpu.nvlink_ver is not None:
+        # Per-link speeds of device 0, in MB/s
+        values = gpu.pynvml.nvmlDeviceGetFieldValues(gpu.gpu_handles[0], list(NVLINK_SPEED_FIELDS))
+        header["nvlink_speed"] = [value.value.ullVal for value in values]
+    end = time.monotonic() + duration
+    with open(path, "w") as f:
+        f.write(json.dumps(header) + "\n")
+        while True:
+            snapshot = gpu.DeviceSnapshot()
+            frame = {
+                "time": snapshot.time,
+                "utilization": snapshot.utilization,
+                "memory_used": snapshot.memory_used,
+                "pci_tx": snapshot.pci_tx,
+                "pci_rx": snapshot.pci_rx,
+                "nvlink_throughput": snapshot.nvlink_throughput if gpu.nvlink_ver is not None else [],
+                "pci_counters": snapshot.pci_counters if gpu.pci_counters else [],
+            }
+            f.write(json.dumps(frame) + "\n")
+            if time.monotonic() + interval > end:
+                break
+            time.sleep(interval)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record a GPU trace for the replay NVML backend.")
+    parser.add_argument("path", help="trace file to write")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to record for")
+    parser.add_argument("--interval", type=float, default=1, help="seconds between frames")
+    args = parser.parse_args()
+    record_trace(args.path, args.duration, args.interval)
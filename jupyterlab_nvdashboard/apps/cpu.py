@@ -1,22 +1,153 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: BSD-3-Clause
 
-import json
+import glob
+import os
 import psutil
 import time
+from jupyterlab_nvdashboard.apps.rates import CounterRates
+from jupyterlab_nvdashboard.apps.sampler import Sampler
 from jupyterlab_nvdashboard.apps.utils import CustomWebSocketHandler
 
+# Block devices that never carry input data
+IGNORED_DISK_PREFIXES = ("loop", "ram", "zram")
 
-class CPUResourceWebSocketHandler(CustomWebSocketHandler):
-    def send_data(self):
+# Network interfaces that never leave the host
+IGNORED_NICS = ("lo",)
+
+
+def collect_cpu_resource():
+    now = time.time()
+    disk = psutil.disk_io_counters()
+    network = psutil.net_io_counters()
+    return {
+        "time": now * 1000,
+        "cpu_utilization": psutil.cpu_percent(),
+        "memory_usage": psutil.virtual_memory().used,
+        "disk_read": disk.read_bytes if disk else 0,
+        "disk_write": disk.write_bytes if disk else 0,
+        "network_read": network.bytes_recv,
+        "network_write": network.bytes_sent,
+    }
+
+
+def parse_cpulist(cpulist):
+    """Return the CPU indices of a Linux cpulist such as ``"0-3,8,10-11"``."""
+    cpus = []
+    for part in filter(None, cpulist.strip().split(",")):
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def format_cpulist(cpus):
+    """Return the Linux cpulist of CPU indices ``cpus``, e.g. ``"0-3,8,10-11"``."""
+    ranges = []
+    for cpu in sorted(set(cpus)):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+
+def numa_nodes(root="/sys/devices/system/node"):
+    """
+    Return the cpulist of each NUMA node, as ``{node: cpulist}``.
+
+    Hosts that do not expose their NUMA topology are reported as a single
+    node holding every CPU.
+    """
+    nodes = {}
+    for path in glob.glob(os.path.join(root, "node[0-9]*", "cpulist")):
+        node = int(os.path.basename(os.path.dirname(path))[len("node") :])
+        with open(path) as f:
+            cpulist = f.read().strip()
+        if cpulist:
+            nodes[node] = cpulist
+    if not nodes:
+        nodes[0] = f"0-{(psutil.cpu_count() or 1) - 1}"
+    return dict(sorted(nodes.items()))
+
+
+def _cpu_times(core):
+    """Return the busy and total time of a core, as ``psutil.cpu_percent`` counts them."""
+    # Guest time is already part of user time on Linux
+    total = sum(core) - getattr(core, "guest", 0) - getattr(core, "guest_nice", 0)
+    return total - core.idle - getattr(core, "iowait", 0), total
+
+
+def _is_disk(name):
+    if name.startswith(IGNORED_DISK_PREFIXES):
+        return False
+    # psutil also lists partitions on Linux, only whole devices are in /sys/block
+    return not os.path.isdir("/sys/block") or os.path.isdir(os.path.join("/sys/block", name.replace("/", "!")))
+
+
+class HostResourceCollector:
+    """
+    Collect the utilization of each CPU core and NUMA node, and the throughput
+    of each disk and network interface.
+
+    psutil is read once per sample, and all counters are turned into rates
+    at once by a shared CounterRates, over the time elapsed since the
+    previous sample. Values are streamed as arrays, in the order of the
+    ``disks`` and ``nics`` names and of the ``numa_cpus`` nodes.
+    """
+
+    def __init__(self):
+        self.rates = CounterRates()
+        self.nodes = numa_nodes()
+        self.node_cpus = [parse_cpulist(cpulist) for cpulist in self.nodes.values()]
+        self.devices = None
+
+    def __call__(self):
         now = time.time()
-        stats = {
+        monotonic = time.monotonic()
+        cores = psutil.cpu_times(percpu=True)
+        disks = {name: io for name, io in (psutil.disk_io_counters(perdisk=True) or {}).items() if _is_disk(name)}
+        nics = {name: io for name, io in psutil.net_io_counters(pernic=True).items() if name not in IGNORED_NICS}
+
+        devices = (len(cores), list(disks), list(nics))
+        if devices != self.devices:
+            # Hot-plugged devices change the layout of the counters
+            self.rates.reset()
+            self.devices = devices
+        # Busy and total CPU time of each core, then disk and network bytes
+        counters = [value for core in cores for value in _cpu_times(core)]
+        counters += [io.read_bytes for io in disks.values()]
+        counters += [io.write_bytes for io in disks.values()]
+        counters += [io.bytes_recv for io in nics.values()]
+        counters += [io.bytes_sent for io in nics.values()]
+        rates = self.rates.update(counters, monotonic)
+
+        ncores, ndisks, nnics = len(cores), len(disks), len(nics)
+        busy, total = rates[0 : 2 * ncores : 2], rates[1 : 2 * ncores : 2]
+        utilization = [100 * b / t if t else 0.0 for b, t in zip(busy, total, strict=True)]
+        offset = 2 * ncores
+        disk_read, disk_write = rates[offset : offset + ndisks], rates[offset + ndisks : offset + 2 * ndisks]
+        offset += 2 * ndisks
+        network_read, network_write = rates[offset : offset + nnics], rates[offset + nnics : offset + 2 * nnics]
+
+        return {
             "time": now * 1000,
-            "cpu_utilization": psutil.cpu_percent(),
-            "memory_usage": psutil.virtual_memory().used,
-            "disk_read": psutil.disk_io_counters().read_bytes,
-            "disk_write": psutil.disk_io_counters().write_bytes,
-            "network_read": psutil.net_io_counters().bytes_recv,
-            "network_write": psutil.net_io_counters().bytes_sent,
+            "cpu_utilization": utilization,
+            "numa_cpus": list(self.nodes.values()),
+            "numa_utilization": [
+                sum(utilization[cpu] for cpu in cpus if cpu < ncores) / max(len(cpus), 1) for cpus in self.node_cpus
+            ],
+            "disks": list(disks),
+            "disk_read": disk_read.tolist(),
+            "disk_write": disk_write.tolist(),
+            "nics": list(nics),
+            "network_read": network_read.tolist(),
+            "network_write": network_write.tolist(),
         }
-        self.write_message(json.dumps(stats))
+
+
+class CPUResourceWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("cpu_resource", collect_cpu_resource)
+
+
+class HostResourceWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("host_resource", HostResourceCollector())
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Self-instrumentation of the dashboard, served by ``nvdashboard/diagnostics``.
+
+Every Sampler times its collections, encodings and fan-out, every websocket
+endpoint counts its clients and the frames and bytes written to them, and
+the event loop is checked for lag. Measurements are a ``perf_counter`` call
+and a few integer updates each, cheap enough to leave on at all times.
+"""
+
+import bisect
+import time
+
+import tornado
+
+# Upper bounds in seconds of the histogram buckets, doubling from 10 µs to
+# about 1.3 s, plus one bucket for anything slower
+BUCKETS = [1e-5 * 2**i for i in range(18)]
+
+# Seconds between event loop lag checks
+LAG_INTERVAL = 0.5
+
+
+class Histogram:
+    """Distribution of durations, in fixed logarithmic buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Return the upper bound of the bucket holding quantile ``q``, in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(BUCKETS, self.counts, strict=False):
+            total += count
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        """Return the count and the mean, p50, p99 and max durations in ms."""
+        return {
+            "count": self.count,
+            "mean_ms": 1000 * self.sum / self.count if self.count else 0.0,
+            "p50_ms": 1000 * self.quantile(0.5),
+            "p99_ms": 1000 * self.quantile(0.99),
+            "max_ms": 1000 * self.max,
+        }
+
+
+class SamplerStats:
+    """Measurements of a Sampler."""
+
+    def __init__(self):
+        # Time spent in the metric source, e.g. NVML or psutil
+        self.collect = Histogram()
+        # Time spent encoding samples for clients, once per sample and encoding
+        self.encode = Histogram()
+        # Time spent handing samples to subscribers, including websocket writes
+        self.publish = Histogram()
+        self.samples = 0
+        self.errors = 0
+        self.timeouts = 0
+        # Ticks skipped because the previous collection was still running
+        self.skipped = 0
+
+    def summary(self):
+        return {
+            "collect": self.collect.summary(),
+            "encode": self.encode.summary(),
+            "publish": self.publish.summary(),
+            "samples": self.samples,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+        }
+
+
+class ConnectionStats:
+    """Measurements of the websocket clients of an endpoint."""
+
+    def __init__(self):
+        self.clients = 0
+        self.frames = 0
+        self.bytes = 0
+        self.dropped_frames = 0
+        # Time from writing a frame until it was flushed to the socket
+        self.flush = Histogram()
+
+    def summary(self):
+        return {
+            "clients": self.clients,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "dropped_frames": self.dropped_frames,
+            "flush": self.flush.summary(),
+        }
+
+
+# Stats of each websocket endpoint, by name
+connections = {}
+
+
+def connection_stats(name):
+    """Return the ConnectionStats of the websocket endpoint ``name``."""
+    if name not in connections:
+        connections[name] = ConnectionStats()
+    return connections[name]
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a callback scheduled every ``interval`` seconds."""
+
+    def __init__(self, interval=LAG_INTERVAL):
+        self.interval = interval
+        self.lag = Histogram()
+        self.latest = 0.0
+        self.io_loop = None
+        self.timeout = None
+        self.expected = None
+
+    def start(self):
+        if self.timeout is None:
+            self.io_loop = tornado.ioloop.IOLoop.current()
+            self._schedule()
+
+    def stop(self):
+        if self.timeout is not None:
+            self.io_loop.remove_timeout(self.timeout)
+            self.timeout = None
+
+    def _schedule(self):
+        self.expected = self.io_loop.time() + self.interval
+        self.timeout = self.io_loop.call_later(self.interval, self.check)
+
+    def check(self):
+        self.latest = max(self.io_loop.time() - self.expected, 0.0)
+        self.lag.observe(self.latest)
+        self._schedule()
+
+
+monitor = LoopLagMonitor()
+
+
+def report():
+    """Return every measurement, as served by the diagnostics endpoint."""
+    from jupyterlab_nvdashboard.apps.sampler import MAX_WORKERS, samplers
+
+    return {
+        "time": time.time() * 1000,
+        "event_loop": {"lag": monitor.lag.summary(), "latest_lag_ms": 1000 * monitor.latest},
+        "executors": {
+            pool: {
+                "max_workers": workers,
+                "in_flight": sum(1 for sampler in samplers.values() if sampler.collecting and sampler.pool == pool),
+            }
+            for pool, workers in MAX_WORKERS.items()
+        },
+        "samplers": {
+            name: {
+                "interval": sampler.interval,
+                "subscribers": len(sampler.subscribers),
+                **sampler.stats.summary(),
+            }
+            for name, sampler in samplers.items()
+        },
+        "connections": {name: stats.summary() for name, stats in connections.items()},
+    }
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+OpenMetrics exposition of the dashboard metrics.
+
+Metrics are rendered from the latest sample of each Sampler, so a scrape never
+reads NVML or psutil itself. The text of each sampler is rendered once per
+sample and cached alongside its websocket encodings, which makes a scrape a
+concatenation of pre-rendered strings.
+"""
+
+import time
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.sampler import samplers
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Cadence in ms at which exported samplers keep sampling once scraped
+SCRAPE_INTERVAL = 1000
+
+# Seconds without a scrape after which exported samplers stop sampling for the
+# exporter, a few scrapes at Prometheus' usual one minute interval
+SCRAPE_IDLE = 180.0
+
+# Metric families exported from each sampler, as (sample key, family name,
+# type, help). List fields hold one value per GPU and get a ``gpu`` label.
+# The ``gpu`` label is the position of the physical GPU in every family.
+FAMILIES = {
+    "gpu_utilization": [
+        ("gpu_utilization", "nvdashboard_gpu_utilization_percent", "gauge", "GPU utilization."),
+    ],
+    "gpu_usage": [
+        ("memory_usage", "nvdashboard_gpu_memory_used_bytes", "gauge", "GPU memory in use."),
+        ("total_memory", "nvdashboard_gpu_memory_total_bytes", "gauge", "Total GPU memory."),
+    ],
+    "pci_stats": [
+        ("pci_tx", "nvdashboard_gpu_pcie_transmit_bytes_per_second", "gauge", "PCIe TX throughput."),
+        ("pci_rx", "nvdashboard_gpu_pcie_receive_bytes_per_second", "gauge", "PCIe RX throughput."),
+    ],
+    "nvlink_throughput": [
+        ("nvlink_tx_total", "nvdashboard_gpu_nvlink_transmit_bytes", "counter", "NVLink data transmitted."),
+        ("nvlink_rx_total", "nvdashboard_gpu_nvlink_receive_bytes", "counter", "NVLink data received."),
+    ],
+    "gpu_health": [
+        ("sm_clock", "nvdashboard_gpu_sm_clock_megahertz", "gauge", "GPU SM clock."),
+        ("memory_clock", "nvdashboard_gpu_memory_clock_megahertz", "gauge", "GPU memory clock."),
+        ("power", "nvdashboard_gpu_power_watts", "gauge", "GPU power draw."),
+        ("power_limit", "nvdashboard_gpu_power_limit_watts", "gauge", "GPU power limit."),
+        ("temperature", "nvdashboard_gpu_temperature_celsius", "gauge", "GPU temperature."),
+        ("fan_speed", "nvdashboard_gpu_fan_speed_percent", "gauge", "GPU fan speed."),
+        ("throttle_reasons", "nvdashboard_gpu_clocks_throttle_reasons", "gauge", "GPU clock throttle reasons bitmask."),
+        ("ecc_sbe_volatile", "nvdashboard_gpu_ecc_single_bit_errors", "counter", "Corrected GPU memory errors."),
+        ("ecc_dbe_volatile", "nvdashboard_gpu_ecc_double_bit_errors", "counter", "Uncorrected GPU memory errors."),
+        ("xid_errors", "nvdashboard_gpu_xid_errors", "counter", "XID errors reported by the GPU."),
+    ],
+    "cpu_resource": [
+        ("cpu_utilization", "nvdashboard_cpu_utilization_percent", "gauge", "CPU utilization."),
+        ("memory_usage", "nvdashboard_memory_used_bytes", "gauge", "Host memory in use."),
+        ("disk_read", "nvdashboard_disk_read_bytes", "counter", "Data read from disks."),
+        ("disk_write", "nvdashboard_disk_written_bytes", "counter", "Data written to disks."),
+        ("network_read", "nvdashboard_network_receive_bytes", "counter", "Data received over the network."),
+        ("network_write", "nvdashboard_network_transmit_bytes", "counter", "Data sent over the network."),
+    ],
+}
+
+
+class Renderer:
+    """
+    Render the samples of one sampler as OpenMetrics text.
+
+    With ``per_device``, list fields hold one value per device, labelled with
+    the ``gpu`` of each device and, for MIG devices, its ``mig_instance``.
+    """
+
+    def __init__(self, families, per_device=False):
+        self.families = families
+        self.per_device = per_device
+
+    def labels(self, count):
+        """Return the labels of each of ``count`` list items."""
+        devices = gpu.devices
+        if self.per_device and len(devices) == count:
+            return [
+                f'gpu="{device.gpu}"' + ("" if device.mig_index is None else f',mig_instance="{device.mig_index}"')
+                for device in devices
+            ]
+        return [f'gpu="{index}"' for index in range(count)]
+
+    def __call__(self, sample):
+        lines = []
+        for key, name, kind, description in self.families:
+            if key not in sample:
+                continue
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {description}")
+            suffix = "_total" if kind == "counter" else ""
+            value = sample[key]
+            if isinstance(value, list):
+                labels = self.labels(len(value))
+                lines += [f"{name}{suffix}{{{label}}} {item}" for label, item in zip(labels, value, strict=True)]
+            else:
+                lines.append(f"{name}{suffix} {value}")
+        return "".join(line + "\n" for line in lines)
+
+
+# Samplers whose list fields hold one value per device of ``gpu.devices``
+# rather than per GPU, as GPUs in MIG mode are split into their MIG devices
+DEVICE_METRICS = {"gpu_utilization", "gpu_usage"}
+
+# One renderer per sampler, reused so Sampler.encode caches its output
+renderers = {name: Renderer(families, name in DEVICE_METRICS) for name, families in FAMILIES.items()}
+
+
+class KeepSampling:
+    """
+    Subscriber keeping an exported sampler running between scrapes.
+
+    It unsubscribes itself once the sampler has not been scraped for
+    ``SCRAPE_IDLE`` seconds, so a single scrape does not keep the GPUs polled
+    for the rest of the server's life.
+    """
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.last_scrape = time.monotonic()
+
+    def __call__(self, sample):
+        if time.monotonic() - self.last_scrape > SCRAPE_IDLE:
+            self.sampler.unsubscribe(self)
+
+
+# Subscriber of each exported sampler, by sampler name
+keepers = {}
+
+
+def render(names):
+    """
+    Return the OpenMetrics exposition of the samplers called ``names``.
+
+    Samplers are started on first use, so metrics only appear from the scrape
+    after their first sample has been collected, and stop ``SCRAPE_IDLE``
+    seconds after the last scrape.
+    """
+    chunks = []
+    for name in names:
+        if name not in renderers:
+            continue
+        sampler = samplers[name]
+        keeper = keepers.get(name)
+        if keeper is None or keeper not in sampler.subscribers:
+            keeper = keepers[name] = KeepSampling(sampler)
+            sampler.subscribe(keeper, SCRAPE_INTERVAL)
+        keeper.last_scrape = time.monotonic()
+        if sampler.latest is not None:
+            chunks.append(sampler.encode(sampler.latest, renderers[name]))
+    chunks.append("# EOF\n")
+    return "".join(chunks)
@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Federation of the metrics of several nvdashboard servers.
+
+When ``NVDASHBOARD_PEERS`` lists the URLs of other Jupyter servers running
+nvdashboard, e.g. ``http://node1:8888/?token=abc,http://node2:8888/``, this
+server subscribes to their ``nvdashboard/stream`` websockets and merges their
+samples with its own into the ``cluster_resource`` metric. The latest samples
+of each node are also served by the ``nvdashboard/cluster`` endpoint.
+
+Each peer has a single connection, shared by every client of this server,
+which is reopened with a growing delay when it drops. Only the latest sample
+of each channel of a peer is kept, and the websocket client reads one frame
+at a time, so a slow peer holds back its own socket rather than buffering
+here. The cluster view is built from whatever each node last sent, so it is
+never held up waiting on a peer.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import socket
+import time
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+import tornado
+from tornado.httpclient import HTTPRequest
+from tornado.log import app_log
+from tornado.websocket import websocket_connect
+
+from jupyterlab_nvdashboard.apps.sampler import Sampler, samplers
+from jupyterlab_nvdashboard.apps.utils import CustomWebSocketHandler
+
+# Environment variables configuring the peers
+PEERS_ENV = "NVDASHBOARD_PEERS"
+PEER_TOKEN_ENV = "NVDASHBOARD_PEER_TOKEN"  # noqa: S105
+
+# Channels merged into the cluster view
+FEDERATED_CHANNELS = ("gpu_resource", "gpu_usage", "cpu_resource")
+
+# Cadence in ms at which the channels of each node are sampled
+NODE_INTERVAL = 1000
+
+# States of a node
+CONNECTING = "connecting"
+CONNECTED = "connected"
+DISCONNECTED = "disconnected"
+# Connected, but no frame arrived for STALE_AFTER seconds
+STALE = "stale"
+
+# Seconds without a frame after which the samples of a node are left out
+STALE_AFTER = 10.0
+
+# Seconds before reconnecting to a peer, doubling after each failed attempt
+# up to RECONNECT_DELAY_MAX
+RECONNECT_DELAY = 1.0
+RECONNECT_DELAY_MAX = 60.0
+
+CONNECT_TIMEOUT = 10.0
+
+# Largest frame accepted from a peer
+MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+
+
+class LocalNode:
+    """Node serving the samples of this server's own samplers."""
+
+    def __init__(self, name, channels=FEDERATED_CHANNELS):
+        self.name = name
+        self.url = None
+        self.channels = channels
+        self.latest = {}
+        self.updated = None
+        self.subscribers = {}
+
+    @property
+    def status(self):
+        return CONNECTED
+
+    def start(self):
+        for name in self.channels:
+            if name in samplers:
+                subscriber = functools.partial(self.store, name)
+                samplers[name].subscribe(subscriber, NODE_INTERVAL)
+                self.subscribers[name] = subscriber
+
+    def stop(self):
+        for name, subscriber in self.subscribers.items():
+            samplers[name].unsubscribe(subscriber)
+        self.subscribers = {}
+
+    def store(self, name, sample):
+        self.latest[name] = sample
+        self.updated = time.monotonic()
+
+
+class PeerNode:
+    """
+    Node serving the samples streamed by another nvdashboard server.
+
+    Parameters
+    ----------
+    name : str
+        Name of the node in the cluster view.
+    url : str
+        Base URL of the peer's Jupyter server, e.g. ``http://node1:8888/``.
+    token : str, optional
+        Jupyter token of the peer.
+    channels : sequence of str, optional
+        Channels to subscribe to.
+    """
+
+    def __init__(self, name, url, token=None, channels=FEDERATED_CHANNELS):
+        self.name = name
+        self.url = url
+        self.token = token
+        self.channels = channels
+        self.latest = {}
+        self.updated = None
+        self.connected = False
+        self.connection = None
+        self.closed = False
+        self.attempts = 0
+
+    @property
+    def status(self):
+        if not self.connected:
+            return CONNECTING if self.attempts <= 1 else DISCONNECTED
+        if self.updated is not None and time.monotonic() - self.updated > STALE_AFTER:
+            return STALE
+        return CONNECTED
+
+    @property
+    def stream_url(self):
+        scheme, netloc, path, _, _ = urlsplit(self.url)
+        scheme = {"http": "ws", "https": "wss"}.get(scheme, scheme)
+        return urlunsplit((scheme, netloc, path.rstrip("/") + "/nvdashboard/stream", "", ""))
+
+    def start(self):
+        tornado.ioloop.IOLoop.current().spawn_callback(self.run)
+
+    def stop(self):
+        self.closed = True
+        if self.connection is not None:
+            self.connection.close()
+
+    async def run(self):
+        """Stream the samples of the peer, reconnecting until stopped."""
+        delay = RECONNECT_DELAY
+        while not self.closed:
+            self.attempts += 1
+            try:
+                await self.stream()
+            except Exception as error:
+                app_log.warning(f"nvdashboard peer {self.name} failed ({error!r}), reconnecting in {delay:.0f}s")
+            if self.connected:
+                # The connection was up, so start over from the shortest delay
+                delay = RECONNECT_DELAY
+            self.connected = False
+            if self.closed:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+    async def stream(self):
+        headers = {"Authorization": f"token {self.token}"} if self.token else {}
+        request = HTTPRequest(self.stream_url, headers=headers, connect_timeout=CONNECT_TIMEOUT)
+        self.connection = await websocket_connect(request, max_message_size=MAX_MESSAGE_BYTES)
+        try:
+            while True:
+                message = await self.connection.read_message()
+                if message is None:
+                    return
+                data = json.loads(message)
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                if data.get("status") == "connected":
+                    channels = [name for name in self.channels if name in data.get("channels", [])]
+                    self.connection.write_message(json.dumps({"channels": dict.fromkeys(channels, NODE_INTERVAL)}))
+                    self.connected = True
+                    self.attempts = 0
+                    continue
+                # Keep only the latest sample of each channel
+                self.latest.update(data.get("channels", {}))
+                self.updated = time.monotonic()
+        finally:
+            self.connection.close()
+            self.connection = None
+
+
+class ClusterCollector:
+    """
+    Merge the latest samples of every node into a cluster-wide sample.
+
+    Per-GPU values of all nodes are concatenated node by node, with
+    ``node_gpus`` GPUs from each node, in the order of ``nodes``. Nodes that
+    are not connected, or whose samples are stale, count zero GPUs.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __call__(self):
+        sample = {
+            "time": time.time() * 1000,
+            "nodes": [node.name for node in self.nodes],
+            "node_status": [],
+            "node_gpus": [],
+            "node_gpu_utilization": [],
+            "node_cpu_utilization": [],
+            "node_memory_usage": [],
+            "gpu_utilization": [],
+            "gpu_memory_used": [],
+            "gpu_memory_total": [],
+        }
+        for node in self.nodes:
+            status = node.status
+            latest = dict(node.latest) if status == CONNECTED else {}
+            resource = latest.get("gpu_resource", {})
+            usage = latest.get("gpu_usage", {})
+            cpu = latest.get("cpu_resource", {})
+            utilization = resource.get("gpu_utilization_individual", [])
+            sample["node_status"].append(status)
+            sample["node_gpus"].append(len(utilization))
+            sample["node_gpu_utilization"].append(resource.get("gpu_utilization_total", 0))
+            sample["node_cpu_utilization"].append(cpu.get("cpu_utilization", 0))
+            sample["node_memory_usage"].append(cpu.get("memory_usage", 0))
+            sample["gpu_utilization"] += utilization
+            # Memory is padded so per-GPU values of all fields line up
+            sample["gpu_memory_used"] += _fit(usage.get("memory_usage", []), len(utilization))
+            sample["gpu_memory_total"] += _fit(usage.get("total_memory", []), len(utilization))
+        ngpus = len(sample["gpu_utilization"])
+        sample["ngpus"] = ngpus
+        sample["gpu_utilization_total"] = sum(sample["gpu_utilization"]) / ngpus if ngpus else 0
+        sample["gpu_memory_used_total"] = sum(sample["gpu_memory_used"])
+        sample["gpu_memory_total_total"] = sum(sample["gpu_memory_total"])
+        return sample
+
+
+def _fit(values, length):
+    return list(values[:length]) + [0] * (length - len(values))
+
+
+class Federation:
+    """This server and its peers, merged into the ``cluster_resource`` metric."""
+
+    def __init__(self, peers, local_name=None):
+        self.local = LocalNode(local_name or socket.gethostname())
+        self.nodes = [self.local, *peers]
+        self.sampler = Sampler("cluster_resource", ClusterCollector(self.nodes))
+
+    def start(self):
+        for node in self.nodes:
+            node.start()
+
+    def stop(self):
+        for node in self.nodes:
+            node.stop()
+
+    def describe(self, node):
+        """Return the status and latest samples of ``node``."""
+        return {
+            "name": node.name,
+            "url": node.url,
+            "status": node.status,
+            "age": None if node.updated is None else time.monotonic() - node.updated,
+            "channels": dict(node.latest),
+        }
+
+
+class ClusterWebSocketHandler(CustomWebSocketHandler):
+    def initialize(self, federation):
+        self.sampler = federation.sampler
+
+
+def parse_peers(spec, token=None):
+    """
+    Return the PeerNodes of a comma-separated list of Jupyter server URLs.
+
+    A ``token`` query argument of a URL is its Jupyter token, otherwise
+    ``token`` is used. Nodes are named after the host and port of their URL.
+    """
+    peers = []
+    for url in filter(None, (part.strip() for part in spec.split(","))):
+        scheme, netloc, path, query, _ = urlsplit(url)
+        if scheme not in ("http", "https") or not netloc:
+            raise ValueError(f"Invalid {PEERS_ENV} URL {url!r}, expected http[s]://host:port/")
+        peer_token = parse_qs(query).get("token", [token])[0]
+        peers.append(PeerNode(netloc, urlunsplit((scheme, netloc, path, "", "")), peer_token))
+    names = [peer.name for peer in peers]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{PEERS_ENV} lists the same server twice")
+    return peers
+
+
+def from_environment():
+    """
+    Return a Federation of the peers named by the environment, or None if
+    federation is disabled. A malformed peer list is logged and disables
+    federation, so the local dashboard still loads.
+    """
+    spec = os.environ.get(PEERS_ENV)
+    if not spec:
+        return None
+    try:
+        peers = parse_peers(spec, os.environ.get(PEER_TOKEN_ENV))
+    except ValueError as error:
+        app_log.error(f"Disabling cluster metrics: {error}")
+        return None
+    return Federation(peers)
@@ -1,174 +1,764 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: BSD-3-Clause
 
-import json
+from jupyterlab_nvdashboard.apps import backends
+from jupyterlab_nvdashboard.apps.rates import CounterRates
+from jupyterlab_nvdashboard.apps.sampler import GPU, Clock, Sampler
 from jupyterlab_nvdashboard.apps.utils import CustomWebSocketHandler
-import pynvml
+from tornado.log import app_log
+import asyncio
+import concurrent.futures
+import contextlib
+import tornado
+import itertools
+import os
+import threading
 import time
 
-try:
-    pynvml.nvmlInit()
-except pynvml.NVMLError_LibraryNotFound:
+# Keys = PCIe-Generation, Values = Max PCIe Lane BW (per direction)
+# [Note: Using specs at https://en.wikipedia.org/wiki/PCI_Express]
+PCI_LANE_BANDWIDTH = {
+    1: (250.0 * 1024 * 1024),
+    2: (500.0 * 1024 * 1024),
+    3: (985.0 * 1024 * 1024),
+    4: (1969.0 * 1024 * 1024),
+    5: (3938.0 * 1024 * 1024),
+    6: (7877.0 * 1024 * 1024),
+}
+
+# NVML data counters are unsigned 64-bit integers
+COUNTER_WRAP = 2**64
+
+# States of GPU discovery
+INITIALIZING = "initializing"
+READY = "ready"
+# NVML is not installed, there are no GPUs to wait for
+UNAVAILABLE = "unavailable"
+# NVML failed, discovery is retried
+FAILED = "failed"
+
+# Seconds before discovery is retried after a failure, doubling after each
+# further failure up to DISCOVERY_RETRY_MAX
+DISCOVERY_RETRY = 5.0
+DISCOVERY_RETRY_MAX = 300.0
+
+# Environment variables listing the devices visible to the user. CUDA's own
+# takes precedence over the one set by the NVIDIA container runtime.
+CUDA_VISIBLE_DEVICES = "CUDA_VISIBLE_DEVICES"
+NVIDIA_VISIBLE_DEVICES = "NVIDIA_VISIBLE_DEVICES"
+
+# Seconds between the GPM samples MIG utilization is computed over
+GPM_MIN_INTERVAL = 0.1
+
+status = INITIALIZING
+_discovery_started = False
+
+# Functions run off the event loop once the GPUs have been discovered, for
+# static properties derived from them, e.g. their topology
+discovery_hooks = []
+
+
+def ready():
+    """Whether the GPUs have been discovered."""
+    return status == READY
+
+
+def _reset_devices():
+    global ngpus, gpu_handles, total_memory, nvlink_ver, nvlink_links, max_bw, max_link_bw
+    global pci_gen, pci_width, pci_counters, devices, device_names
     ngpus = 0
     gpu_handles = []
-else:
-    ngpus = pynvml.nvmlDeviceGetCount()
-    gpu_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(ngpus)]
+    total_memory = []
+    devices = []
+    device_names = []
+    nvlink_ver = None
+    nvlink_links = []
+    max_bw = []
+    max_link_bw = 0
+    pci_gen = None
+    pci_width = None
+    pci_counters = False
+
+
+def init_devices():
+    """
+    Discover the GPUs of the NVML backend and cache their static properties.
+
+    This blocks for as long as NVML takes to answer, which can be seconds on
+    large or faulted systems, so the server runs it in the background with
+    ``discover_devices``. NVML errors other than a missing library are raised
+    after setting ``status`` to ``FAILED``.
+    """
+    global status
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError_LibraryNotFound:
+        _reset_devices()
+        status = UNAVAILABLE
+        return
+    except pynvml.NVMLError:
+        _reset_devices()
+        status = FAILED
+        raise
+    try:
+        _discover()
+    except Exception:
+        _reset_devices()
+        status = FAILED
+        raise
+    status = READY
+
+
+async def discover_devices():
+    """
+    Run ``init_devices`` off the event loop, retrying with a growing delay
+    until NVML answers, e.g. once a faulted GPU has been reset.
+    """
+    delay = DISCOVERY_RETRY
+    while True:
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, init_devices)
+            break
+        except Exception as error:
+            app_log.warning(f"GPU discovery failed ({error!r}), retrying in {delay:.0f}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, DISCOVERY_RETRY_MAX)
+    if not ready():
+        return
+    for hook in discovery_hooks:
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, hook)
+        except Exception:
+            app_log.exception(f"Failed to run {hook.__name__} after GPU discovery")
+
+
+def start_discovery():
+    """Start discovering the GPUs in the background once the event loop runs."""
+    global _discovery_started
+    if not _discovery_started:
+        _discovery_started = True
+        tornado.ioloop.IOLoop.current().spawn_callback(discover_devices)
+
+
+class Device:
+    """
+    A device CUDA programs can run on: a whole GPU, or a MIG device of one.
+
+    ``gpu`` is the position of its GPU in ``gpu_handles``. A MIG device has
+    its own ``handle``, ``uuid`` and memory, and belongs to a GPU instance
+    whose utilization is only reported by GPU performance monitoring (GPM).
+    """
+
+    def __init__(self, index, handle, uuid, total_memory=None, vgpu=False):
+        # NVML index of its GPU
+        self.index = index
+        self.gpu = index
+        self.handle = handle
+        self.uuid = uuid
+        self.total_memory = total_memory
+        # Whether the GPU is a virtual GPU passed to this VM
+        self.vgpu = vgpu
+        self.mig_index = None
+        self.gpu_instance = None
+        self.compute_instance = None
+        self.profile = None
+        self.gpm = False
+
+    @property
+    def name(self):
+        name = f"GPU {self.gpu}"
+        if self.mig_index is not None:
+            name += f" MIG {self.mig_index}" + (f" ({self.profile})" if self.profile else "")
+        if self.vgpu:
+            name += " vGPU"
+        return name
+
+
+def visible_devices(environ=None):
+    """
+    Return the IDs of the devices visible to the user, or None if all are.
+
+    IDs are read from ``CUDA_VISIBLE_DEVICES`` if set, and are indices or
+    GPU or MIG UUIDs as accepted by CUDA. Indices are NVML's, which are also
+    CUDA's with ``CUDA_DEVICE_ORDER=PCI_BUS_ID``. Otherwise the UUIDs of
+    ``NVIDIA_VISIBLE_DEVICES`` are used: in a container, NVML only sees the
+    GPUs the runtime exposed, so ``all`` and indices need no filtering.
+    """
+    environ = os.environ if environ is None else environ
+    if CUDA_VISIBLE_DEVICES in environ:
+        return [device_id.strip() for device_id in environ[CUDA_VISIBLE_DEVICES].split(",")]
+    ids = [device_id.strip() for device_id in environ.get(NVIDIA_VISIBLE_DEVICES, "").split(",")]
+    return [device_id for device_id in ids if device_id.startswith(("GPU-", "MIG-"))] or None
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _uuid(handle):
+    try:
+        return _decode(pynvml.nvmlDeviceGetUUID(handle))
+    except pynvml.NVMLError:
+        return None
+
+
+def _is_vgpu(handle):
+    try:
+        return pynvml.nvmlDeviceGetVirtualizationMode(handle) == pynvml.NVML_GPU_VIRTUALIZATION_MODE_VGPU
+    except pynvml.NVMLError:
+        return False
+
+
+def _gpm_supported(handle):
+    try:
+        return bool(pynvml.nvmlGpmQueryDeviceSupport(handle).isSupportedDevice)
+    except (AttributeError, pynvml.NVMLError):
+        return False
+
+
+def _mig_devices(index, handle):
+    """Return the MIG devices of GPU ``handle``, or None if it is not in MIG mode."""
+    try:
+        mig_mode, _ = pynvml.nvmlDeviceGetMigMode(handle)
+    except pynvml.NVMLError:
+        return None
+    if mig_mode != pynvml.NVML_DEVICE_MIG_ENABLE:
+        return None
+    gpm = _gpm_supported(handle)
+    devices = []
+    for mig_index in range(pynvml.nvmlDeviceGetMaxMigDeviceCount(handle)):
+        try:
+            mig = pynvml.nvmlDeviceGetMigDeviceHandleByIndex(handle, mig_index)
+        except pynvml.NVMLError_NotFound:
+            # No MIG device was created in this slot
+            continue
+        device = Device(index, mig, _uuid(mig), pynvml.nvmlDeviceGetMemoryInfo(mig).total)
+        device.mig_index = mig_index
+        device.gpu_instance = pynvml.nvmlDeviceGetGpuInstanceId(mig)
+        device.compute_instance = pynvml.nvmlDeviceGetComputeInstanceId(mig)
+        # MIG devices are named after their GPU and profile, e.g. "... MIG 3g.40gb"
+        device.profile = _decode(pynvml.nvmlDeviceGetName(mig)).partition(" MIG ")[2] or None
+        device.gpm = gpm
+        devices.append(device)
+    return devices
+
+
+def _match_device(device_id, gpu_devices, uuids):
+    """Return the NVML index of the GPU ``device_id`` refers to and its devices it selects, or None."""
+    if device_id.isdigit():
+        index = int(device_id)
+        return (index, gpu_devices[index]) if index < len(gpu_devices) else None
+    for index, devices in enumerate(gpu_devices):
+        # CUDA accepts any unique prefix of a UUID
+        if device_id.startswith("GPU-") and uuids[index] and uuids[index].startswith(device_id):
+            return index, devices
+        for device in devices:
+            if device.mig_index is None:
+                continue
+            # MIG devices are also named by GPU UUID and instance IDs by older drivers
+            legacy = f"MIG-{uuids[index]}/{device.gpu_instance}/{device.compute_instance}"
+            prefix = device_id.startswith("MIG-") and device.uuid and device.uuid.startswith(device_id)
+            if prefix or device_id == legacy:
+                return index, [device]
+    return None
+
+
+def _select_devices(gpu_devices, uuids):
+    """Return the visible devices of each GPU as ``{NVML index: devices}``, in CUDA's order."""
+    ids = visible_devices()
+    if ids is None:
+        return dict(enumerate(gpu_devices))
+    selected = {}
+    for device_id in ids:
+        match = _match_device(device_id, gpu_devices, uuids)
+        if match is None:
+            # CUDA ignores the IDs following an invalid one
+            break
+        index, devices = match
+        visible = selected.setdefault(index, [])
+        visible += [device for device in devices if device not in visible]
+    return selected
+
+
+def _discover_devices():
+    """
+    Discover the GPUs and the devices visible to the user on them.
+
+    GPUs in MIG mode contribute their MIG devices, other GPUs themselves.
+    Returns the handles of the GPUs in MIG mode.
+    """
+    global ngpus, gpu_handles, total_memory, devices, device_names
+    handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+    uuids = [_uuid(handle) for handle in handles]
+    migs = [_mig_devices(index, handle) for index, handle in enumerate(handles)]
+    gpu_devices = [
+        [Device(index, handle, uuids[index], vgpu=_is_vgpu(handle))] if mig is None else mig
+        for index, (handle, mig) in enumerate(zip(handles, migs, strict=True))
+    ]
+    selected = _select_devices(gpu_devices, uuids)
+    handles_of_selected = [handles[index] for index in selected]
+    # Total memory never changes, so query it once rather than on every tick
+    memory = [pynvml.nvmlDeviceGetMemoryInfo(handle).total for handle in handles_of_selected]
+    visible = []
+    for position, index in enumerate(selected):
+        for device in selected[index]:
+            device.gpu = position
+            if device.mig_index is None:
+                device.total_memory = memory[position]
+            visible.append(device)
+    ngpus = len(handles_of_selected)
+    gpu_handles = handles_of_selected
+    total_memory = memory
+    devices = visible
+    device_names = [device.name for device in visible]
+    return [handle for handle, mig in zip(handles, migs, strict=True) if mig is not None]
+
+
+def _watch_mig(handles):
+    """Register for the events of MIG devices being created or destroyed on GPUs ``handles``."""
+    global _mig_events
+    if _mig_events is not None:
+        with contextlib.suppress(pynvml.NVMLError):
+            pynvml.nvmlEventSetFree(_mig_events)
+        _mig_events = None
+    if not handles:
+        return
+    events = None
+    try:
+        events = pynvml.nvmlEventSetCreate()
+        for handle in handles:
+            pynvml.nvmlDeviceRegisterEvents(handle, pynvml.nvmlEventMigConfigChange, events)
+    except (AttributeError, pynvml.NVMLError) as error:
+        app_log.warning(f"MIG reconfigurations cannot be watched ({error!r}), restart to see new MIG devices")
+        if events is not None:
+            with contextlib.suppress(pynvml.NVMLError):
+                pynvml.nvmlEventSetFree(events)
+        return
+    _mig_events = events
+
+
+def _mig_reconfigured():
+    """Whether MIG devices were created or destroyed since the last call."""
+    if _mig_events is None:
+        return False
+    reconfigured = False
+    while True:
+        try:
+            pynvml.nvmlEventSetWait(_mig_events, 0)
+        except pynvml.NVMLError:
+            # Timeout once no event is pending
+            return reconfigured
+        reconfigured = True
+
+
+def _discover():
+    global nvlink_ver, nvlink_links, max_bw, max_link_bw
+    global pci_gen, pci_width, pci_counters
+    _watch_mig(_discover_devices())
     try:
         nvlink_ver = pynvml.nvmlDeviceGetNvLinkVersion(gpu_handles[0], 0)
         links = [
-            getattr(pynvml, f"NVML_FI_DEV_NVLINK_SPEED_MBPS_L{i}", "")
+            (i, getattr(pynvml, f"NVML_FI_DEV_NVLINK_SPEED_MBPS_L{i}"))
             for i in range(pynvml.NVML_NVLINK_MAX_LINKS)
             if hasattr(pynvml, f"NVML_FI_DEV_NVLINK_SPEED_MBPS_L{i}")
         ]
 
-        bandwidth = [pynvml.nvmlDeviceGetFieldValues(handle, links) for handle in gpu_handles]
+        bandwidth = [
+            [value.value.ullVal for value in pynvml.nvmlDeviceGetFieldValues(handle, [field for _, field in links])]
+            for handle in gpu_handles
+        ]
+        # Only links that are up on some device are read on every tick
+        nvlink_links = [link for index, (link, _) in enumerate(links) if any(bw[index] for bw in bandwidth)]
 
         # Maximum bandwidth is bidirectional, divide by 2 for separate RX & TX
-        max_bw = max(sum(i.value.ullVal for i in bw) * 1024**2 for bw in bandwidth) / 2
-    except (IndexError, pynvml.NVMLError_NotSupported):
+        max_bw = max(sum(bw) * 1024**2 for bw in bandwidth) / 2
+        max_link_bw = max(max(bw) * 1024**2 for bw in bandwidth) / 2
+    except (IndexError, ValueError, pynvml.NVMLError_NotSupported):
         nvlink_ver = None
+        nvlink_links = []
         max_bw = []
+        max_link_bw = 0
     try:
         pci_gen = pynvml.nvmlDeviceGetMaxPcieLinkGeneration(gpu_handles[0])
+        # Use device-0 to get "upper bound"
+        pci_width = pynvml.nvmlDeviceGetMaxPcieLinkWidth(gpu_handles[0])
     except (IndexError, pynvml.NVMLError_NotSupported):
         pci_gen = None
+        pci_width = None
+    try:
+        # Cumulative PCIe byte counters are only available on recent GPUs and drivers
+        values = pynvml.nvmlDeviceGetFieldValues(gpu_handles[0], _pci_counter_fields())
+        pci_counters = all(value.nvmlReturn == pynvml.NVML_SUCCESS for value in values)
+    except (AttributeError, IndexError, pynvml.NVMLError):
+        pci_counters = False
 
 
-class GPUUtilizationWebSocketHandler(CustomWebSocketHandler):
-    def send_data(self):
-        gpu_utilization = [pynvml.nvmlDeviceGetUtilizationRates(gpu_handles[i]).gpu for i in range(ngpus)]
-        self.write_message(json.dumps({"gpu_utilization": gpu_utilization}))
+def _pci_counter_fields():
+    return [pynvml.NVML_FI_DEV_PCIE_COUNT_TX_BYTES, pynvml.NVML_FI_DEV_PCIE_COUNT_RX_BYTES]
 
 
-class GPUUsageWebSocketHandler(CustomWebSocketHandler):
-    def send_data(self):
-        memory_usage = [pynvml.nvmlDeviceGetMemoryInfo(handle).used for handle in gpu_handles]
+# The real pynvml unless NVDASHBOARD_NVML_BACKEND selects a synthetic backend.
+# GPUs are discovered later, see start_discovery.
+pynvml = backends.load_backend()
+_reset_devices()
 
-        total_memory = [pynvml.nvmlDeviceGetMemoryInfo(handle).total for handle in gpu_handles]
+# Snapshots younger than this many seconds are shared between callers outside
+# the ticks of the GPU samplers, e.g. HTTP handlers
+SNAPSHOT_MAX_AGE = 0.05
 
-        self.write_message(json.dumps({"memory_usage": memory_usage, "total_memory": total_memory}))
+_snapshot = None
+_snapshot_lock = threading.Lock()
 
+# Number of the current tick of the GPU samplers, and seconds until the next
+# one. The first snapshot taken on a tick is shared until the next tick.
+_tick = 0
+_tick_lifetime = 0.0
 
-class GPUResourceWebSocketHandler(CustomWebSocketHandler):
-    def send_data(self):
-        now = time.time()
-        stats = {
-            "time": now * 1000,
-            "gpu_utilization_total": 0,
-            "gpu_memory_total": 0,
-            "rx_total": 0,
-            "tx_total": 0,
-            "gpu_memory_individual": [],
-            "gpu_utilization_individual": [],
-        }
-        memory_list = [pynvml.nvmlDeviceGetMemoryInfo(handle).total / (1024 * 1024) for handle in gpu_handles]
-        gpu_mem_sum = sum(memory_list)
+# Event set signalling MIG reconfigurations, and whether the MIG devices
+# still have to be rediscovered after one
+_mig_events = None
+_mig_stale = False
 
-        for i in range(ngpus):
-            gpu = pynvml.nvmlDeviceGetUtilizationRates(gpu_handles[i]).gpu
-            mem = pynvml.nvmlDeviceGetMemoryInfo(gpu_handles[i]).used
-            stats["gpu_utilization_total"] += gpu
-            stats["gpu_memory_total"] += mem / (1024 * 1024)
 
-            if pci_gen is not None:
-                tx = pynvml.nvmlDeviceGetPcieThroughput(gpu_handles[i], pynvml.NVML_PCIE_UTIL_TX_BYTES) * 1024
-                rx = pynvml.nvmlDeviceGetPcieThroughput(gpu_handles[i], pynvml.NVML_PCIE_UTIL_RX_BYTES) * 1024
-                stats["rx_total"] += rx
-                stats["tx_total"] += tx
-            stats["gpu_utilization_individual"].append(gpu)
-            stats["gpu_memory_individual"].append(mem)
+class DeviceSnapshot:
+    """
+    Point-in-time readings of every GPU, shared by all GPU metrics.
 
-        stats["gpu_utilization_total"] /= ngpus
-        stats["gpu_memory_total"] = round((stats["gpu_memory_total"] / gpu_mem_sum) * 100, 2)
-        self.write_message(json.dumps(stats))
+    Each group of fields is read for all devices the first time it is accessed
+    and reused afterwards, so a snapshot costs at most one NVML call per
+    device and field group, however many handlers read from it. NVLink
+    counters for every active link are fetched in one batched
+    ``nvmlDeviceGetFieldValues`` call per device, as are PCIe byte counters.
+    Static values such as total memory, active NVLink links and maximum
+    PCIe/NVLink bandwidth are cached at import.
+    """
 
+    def __init__(self, tick=None):
+        self.time = time.time()
+        self.monotonic = time.monotonic()
+        self.tick = tick
+        # Field name -> Future of its readings
+        self._fields = {}
+        self._lock = threading.Lock()
 
-class NVLinkThroughputWebSocketHandler(CustomWebSocketHandler):
-    prev_throughput = None
-
-    def send_data(self):
-        throughput = [
-            pynvml.nvmlDeviceGetFieldValues(
-                handle,
-                [
-                    (pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_RX, scope_id)
-                    for scope_id in range(pynvml.NVML_NVLINK_MAX_LINKS)
-                ]
-                + [
-                    (pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_TX, scope_id)
-                    for scope_id in range(pynvml.NVML_NVLINK_MAX_LINKS)
-                ],
-            )
-            for handle in gpu_handles
-        ]
+    def _get(self, name, fetch):
+        # NVML is read outside the lock, so a hung device only holds up the
+        # readers of the same field, which wait for the first reader's result
+        with self._lock:
+            future = self._fields.get(name)
+            fetching = future is None
+            if fetching:
+                future = self._fields[name] = concurrent.futures.Future()
+        if fetching:
+            try:
+                future.set_result(fetch())
+            except BaseException as error:
+                future.set_exception(error)
+        return future.result()
 
-        # Check if previous throughput is available
-        if self.prev_throughput is not None:
-            # Calculate the change since the last request
-            throughput_change = [
-                [
-                    throughput[i][j].value.ullVal - self.prev_throughput[i][j].value.ullVal
-                    for j in range(len(throughput[i]))
-                ]
-                for i in range(len(throughput))
-            ]
-        else:
-            # If no previous throughput is available, set change to zero
-            throughput_change = [[0] * len(throughput[i]) for i in range(len(throughput))]
-
-        # Store the current throughput for the next request
-        self.prev_throughput = throughput
-
-        # Send the change in throughput as part of the response
-        self.write_message(
-            json.dumps(
-                {
-                    "nvlink_rx": [
-                        sum(throughput_change[i][: pynvml.NVML_NVLINK_MAX_LINKS]) * 1024
-                        for i in range(len(throughput_change))
-                    ],
-                    "nvlink_tx": [
-                        sum(throughput_change[i][pynvml.NVML_NVLINK_MAX_LINKS :]) * 1024
-                        for i in range(len(throughput_change))
-                    ],
-                    "max_rxtx_bw": max_bw,
-                }
-            )
+    @property
+    def utilization(self):
+        """GPU utilization of each device, in percent."""
+        return self._get(
+            "utilization",
+            lambda: [pynvml.nvmlDeviceGetUtilizationRates(handle).gpu for handle in gpu_handles],
         )
 
+    @property
+    def memory_used(self):
+        """Used memory of each device, in bytes."""
+        return self._get(
+            "memory_used",
+            lambda: [pynvml.nvmlDeviceGetMemoryInfo(handle).used for handle in gpu_handles],
+        )
 
-class PCIStatsWebSocketHandler(CustomWebSocketHandler):
-    def send_data(self):
-        # Use device-0 to get "upper bound"
-        pci_width = pynvml.nvmlDeviceGetMaxPcieLinkWidth(gpu_handles[0])
-        pci_bw = {
-            # Keys = PCIe-Generation, Values = Max PCIe Lane BW (per direction)
-            # [Note: Using specs at https://en.wikipedia.org/wiki/PCI_Express]
-            1: (250.0 * 1024 * 1024),
-            2: (500.0 * 1024 * 1024),
-            3: (985.0 * 1024 * 1024),
-            4: (1969.0 * 1024 * 1024),
-            5: (3938.0 * 1024 * 1024),
-            6: (7877.0 * 1024 * 1024),
-        }
-        # Max PCIe Throughput = BW-per-lane * Width
-        max_rxtx_tp = pci_width * pci_bw[pci_gen]
+    @property
+    def device_utilization(self):
+        """GPU utilization of each device of ``devices``, in percent, see ``MigUtilization``."""
+        utilization = self.utilization
+        return self._get("device_utilization", lambda: mig_utilization(utilization))
 
-        pci_tx = [
-            pynvml.nvmlDeviceGetPcieThroughput(gpu_handles[i], pynvml.NVML_PCIE_UTIL_TX_BYTES) * 1024
-            for i in range(ngpus)
-        ]
+    @property
+    def device_memory_used(self):
+        """Used memory of each device of ``devices``, in bytes."""
+        if all(device.mig_index is None for device in devices):
+            memory_used = self.memory_used
+            return [memory_used[device.gpu] for device in devices]
+        return self._get(
+            "device_memory_used",
+            lambda: [pynvml.nvmlDeviceGetMemoryInfo(device.handle).used for device in devices],
+        )
+
+    @property
+    def pci_tx(self):
+        """PCIe TX throughput of each device, in B/s."""
+        return self._get(
+            "pci_tx",
+            lambda: [
+                pynvml.nvmlDeviceGetPcieThroughput(handle, pynvml.NVML_PCIE_UTIL_TX_BYTES) * 1024
+                for handle in gpu_handles
+            ],
+        )
+
+    @property
+    def pci_rx(self):
+        """PCIe RX throughput of each device, in B/s."""
+        return self._get(
+            "pci_rx",
+            lambda: [
+                pynvml.nvmlDeviceGetPcieThroughput(handle, pynvml.NVML_PCIE_UTIL_RX_BYTES) * 1024
+                for handle in gpu_handles
+            ],
+        )
+
+    @property
+    def pci_counters(self):
+        """Cumulative PCIe TX and RX bytes of each device, as ``[tx, rx]``."""
+        return self._get(
+            "pci_counters",
+            lambda: [
+                [value.value.ullVal for value in pynvml.nvmlDeviceGetFieldValues(handle, _pci_counter_fields())]
+                for handle in gpu_handles
+            ],
+        )
+
+    @property
+    def nvlink_throughput(self):
+        """Raw NVLink data counters of each device in KiB, RX for every active link followed by TX."""
+        return self._get("nvlink_throughput", self._fetch_nvlink_throughput)
 
-        pci_rx = [
-            pynvml.nvmlDeviceGetPcieThroughput(gpu_handles[i], pynvml.NVML_PCIE_UTIL_RX_BYTES) * 1024
-            for i in range(ngpus)
+    @staticmethod
+    def _fetch_nvlink_throughput():
+        fields = [(pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_RX, link) for link in nvlink_links] + [
+            (pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_TX, link) for link in nvlink_links
         ]
+        return [
+            [value.value.ullVal for value in pynvml.nvmlDeviceGetFieldValues(handle, fields)] for handle in gpu_handles
+        ]
+
+
+class MigUtilization:
+    """
+    Utilization of each device, with MIG devices measured on their own.
+
+    NVML only reports the utilization of a GPU instance through GPM samples,
+    on Hopper and later GPUs. Each call samples every GPU instance at most
+    every ``GPM_MIN_INTERVAL`` seconds and reports its SM utilization since
+    the previous sample. Whole GPUs, MIG devices without GPM and those not
+    sampled twice yet report the utilization of their GPU.
+    """
+
+    def __init__(self):
+        # Latest GPM sample, its time and the utilization up to it, by (GPU, GPU instance)
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, utilization):
+        with self.lock:
+            samples = {}
+            result = []
+            for device in devices:
+                if device.mig_index is None or not device.gpm:
+                    result.append(utilization[device.gpu])
+                    continue
+                key = (device.index, device.gpu_instance)
+                if key not in samples:
+                    samples[key] = self._sample(key, device)
+                value = samples[key][2]
+                result.append(utilization[device.gpu] if value is None else value)
+            # Free the samples of GPU instances that no longer exist
+            for key, (sample, _, _) in self.samples.items():
+                if key not in samples:
+                    with contextlib.suppress(pynvml.NVMLError):
+                        pynvml.nvmlGpmSampleFree(sample)
+            self.samples = samples
+            return result
+
+    def _sample(self, key, device):
+        previous = self.samples.get(key)
+        now = time.monotonic()
+        if previous is not None and now - previous[1] < GPM_MIN_INTERVAL:
+            return previous
+        try:
+            sample = pynvml.nvmlGpmSampleAlloc()
+            pynvml.nvmlGpmMigSampleGet(gpu_handles[device.gpu], device.gpu_instance, sample)
+        except pynvml.NVMLError:
+            return previous or (None, now, None)
+        value = None
+        if previous is not None and previous[0] is not None:
+            value = self._sm_utilization(previous[0], sample)
+            with contextlib.suppress(pynvml.NVMLError):
+                pynvml.nvmlGpmSampleFree(previous[0])
+        return sample, now, value
+
+    @staticmethod
+    def _sm_utilization(previous, sample):
+        metrics = pynvml.c_nvmlGpmMetricsGet_t()
+        metrics.version = pynvml.NVML_GPM_METRICS_GET_VERSION
+        metrics.numMetrics = 1
+        metrics.sample1 = previous
+        metrics.sample2 = sample
+        metrics.metrics[0].metricId = pynvml.NVML_GPM_METRIC_SM_UTIL
+        try:
+            pynvml.nvmlGpmMetricsGet(metrics)
+        except pynvml.NVMLError:
+            return None
+        if metrics.metrics[0].nvmlReturn != pynvml.NVML_SUCCESS:
+            return None
+        return round(metrics.metrics[0].value, 1)
+
+
+mig_utilization = MigUtilization()
+
+
+def start_tick(interval):
+    """Share the next snapshot between the GPU samplers of a tick, until the next one ``interval`` ms later."""
+    global _tick, _tick_lifetime
+    _tick += 1
+    _tick_lifetime = interval / 1000
+
+
+# Ticks all GPU samplers together, so each tick reads the devices only once
+clock = Clock(on_tick=start_tick)
+
+
+def get_snapshot(max_age=None):
+    """
+    Return the DeviceSnapshot of the current tick of the GPU samplers.
 
-        stats = {
-            "pci_tx": pci_tx,
-            "pci_rx": pci_rx,
-            "max_rxtx_tp": max_rxtx_tp,
+    Outside of ticks, snapshots are shared for ``SNAPSHOT_MAX_AGE`` seconds.
+    With ``max_age``, return a snapshot taken at most that many seconds ago
+    instead. The MIG devices are rediscovered first if they were reconfigured.
+    """
+    global _snapshot, _mig_stale
+    with _snapshot_lock:
+        if _snapshot is None:
+            fresh = False
+        elif max_age is not None:
+            fresh = time.monotonic() - _snapshot.monotonic <= max_age
+        else:
+            lifetime = max(SNAPSHOT_MAX_AGE, _tick_lifetime)
+            fresh = _snapshot.tick == _tick and time.monotonic() - _snapshot.monotonic <= lifetime
+        if not fresh:
+            if _mig_reconfigured() or _mig_stale:
+                # Retried on the next snapshot if NVML fails mid-reconfiguration
+                _mig_stale = True
+                _discover_devices()
+                _mig_stale = False
+            _snapshot = DeviceSnapshot(tick=_tick)
+        return _snapshot
+
+
+def collect_gpu_utilization():
+    return {"gpu_utilization": get_snapshot().device_utilization, "device_names": device_names}
+
+
+def collect_gpu_usage():
+    return {
+        "memory_usage": get_snapshot().device_memory_used,
+        "total_memory": [device.total_memory for device in devices],
+        "device_names": device_names,
+    }
+
+
+def collect_gpu_resource():
+    snapshot = get_snapshot()
+    utilization = snapshot.device_utilization
+    memory_used = snapshot.device_memory_used
+    memory_total = sum(device.total_memory for device in devices)
+    stats = {
+        "time": snapshot.time * 1000,
+        "gpu_utilization_total": sum(utilization) / len(utilization) if utilization else 0,
+        "gpu_memory_total": round(sum(memory_used) / memory_total * 100, 2) if memory_total else 0,
+        "rx_total": 0,
+        "tx_total": 0,
+        "gpu_memory_individual": memory_used,
+        "gpu_utilization_individual": utilization,
+    }
+    if pci_gen is not None:
+        stats["rx_total"] = sum(snapshot.pci_rx)
+        stats["tx_total"] = sum(snapshot.pci_tx)
+    return stats
+
+
+class NVLinkThroughputCollector:
+    """
+    Collect the NVLink throughput of every GPU and active link, in B/s.
+
+    Rates are computed from the data counters of all links of all GPUs at
+    once, over the time elapsed since the previous sample.
+    """
+
+    def __init__(self):
+        self.rates = CounterRates(wrap=COUNTER_WRAP)
+
+    def __call__(self):
+        snapshot = get_snapshot()
+        throughput = snapshot.nvlink_throughput
+        nlinks = len(nvlink_links)
+        # Counters are in KiB
+        rates = [rate * 1024 for rate in self.rates.update(itertools.chain(*throughput), snapshot.monotonic)]
+        # Each device reports RX for every link followed by TX
+        offsets = [2 * nlinks * device for device in range(len(throughput))]
+        rx_links = [rates[offset : offset + nlinks] for offset in offsets]
+        tx_links = [rates[offset + nlinks : offset + 2 * nlinks] for offset in offsets]
+
+        return {
+            "nvlink_rx": [sum(device) for device in rx_links],
+            "nvlink_tx": [sum(device) for device in tx_links],
+            # Rates of each active link, GPU-major, to spot single saturated links
+            "nvlink_links": nvlink_links,
+            "nvlink_rx_links": list(itertools.chain(*rx_links)),
+            "nvlink_tx_links": list(itertools.chain(*tx_links)),
+            # Cumulative counters, for consumers computing their own rates
+            "nvlink_rx_total": [sum(device[:nlinks]) * 1024 for device in throughput],
+            "nvlink_tx_total": [sum(device[nlinks:]) * 1024 for device in throughput],
+            "max_rxtx_bw": max_bw,
+            "max_link_bw": max_link_bw,
         }
 
-        self.write_message(json.dumps(stats))
+
+class PCIStatsCollector:
+    """
+    Collect the PCIe throughput of every GPU, in B/s.
+
+    GPUs with cumulative PCIe byte counters report the average throughput
+    since the previous sample. Others fall back to NVML's throughput
+    estimate, which only covers the last 20ms.
+    """
+
+    def __init__(self):
+        self.rates = CounterRates(wrap=COUNTER_WRAP)
+
+    def __call__(self):
+        snapshot = get_snapshot()
+        if pci_counters:
+            rates = self.rates.update(itertools.chain(*snapshot.pci_counters), snapshot.monotonic)
+            pci_tx, pci_rx = rates[0::2].tolist(), rates[1::2].tolist()
+        else:
+            pci_tx, pci_rx = snapshot.pci_tx, snapshot.pci_rx
+        stats = {"pci_tx": pci_tx, "pci_rx": pci_rx, "max_rxtx_tp": 0}
+        if pci_gen is not None:
+            # Max PCIe Throughput = BW-per-lane * Width
+            stats["max_rxtx_tp"] = pci_width * PCI_LANE_BANDWIDTH[pci_gen]
+        return stats
+
+
+class GPUUtilizationWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("gpu_utilization", collect_gpu_utilization, ready=ready, pool=GPU, clock=clock)
+
+
+class GPUUsageWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("gpu_usage", collect_gpu_usage, ready=ready, pool=GPU, clock=clock)
+
+
+class GPUResourceWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("gpu_resource", collect_gpu_resource, ready=ready, pool=GPU, clock=clock)
+
+
+class NVLinkThroughputWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("nvlink_throughput", NVLinkThroughputCollector(), ready=ready, pool=GPU, clock=clock)
+
+
+class PCIStatsWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler("pci_stats", PCIStatsCollector(), ready=ready, pool=GPU, clock=clock)
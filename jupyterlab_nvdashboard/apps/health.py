@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+GPU health and throttling telemetry, streamed as the ``gpu_health`` metric.
+
+Each sample holds, for every GPU, its SM and memory clocks, power draw and
+limit, temperatures, fan speed, ECC error counts, XID errors and the bitmask
+of reasons its clocks are held back, alongside its utilization so drops can
+be matched to throttling.
+
+Readings available as NVML field values are fetched in one batched
+``nvmlDeviceGetFieldValues`` call per device and tier. Limits, maximum
+clocks and ECC counters rarely change, so they are only read every
+``SLOW_INTERVAL`` seconds. Readings a system does not support on any GPU,
+e.g. fan speed on passively cooled GPUs, are left out of the samples.
+"""
+
+import contextlib
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.sampler import GPU, Sampler
+from jupyterlab_nvdashboard.apps.utils import CustomWebSocketHandler
+
+# Cadence in ms the health metric is never sampled faster than
+HEALTH_INTERVAL = 500
+
+# Seconds between readings of the rarely changing fields
+SLOW_INTERVAL = 10.0
+
+# Most XID events handled per sample, the rest are handled by the next ones
+MAX_XID_EVENTS = 100
+
+# Bits of the clock throttle reasons bitmask
+THROTTLE_REASONS = {
+    "gpu_idle": 0x1,
+    "applications_clocks": 0x2,
+    "sw_power_cap": 0x4,
+    "hw_slowdown": 0x8,
+    "sync_boost": 0x10,
+    "sw_thermal_slowdown": 0x20,
+    "hw_thermal_slowdown": 0x40,
+    "hw_power_brake_slowdown": 0x80,
+    "display_clocks": 0x100,
+}
+
+# Reasons that hold back a busy GPU, as opposed to idling or clock settings
+PERFORMANCE_THROTTLE = (
+    THROTTLE_REASONS["sw_power_cap"]
+    | THROTTLE_REASONS["hw_slowdown"]
+    | THROTTLE_REASONS["sw_thermal_slowdown"]
+    | THROTTLE_REASONS["hw_thermal_slowdown"]
+    | THROTTLE_REASONS["hw_power_brake_slowdown"]
+)
+
+# Readings fetched as field values, as (sample key, NVML field ID name, scale)
+FIELDS = [
+    ("power", "NVML_FI_DEV_POWER_INSTANT", 1e-3),
+    ("memory_temperature", "NVML_FI_DEV_MEMORY_TEMP", 1),
+]
+SLOW_FIELDS = [
+    ("power_limit", "NVML_FI_DEV_POWER_CURRENT_LIMIT", 1e-3),
+    ("ecc_sbe_volatile", "NVML_FI_DEV_ECC_SBE_VOL_TOTAL", 1),
+    ("ecc_dbe_volatile", "NVML_FI_DEV_ECC_DBE_VOL_TOTAL", 1),
+    ("ecc_sbe_aggregate", "NVML_FI_DEV_ECC_SBE_AGG_TOTAL", 1),
+    ("ecc_dbe_aggregate", "NVML_FI_DEV_ECC_DBE_AGG_TOTAL", 1),
+    ("retired_pages_pending", "NVML_FI_DEV_RETIRED_PENDING", 1),
+    ("remapped_rows_pending", "NVML_FI_DEV_REMAPPED_PENDING", 1),
+]
+
+# Readings without a field ID, as (sample key, function of the NVML backend
+# and a device handle). Readings also fetched as fields are only read this
+# way on systems where the field is not supported.
+READINGS = [
+    ("sm_clock", lambda nvml, handle: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_SM)),
+    ("memory_clock", lambda nvml, handle: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_MEM)),
+    ("temperature", lambda nvml, handle: nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)),
+    ("fan_speed", lambda nvml, handle: nvml.nvmlDeviceGetFanSpeed(handle)),
+    ("throttle_reasons", lambda nvml, handle: nvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle)),
+    ("power", lambda nvml, handle: nvml.nvmlDeviceGetPowerUsage(handle) / 1000),
+]
+SLOW_READINGS = [
+    ("max_sm_clock", lambda nvml, handle: nvml.nvmlDeviceGetMaxClockInfo(handle, nvml.NVML_CLOCK_SM)),
+    ("max_memory_clock", lambda nvml, handle: nvml.nvmlDeviceGetMaxClockInfo(handle, nvml.NVML_CLOCK_MEM)),
+    (
+        "slowdown_temperature",
+        lambda nvml, handle: nvml.nvmlDeviceGetTemperatureThreshold(handle, nvml.NVML_TEMPERATURE_THRESHOLD_SLOWDOWN),
+    ),
+    ("power_limit", lambda nvml, handle: nvml.nvmlDeviceGetEnforcedPowerLimit(handle) / 1000),
+]
+
+
+def _field_value(value):
+    """Return the value of an NVML field value, or None if it could not be read."""
+    nvml = gpu.pynvml
+    if value.nvmlReturn != nvml.NVML_SUCCESS:
+        return None
+    if value.valueType == nvml.NVML_VALUE_TYPE_DOUBLE:
+        return value.value.dVal
+    if value.valueType == nvml.NVML_VALUE_TYPE_UNSIGNED_INT:
+        return value.value.uiVal
+    if value.valueType == nvml.NVML_VALUE_TYPE_SIGNED_LONG_LONG:
+        return value.value.sllVal
+    return value.value.ullVal
+
+
+class XidEvents:
+    """
+    Count the XID errors of each GPU.
+
+    XID errors are NVML events, so an event set is registered for every GPU
+    and drained without blocking on each sample.
+    """
+
+    def __init__(self):
+        self.event_set = None
+        self.supported = None
+        self.counts = []
+        self.last = []
+
+    def start(self):
+        nvml = gpu.pynvml
+        self.stop()
+        self.counts = [0] * gpu.ngpus
+        self.last = [0] * gpu.ngpus
+        try:
+            self.event_set = nvml.nvmlEventSetCreate()
+        except (AttributeError, nvml.NVMLError):
+            self.supported = False
+            return
+        registered = 0
+        for handle in gpu.gpu_handles:
+            try:
+                nvml.nvmlDeviceRegisterEvents(handle, nvml.nvmlEventTypeXidCriticalError, self.event_set)
+                registered += 1
+            except nvml.NVMLError:
+                pass
+        self.supported = registered > 0
+        if not self.supported:
+            self.stop()
+
+    def stop(self):
+        """Free the event set, if any."""
+        if self.event_set is not None:
+            with contextlib.suppress(gpu.pynvml.NVMLError):
+                gpu.pynvml.nvmlEventSetFree(self.event_set)
+            self.event_set = None
+
+    def poll(self):
+        """Return the XID error count and latest XID of each GPU, or {} if XID events are not supported."""
+        if self.supported is None or len(self.counts) != gpu.ngpus:
+            self.start()
+        if not self.supported:
+            return {}
+        nvml = gpu.pynvml
+        for _ in range(MAX_XID_EVENTS):
+            try:
+                event = nvml.nvmlEventSetWait(self.event_set, 0)
+            except nvml.NVMLError:
+                # Timeout once no event is pending
+                break
+            try:
+                index = nvml.nvmlDeviceGetIndex(event.device)
+            except nvml.NVMLError:
+                continue
+            if 0 <= index < len(self.counts):
+                self.counts[index] += 1
+                self.last[index] = event.eventData
+        return {"xid_errors": list(self.counts), "last_xid": list(self.last)}
+
+
+class HealthCollector:
+    """
+    Collect the health and throttling telemetry of every GPU.
+
+    The first reading of each tier probes which readings the system supports,
+    those failing on every GPU are left out from then on. Later failures on a
+    GPU read as 0.
+    """
+
+    def __init__(self, slow_interval=SLOW_INTERVAL):
+        self.slow_interval = slow_interval
+        self.slow = None
+        self.slow_updated = None
+        # Readings not supported by any GPU, as ("field" or "reading", key)
+        self.unsupported = set()
+        self.probed = set()
+        self.xid = XidEvents()
+
+    def __call__(self):
+        snapshot = gpu.get_snapshot()
+        if self.slow is None or snapshot.monotonic - self.slow_updated >= self.slow_interval:
+            self.slow = self.read("slow", SLOW_FIELDS, SLOW_READINGS)
+            self.slow_updated = snapshot.monotonic
+        sample = {
+            "time": snapshot.time * 1000,
+            "gpu_utilization": snapshot.utilization,
+            **self.read("fast", FIELDS, READINGS),
+            **self.slow,
+        }
+        if "throttle_reasons" in sample:
+            sample["throttled"] = [int(bool(reasons & PERFORMANCE_THROTTLE)) for reasons in sample["throttle_reasons"]]
+        sample.update(self.xid.poll())
+        return sample
+
+    def read(self, tier, fields, readings):
+        """Return the supported readings of ``fields`` and ``readings`` for every GPU."""
+        nvml = gpu.pynvml
+        probing = tier not in self.probed
+        self.probed.add(tier)
+        fields = [
+            (key, getattr(nvml, name), scale)
+            for key, name, scale in fields
+            if hasattr(nvml, name) and ("field", key) not in self.unsupported
+        ]
+        columns = {key: [] for key, _, _ in fields}
+        if fields:
+            ids = [field_id for _, field_id, _ in fields]
+            for handle in gpu.gpu_handles:
+                try:
+                    values = [_field_value(value) for value in nvml.nvmlDeviceGetFieldValues(handle, ids)]
+                except nvml.NVMLError:
+                    values = [None] * len(fields)
+                for (key, _, scale), value in zip(fields, values, strict=True):
+                    columns[key].append(None if value is None else value * scale)
+        values = self._supported("field", columns, probing)
+        columns = {}
+        for key, read in readings:
+            # Readings fetched as fields are only read one by one as a fallback
+            if key in values or ("reading", key) in self.unsupported:
+                continue
+            columns[key] = []
+            for handle in gpu.gpu_handles:
+                try:
+                    columns[key].append(read(nvml, handle))
+                except (AttributeError, nvml.NVMLError):
+                    columns[key].append(None)
+        values.update(self._supported("reading", columns, probing))
+        return values
+
+    def _supported(self, source, columns, probing):
+        supported = {}
+        for key, column in columns.items():
+            if probing and column and all(value is None for value in column):
+                self.unsupported.add((source, key))
+            else:
+                supported[key] = [0 if value is None else value for value in column]
+        return supported
+
+
+class GPUHealthWebSocketHandler(CustomWebSocketHandler):
+    sampler = Sampler(
+        "gpu_health", HealthCollector(), min_interval=HEALTH_INTERVAL, ready=gpu.ready, pool=GPU, clock=gpu.clock
+    )
@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from array import array
+
+# Number of samples kept per metric, e.g. one hour at the default 1s cadence
+HISTORY_LENGTH = 3600
+
+# Rollup tiers as (bucket width in ms, number of buckets kept): 10s buckets for
+# 3 hours, 1min buckets for 12 hours and 10min buckets for 7 days
+ROLLUP_TIERS = [
+    (10_000, 1080),
+    (60_000, 720),
+    (600_000, 1008),
+]
+
+
+def flatten(sample, schema):
+    """Return the values of ``sample`` laid out as ``schema`` in a flat ``array("d")``."""
+    values = array("d")
+    for key, width in schema:
+        if width is None:
+            values.append(sample[key])
+        else:
+            values.extend(sample[key])
+    return values
+
+
+def unflatten(values, schema):
+    """Return the sample dict laid out as ``schema`` from flat ``values``."""
+    sample = {}
+    offset = 0
+    for key, width in schema:
+        if width is None:
+            sample[key] = values[offset]
+            offset += 1
+        else:
+            sample[key] = values[offset : offset + width].tolist()
+            offset += width
+    return sample
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring buffer of the samples of one metric.
+
+    Samples are stored as preallocated ``array("d")`` columns, one per numeric
+    field and one slot per GPU for list fields, so memory use is fixed at
+    ``8 * capacity`` bytes per value and does not grow with uptime. The
+    column layout is inferred from the first sample and the buffer is reset
+    whenever it changes, e.g. when the number of GPUs changes.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of samples kept before the oldest is overwritten.
+    """
+
+    def __init__(self, capacity=HISTORY_LENGTH):
+        self.capacity = capacity
+        self.schema = None
+        self.times = array("d", bytes(8 * capacity))
+        self.columns = {}
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        """Memory used by the buffer, in bytes."""
+        return sum(column.itemsize * len(column) for column in [self.times, *self.columns.values()])
+
+    @staticmethod
+    def layout(sample):
+        """
+        Return the column layout of ``sample`` as a list of ``(key, width)``.
+
+        Width is None for scalar fields and the list length for list fields.
+        Non-numeric fields and the ``time`` field are not part of the layout.
+        """
+        schema = []
+        for key, value in sample.items():
+            if key == "time" or isinstance(value, str):
+                continue
+            if isinstance(value, (int, float)):
+                schema.append((key, None))
+            elif isinstance(value, list) and all(isinstance(item, (int, float)) for item in value):
+                schema.append((key, len(value)))
+        return schema
+
+    def _reset(self, schema):
+        self.schema = schema
+        self.columns = {key: array("d", bytes(8 * self.capacity * (width or 1))) for key, width in schema}
+        self.start = 0
+        self.count = 0
+
+    def append(self, sample, timestamp):
+        """Store ``sample`` taken at ``timestamp`` (ms since the epoch)."""
+        schema = self.layout(sample)
+        if schema != self.schema:
+            self._reset(schema)
+        index = (self.start + self.count) % self.capacity
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count += 1
+        self.times[index] = timestamp
+        for key, width in schema:
+            column = self.columns[key]
+            if width is None:
+                column[index] = sample[key]
+            else:
+                column[index * width : (index + 1) * width] = array("d", sample[key])
+
+    def _time(self, position):
+        return self.times[(self.start + position) % self.capacity]
+
+    def _bisect(self, timestamp, right=False):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            t = self._time(mid)
+            if t < timestamp or (right and t == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _sample(self, position):
+        index = (self.start + position) % self.capacity
+        sample = {"time": self.times[index]}
+        for key, width in self.schema:
+            column = self.columns[key]
+            if width is None:
+                sample[key] = column[index]
+            else:
+                sample[key] = column[index * width : (index + 1) * width].tolist()
+        return sample
+
+    def oldest(self):
+        """Time of the oldest stored sample, or None if empty."""
+        return self._time(0) if self.count else None
+
+    def range_count(self, start=None, end=None):
+        """Number of stored samples between ``start`` and ``end``."""
+        lo = 0 if start is None else self._bisect(start)
+        hi = self.count if end is None else self._bisect(end, right=True)
+        return hi - lo
+
+    def samples(self, start=None, end=None, limit=None):
+        """
+        Return stored samples, oldest first, as a list of dicts.
+
+        Parameters
+        ----------
+        start, end : float, optional
+            Inclusive time range in ms since the epoch.
+        limit : int, optional
+            Return only the most recent ``limit`` samples of the range.
+        """
+        lo = 0 if start is None else self._bisect(start)
+        hi = self.count if end is None else self._bisect(end, right=True)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return [self._sample(position) for position in range(lo, hi)]
+
+
+class Rollup:
+    """
+    Incrementally maintained min/mean/max of a metric over fixed time buckets.
+
+    Samples are folded into the open bucket as they arrive, and the bucket is
+    stored once a sample falls into the next one, so queries never recompute
+    aggregates from raw samples.
+
+    Parameters
+    ----------
+    resolution : int
+        Bucket width in ms.
+    capacity : int
+        Number of buckets kept before the oldest is overwritten.
+    """
+
+    def __init__(self, resolution, capacity):
+        self.resolution = resolution
+        self.min = RingBuffer(capacity)
+        self.mean = RingBuffer(capacity)
+        self.max = RingBuffer(capacity)
+        self.schema = None
+        self.bucket = None
+        self.count = 0
+        self.mins = self.maxs = self.sums = None
+
+    @property
+    def nbytes(self):
+        return self.min.nbytes + self.mean.nbytes + self.max.nbytes
+
+    def add(self, values, schema, timestamp):
+        """Fold flat ``values`` laid out as ``schema`` at ``timestamp`` into the rollup."""
+        bucket = timestamp - timestamp % self.resolution
+        if schema != self.schema or bucket != self.bucket:
+            self.flush()
+            self.schema = schema
+            self.bucket = bucket
+        if self.count == 0:
+            self.mins = array("d", values)
+            self.maxs = array("d", values)
+            self.sums = array("d", values)
+        else:
+            self.mins = array("d", map(min, self.mins, values))
+            self.maxs = array("d", map(max, self.maxs, values))
+            self.sums = array("d", map(float.__add__, self.sums, values))
+        self.count += 1
+
+    def flush(self):
+        """Store the open bucket, if any."""
+        if not self.count:
+            return
+        means = array("d", (total / self.count for total in self.sums))
+        self.min.append(unflatten(self.mins, self.schema), self.bucket)
+        self.mean.append(unflatten(means, self.schema), self.bucket)
+        self.max.append(unflatten(self.maxs, self.schema), self.bucket)
+        self.count = 0
+
+    def samples(self, start=None, end=None):
+        """
+        Return the stored buckets as sample dicts holding the mean of each field,
+        with the minimum and maximum under the ``min`` and ``max`` keys.
+        """
+        samples = self.mean.samples(start, end)
+        for sample, low, high in zip(samples, self.min.samples(start, end), self.max.samples(start, end), strict=True):
+            del low["time"], high["time"]
+            sample["min"] = low
+            sample["max"] = high
+        return samples
+
+
+class History(RingBuffer):
+    """
+    Recent raw samples of one metric plus rollups over longer time ranges.
+
+    Raw samples are kept in the ring buffer itself and every sample is also
+    folded into one Rollup per entry of ``ROLLUP_TIERS``, so both memory and
+    the cost of each append are bounded.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of raw samples kept.
+    tiers : list of (int, int), optional
+        Bucket width in ms and capacity of each rollup, finest first.
+    """
+
+    def __init__(self, capacity=HISTORY_LENGTH, tiers=ROLLUP_TIERS):
+        super().__init__(capacity)
+        self.rollups = [Rollup(resolution, size) for resolution, size in tiers]
+
+    @property
+    def nbytes(self):
+        return super().nbytes + sum(rollup.nbytes for rollup in self.rollups)
+
+    def append(self, sample, timestamp):
+        super().append(sample, timestamp)
+        values = flatten(sample, self.schema)
+        for rollup in self.rollups:
+            rollup.add(values, self.schema, timestamp)
+
+    def query(self, start=None, end=None, points=None):
+        """
+        Return the samples between ``start`` and ``end`` at the finest resolution
+        that covers the range in at most ``points`` samples.
+
+        Returns a dict with the bucket width in ms under ``resolution`` (0 for
+        raw samples) and the samples under ``samples``. If no resolution fits
+        the budget, the coarsest one is used.
+        """
+        tiers = [(0, self, self.samples)]
+        tiers += [(rollup.resolution, rollup.mean, rollup.samples) for rollup in self.rollups]
+
+        def fits(buffer):
+            oldest = buffer.oldest()
+            covers = start is None or (oldest is not None and oldest <= start)
+            return covers and (points is None or buffer.range_count(start, end) <= points)
+
+        resolution, _, samples = next((tier for tier in tiers if fits(tier[1])), tiers[-1])
+        return {"resolution": resolution, "samples": samples(start, end)}
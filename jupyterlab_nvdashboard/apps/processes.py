@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import time
+
+import psutil
+from tornado.log import app_log
+
+from jupyterlab_nvdashboard.apps import gpu, wire
+from jupyterlab_nvdashboard.apps.sampler import GPU, Sampler
+from jupyterlab_nvdashboard.apps.utils import CustomWebSocketHandler
+
+# Listing processes costs one NVML call per device plus a process table walk
+# for new PIDs, so it is never sampled faster than this (ms)
+PROCESS_INTERVAL = 5000
+
+
+def kernel_pid(kernel):
+    """Return the PID of a local kernel managed by ``kernel``, or None."""
+    provisioner = getattr(kernel, "provisioner", None)
+    pid = getattr(provisioner, "pid", None)
+    if pid is None:
+        # jupyter_client < 7 exposes the Popen object directly
+        pid = getattr(getattr(kernel, "kernel", None), "pid", None)
+    return pid
+
+
+class ProcessSampler(Sampler):
+    """
+    Sampler of the processes running on each GPU, attributed to Jupyter kernels.
+
+    Before each collection, the PIDs of the server's kernels and the sessions
+    they belong to are refreshed on the event loop. The collection itself runs
+    on the GPU pool of the sampler executors: it lists the processes of each GPU with their
+    memory and utilization, and attributes each one to the kernel among its
+    ancestors. Ancestors, names and owners of processes are cached until the
+    process leaves the GPU, so steady-state cost is a few NVML calls per
+    device however many processes there are.
+    """
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, self.collect_processes, **kwargs)
+        self.kernel_manager = None
+        self.session_manager = None
+        # Kernel PID -> kernel and session of that kernel
+        self.kernels = {}
+        # PID -> (name, user, PIDs of the process and its ancestors)
+        self.process_info = {}
+        # Timestamp of the newest utilization sample seen on each device
+        self.last_seen = {}
+
+    def configure(self, kernel_manager, session_manager=None):
+        """Attribute processes to the kernels of ``kernel_manager``."""
+        self.kernel_manager = kernel_manager
+        self.session_manager = session_manager
+
+    async def refresh_kernels(self):
+        if self.kernel_manager is None:
+            return
+        sessions = {}
+        if self.session_manager is not None:
+            for session in await self.session_manager.list_sessions():
+                if session.get("kernel"):
+                    sessions[session["kernel"]["id"]] = session
+        kernels = {}
+        for kernel_id in self.kernel_manager.list_kernel_ids():
+            kernel = self.kernel_manager.get_kernel(kernel_id)
+            pid = kernel_pid(kernel)
+            if pid is None:
+                continue
+            session = sessions.get(kernel_id, {})
+            kernels[pid] = {
+                "kernel_id": kernel_id,
+                "kernel_name": getattr(kernel, "kernel_name", None),
+                "session_id": session.get("id"),
+                "path": session.get("path"),
+            }
+        self.kernels = kernels
+
+    async def _collect(self):
+        try:
+            await self.refresh_kernels()
+        except Exception:
+            app_log.exception("Failed to list Jupyter kernels")
+        await super()._collect()
+
+    def _process_info(self, pid):
+        if pid not in self.process_info:
+            try:
+                process = psutil.Process(pid)
+                with process.oneshot():
+                    name, user = process.name(), process.username()
+                ancestors = [pid] + [parent.pid for parent in process.parents()]
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # Processes of other containers or users may not be visible
+                name, user, ancestors = None, None, [pid]
+            self.process_info[pid] = (name, user, ancestors)
+        return self.process_info[pid]
+
+    def _utilization(self, index, handle):
+        """Return the SM and memory utilization of each process on a device since the last call."""
+        pynvml = gpu.pynvml
+        try:
+            samples = pynvml.nvmlDeviceGetProcessUtilization(handle, self.last_seen.get(index, 0))
+        except (pynvml.NVMLError_NotFound, pynvml.NVMLError_NotSupported):
+            # No samples since the last call, or no per-process accounting
+            return {}
+        if samples:
+            self.last_seen[index] = max(sample.timeStamp for sample in samples)
+        return {sample.pid: (sample.smUtil, sample.memUtil) for sample in samples}
+
+    def _running_processes(self, handle):
+        pynvml = gpu.pynvml
+        processes = {}
+        for query in (pynvml.nvmlDeviceGetComputeRunningProcesses, pynvml.nvmlDeviceGetGraphicsRunningProcesses):
+            try:
+                for process in query(handle):
+                    processes.setdefault(process.pid, process)
+            except pynvml.NVMLError_NotSupported:
+                pass
+        return processes.values()
+
+    def collect_processes(self):
+        kernels = self.kernels
+        processes = []
+        # Index processes by visible device, as the other GPU metrics, querying
+        # MIG devices on their own handle
+        for index, device in enumerate(gpu.devices):
+            utilization = self._utilization(index, device.handle)
+            for process in self._running_processes(device.handle):
+                name, user, ancestors = self._process_info(process.pid)
+                owner = next((kernels[pid] for pid in ancestors if pid in kernels), {})
+                sm_utilization, memory_utilization = utilization.get(process.pid, (0, 0))
+                processes.append(
+                    {
+                        "gpu": index,
+                        "pid": process.pid,
+                        "name": name,
+                        "user": user,
+                        # None when the driver cannot attribute memory, e.g. under MIG
+                        "memory_used": process.usedGpuMemory,
+                        "sm_utilization": sm_utilization,
+                        "memory_utilization": memory_utilization,
+                        "kernel_id": owner.get("kernel_id"),
+                        "kernel_name": owner.get("kernel_name"),
+                        "session_id": owner.get("session_id"),
+                        "path": owner.get("path"),
+                    }
+                )
+        # Forget processes that left every GPU, so reused PIDs are looked up again
+        running = {process["pid"] for process in processes}
+        self.process_info = {pid: info for pid, info in self.process_info.items() if pid in running}
+        return {"time": time.time() * 1000, "processes": processes}
+
+
+class GPUProcessesWebSocketHandler(CustomWebSocketHandler):
+    # Process lists are not numeric, so they cannot be packed in binary frames
+    wire_formats = (wire.JSON,)
+    sampler = ProcessSampler(
+        "gpu_processes",
+        history_interval=None,
+        min_interval=PROCESS_INTERVAL,
+        ready=gpu.ready,
+        pool=GPU,
+        clock=gpu.clock,
+    )
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import operator
+from array import array
+
+
+class CounterRates:
+    """
+    Per-second rates of a vector of cumulative counters.
+
+    Keeps the previous reading and its monotonic timestamp, so rates are
+    normalized by the time actually elapsed between readings rather than by
+    the interval a client happens to poll at. An instance is owned by a
+    sampler's collector and so shared by all of its clients: only the first
+    reading after the server starts has no rate.
+
+    Parameters
+    ----------
+    wrap : int, optional
+        Modulus of the counters, e.g. ``2**64``. A counter going backwards
+        from the upper half of its range wrapped around, and its rate counts
+        the distance to ``wrap``. Any other counter going backwards was reset,
+        e.g. by a GPU reset, and has a rate of zero for that reading.
+    """
+
+    def __init__(self, wrap=None):
+        self.wrap = wrap
+        self.previous = None
+        self.timestamp = None
+
+    def reset(self):
+        """Forget the previous reading."""
+        self.previous = None
+        self.timestamp = None
+
+    def update(self, counters, timestamp):
+        """
+        Return the rate of each of ``counters`` read at ``timestamp`` (monotonic
+        seconds) since the previous reading, as an ``array("d")``.
+
+        Rates are zero for the first reading and whenever the number of
+        counters changes.
+        """
+        counters = list(counters)
+        previous, last = self.previous, self.timestamp
+        self.previous, self.timestamp = counters, timestamp
+        if previous is None or len(previous) != len(counters) or timestamp <= last:
+            return array("d", bytes(8 * len(counters)))
+        # Integer deltas stay exact however large the counters grow
+        deltas = list(map(operator.sub, counters, previous))
+        if deltas and min(deltas) < 0:
+            deltas = list(map(self._unwrap, deltas, previous))
+        return array("d", map((1.0 / (timestamp - last)).__mul__, deltas))
+
+    def _unwrap(self, delta, previous):
+        if delta >= 0:
+            return delta
+        if self.wrap and previous >= self.wrap // 2:
+            return delta + self.wrap
+        return 0
@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Recording of metric samples to disk.
+
+When ``NVDASHBOARD_RECORD_DIR`` is set, every sample of the recorded metrics
+is appended to rotating segment files under ``<dir>/<metric>/``, so history
+survives server restarts. Each segment holds samples of a single layout:
+
+- an 8 byte magic string, ``b"NVDREC01"``
+- the length of a JSON header as a little-endian uint32, then the header,
+  ``{"metric": ..., "fields": [[key, width], ...]}``, padded to 8 bytes
+- fixed-width rows of little-endian float64s laid out as ``fields``, the
+  first of which is the sample time in ms since the epoch
+
+Segments are named after the time of their first row. Fixed-width rows let a
+time range be located by bisecting a memory-mapped segment, so reads never
+load whole files. Samples are buffered on the event loop and written in
+batches on a dedicated thread, which also enforces the size and age limits.
+"""
+
+import functools
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import tornado
+from tornado.log import app_log
+
+from jupyterlab_nvdashboard.apps import wire
+from jupyterlab_nvdashboard.apps.history import unflatten
+from jupyterlab_nvdashboard.apps.sampler import samplers
+
+# Environment variables configuring the recorder
+RECORD_DIR_ENV = "NVDASHBOARD_RECORD_DIR"
+RECORD_MAX_MB_ENV = "NVDASHBOARD_RECORD_MAX_MB"
+RECORD_RETENTION_ENV = "NVDASHBOARD_RECORD_RETENTION_HOURS"
+
+MAGIC = b"NVDREC01"
+SEGMENT_SUFFIX = ".seg"
+
+# Cadence in ms at which recorded metrics are sampled
+RECORD_INTERVAL = 1000
+
+# Cadence in ms at which buffered samples are written to disk
+FLUSH_INTERVAL = 5000
+
+# Size at which a segment is closed and a new one started
+SEGMENT_BYTES = 16 * 1024 * 1024
+
+# Most samples returned by a single read
+READ_LIMIT = 10_000
+
+
+def _header(metric, fields):
+    header = json.dumps({"metric": metric, "fields": fields}).encode()
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 8)
+    return MAGIC + struct.pack("<I", len(header)) + header
+
+
+class Segment:
+    """Read-only, memory-mapped view of a segment file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        if self.map[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a recording segment")
+        (length,) = struct.unpack_from("<I", self.map, len(MAGIC))
+        self.offset = len(MAGIC) + 4 + length
+        header = json.loads(self.map[len(MAGIC) + 4 : self.offset])
+        self.fields = [tuple(field) for field in header["fields"]]
+        self.row_width = sum(width or 1 for _, width in self.fields)
+        self.row_bytes = 8 * self.row_width
+        # Ignore a partially written last row, e.g. after a crash
+        self.count = (self.size - self.offset) // self.row_bytes
+
+    def close(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def time(self, row):
+        return struct.unpack_from("<d", self.map, self.offset + row * self.row_bytes)[0]
+
+    def bisect(self, timestamp, right=False):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            t = self.time(mid)
+            if t < timestamp or (right and t == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def samples(self, lo, hi):
+        values = array("d", self.map[self.offset + lo * self.row_bytes : self.offset + hi * self.row_bytes])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return [
+            unflatten(values[row * self.row_width : (row + 1) * self.row_width], self.fields) for row in range(hi - lo)
+        ]
+
+
+class Recorder:
+    """
+    Append the samples of metrics to rotating segment files.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding one subdirectory of segments per metric.
+    max_bytes : int, optional
+        Disk budget of all segments, the oldest are deleted beyond it.
+    retention : float, optional
+        Seconds after which segments are deleted.
+    segment_bytes : int, optional
+        Size at which a segment is closed and a new one started.
+    """
+
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024, retention=7 * 24 * 3600, segment_bytes=SEGMENT_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.retention = retention
+        self.segment_bytes = segment_bytes
+        # Samples buffered on the event loop, as metric -> [(fields, row)]
+        self.pending = {}
+        # Open segment of each metric, as metric -> (fields, path, file)
+        self.segments = {}
+        self.subscribers = {}
+        self.callback = None
+        # A single writer keeps the rows of each metric in order
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nvdashboard-recorder")
+
+    def start(self, metrics):
+        """Start recording the samplers called ``metrics``."""
+        for name in metrics:
+            subscriber = functools.partial(self.record, name)
+            samplers[name].subscribe(subscriber, RECORD_INTERVAL)
+            self.subscribers[name] = subscriber
+        self.callback = tornado.ioloop.PeriodicCallback(self.flush, FLUSH_INTERVAL)
+        self.callback.start()
+
+    def stop(self):
+        """Stop recording and write the buffered samples."""
+        for name, subscriber in self.subscribers.items():
+            samplers[name].unsubscribe(subscriber)
+        self.subscribers = {}
+        if self.callback is not None:
+            self.callback.stop()
+            self.callback = None
+        self.flush().result()
+        self.executor.submit(self.close).result()
+
+    def record(self, name, sample):
+        if "time" in sample:
+            # Reuse the binary frame the sampler packed for its websocket clients
+            fields, row = samplers[name].encode(sample, wire.encode_binary)
+        else:
+            # Samples of current values, e.g. GPU utilization, are stamped
+            # with the time they were recorded, right after their collection
+            fields, row = wire.encode_binary({"time": time.time() * 1000, **sample})
+        if fields[0][0] == "time" and len(fields) > 1:
+            self.pending.setdefault(name, []).append((fields, row))
+
+    def flush(self):
+        """Hand the buffered samples to the writer thread."""
+        batch, self.pending = self.pending, {}
+        return self.executor.submit(self.write, batch)
+
+    def write(self, batch):
+        try:
+            for name, rows in batch.items():
+                for fields, row in rows:
+                    self._segment(name, fields, row).write(row)
+            for _, _, file in self.segments.values():
+                file.flush()
+            self.enforce_limits()
+        except Exception:
+            app_log.exception("Failed to write nvdashboard recording")
+
+    def _segment(self, name, fields, row):
+        segment = self.segments.get(name)
+        if segment is not None:
+            current_fields, path, file = segment
+            if current_fields == fields and file.tell() < self.segment_bytes:
+                return file
+            file.close()
+        directory = os.path.join(self.directory, name)
+        os.makedirs(directory, exist_ok=True)
+        # Name the segment after its first sample, so its rows are never older
+        (start,) = struct.unpack_from("<d", row)
+        start = int(start)
+        while os.path.exists(os.path.join(directory, f"{start}{SEGMENT_SUFFIX}")):
+            start += 1
+        path = os.path.join(directory, f"{start}{SEGMENT_SUFFIX}")
+        file = open(path, "xb")  # noqa: SIM115
+        file.write(_header(name, fields))
+        self.segments[name] = (fields, path, file)
+        return file
+
+    def close(self):
+        for _, _, file in self.segments.values():
+            file.close()
+        self.segments = {}
+
+    def segment_paths(self, name):
+        """Return the segment files of metric ``name``, oldest first."""
+        directory = os.path.join(self.directory, name)
+        if not os.path.isdir(directory):
+            return []
+        names = [entry for entry in os.listdir(directory) if entry.endswith(SEGMENT_SUFFIX)]
+        names.sort(key=lambda entry: int(entry[: -len(SEGMENT_SUFFIX)]))
+        return [os.path.join(directory, entry) for entry in names]
+
+    def enforce_limits(self):
+        """Delete closed segments older than the retention period or beyond the disk budget."""
+        open_paths = {path for _, path, _ in self.segments.values()}
+        cutoff = (time.time() - self.retention) * 1000
+        segments = []
+        for name in os.listdir(self.directory):
+            paths = self.segment_paths(name)
+            for path, next_path in zip(paths, [*paths[1:], None], strict=True):
+                # A segment ends where the next one of the same metric starts
+                end = float("inf") if next_path is None else int(os.path.basename(next_path)[: -len(SEGMENT_SUFFIX)])
+                segments.append((end, path))
+        total = sum(os.path.getsize(path) for _, path in segments)
+        for end, path in sorted(segments):
+            if path in open_paths or (end >= cutoff and total <= self.max_bytes):
+                continue
+            total -= os.path.getsize(path)
+            os.remove(path)
+
+    def read(self, name, start=None, end=None, limit=READ_LIMIT):
+        """
+        Return the recorded samples of metric ``name`` between ``start`` and
+        ``end`` (ms since the epoch), oldest first, at most the ``limit`` most
+        recent of them.
+        """
+        samples = []
+        paths = self.segment_paths(name)
+        starts = [int(os.path.basename(path)[: -len(SEGMENT_SUFFIX)]) for path in paths]
+        # Walk segments newest first so the limit keeps the most recent samples
+        for index in reversed(range(len(paths))):
+            if end is not None and starts[index] > end:
+                continue
+            if start is not None and index + 1 < len(paths) and starts[index + 1] <= start:
+                break
+            try:
+                segment = Segment(paths[index])
+            except (ValueError, struct.error):
+                # Segment whose header is still being written
+                continue
+            with segment:
+                lo = 0 if start is None else segment.bisect(start)
+                hi = segment.count if end is None else segment.bisect(end, right=True)
+                lo = max(lo, hi - (limit - len(samples)))
+                samples = segment.samples(lo, hi) + samples
+            if len(samples) >= limit:
+                break
+        return samples
+
+
+def from_environment():
+    """Return a Recorder configured by environment variables, or None if recording is disabled."""
+    directory = os.environ.get(RECORD_DIR_ENV)
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return Recorder(
+        directory,
+        max_bytes=int(float(os.environ.get(RECORD_MAX_MB_ENV, 1024)) * 1024 * 1024),
+        retention=float(os.environ.get(RECORD_RETENTION_ENV, 7 * 24)) * 3600,
+    )
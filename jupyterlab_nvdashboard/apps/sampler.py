@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tornado
+from tornado.log import app_log
+
+from jupyterlab_nvdashboard.apps.diagnostics import SamplerStats
+from jupyterlab_nvdashboard.apps.history import History
+
+# Registry of every sampler in this server process, keyed by metric name
+samplers = {}
+
+# Blocking NVML and psutil calls run on these pools instead of the event loop.
+# Each sampler has at most one collection in flight, and metrics reading the
+# GPUs are collected on their own pool, so a hung GPU can tie up every GPU
+# worker but never delays the host metrics.
+GPU = "gpu"
+HOST = "host"
+MAX_WORKERS = {GPU: 4, HOST: 2}
+executors = {
+    pool: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"nvdashboard-{pool}")
+    for pool, workers in MAX_WORKERS.items()
+}
+
+# Seconds to wait for a collection before giving up on that tick
+COLLECT_TIMEOUT = 2.0
+
+# Once a metric has been viewed, keep sampling it at this cadence (ms) for
+# HISTORY_GRACE seconds after the last client leaves, so its History is there
+# when a chart is reopened soon after, without keeping idle GPUs polled
+HISTORY_INTERVAL = 1000
+HISTORY_GRACE = 300.0
+
+
+class Sampler:
+    """
+    Poll a single metric source and fan each sample out to its subscribers.
+
+    There is one sampler per metric per server process, so polling cost scales
+    with the number of metrics rather than the number of connected clients.
+    The sampler ticks at the fastest update frequency requested by any
+    subscriber, and each subscriber is handed a sample only once its own
+    update frequency has elapsed. Every collected sample is also appended to
+    the sampler's ``history``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the metric, used as the key in ``samplers``.
+    collect : callable
+        Blocking function returning a JSON-serializable sample of the metric.
+        It is called on one of ``executors``, never on the event loop.
+    timeout : float, optional
+        Seconds to wait for ``collect`` before skipping the tick.
+    history_interval : int, optional
+        Cadence in ms at which to keep recording history for
+        ``HISTORY_GRACE`` seconds after the last subscriber leaves, or None to
+        stop sampling as soon as nobody is subscribed.
+    min_interval : int, optional
+        Cadence in ms the sampler never ticks faster than, whatever its
+        subscribers request, for metrics that are expensive to collect.
+    ready : callable, optional
+        Returns whether the metric source can be collected yet, e.g. once the
+        GPUs have been discovered. Ticks are skipped until it returns True.
+    pool : str, optional
+        Pool of ``executors`` to collect on, ``GPU`` for metrics read from
+        NVML and ``HOST`` for the others.
+    clock : Clock, optional
+        Clock ticking this sampler together with the other samplers of a
+        metric source, instead of a periodic callback of its own.
+    """
+
+    def __init__(
+        self,
+        name,
+        collect,
+        timeout=COLLECT_TIMEOUT,
+        history_interval=HISTORY_INTERVAL,
+        min_interval=None,
+        ready=None,
+        pool=HOST,
+        clock=None,
+    ):
+        self.name = name
+        self.collect = collect
+        self.pool = pool
+        self.clock = clock
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.ready = ready
+        self.history = History()
+        self.stats = SamplerStats()
+        self.history_interval = history_interval
+        self.recording = False
+        # Monotonic time the last subscriber left, while recording without any
+        self.idle_since = None
+        self.subscribers = {}
+        self.interval = None
+        self.callback = None
+        self.latest = None
+        self.collecting = False
+        self._encoded_sample = None
+        self._encoded = {}
+        samplers[name] = self
+
+    def subscribe(self, subscriber, interval):
+        """Deliver samples to ``subscriber`` every ``interval`` milliseconds."""
+        self.subscribers[subscriber] = [interval, 0.0]
+        self.recording = self.history_interval is not None
+        self.idle_since = None
+        self._reschedule()
+
+    def unsubscribe(self, subscriber):
+        """Stop delivering samples to ``subscriber``."""
+        self.subscribers.pop(subscriber, None)
+        if not self.subscribers and self.idle_since is None:
+            self.idle_since = time.monotonic()
+        self._reschedule()
+
+    def _reschedule(self):
+        intervals = [state[0] for state in self.subscribers.values()]
+        if self.recording:
+            intervals.append(self.history_interval)
+        interval = min(intervals, default=None)
+        if interval is not None and self.min_interval is not None:
+            interval = max(interval, self.min_interval)
+        if interval == self.interval:
+            return
+        if self.callback is not None:
+            self.callback.stop()
+            self.callback = None
+        self.interval = interval
+        if self.clock is not None:
+            self.clock.schedule(self, interval)
+        elif interval is not None:
+            self.callback = tornado.ioloop.PeriodicCallback(self.tick, interval)
+            self.callback.start()
+
+    @property
+    def is_ready(self):
+        """Whether the metric source can be collected yet."""
+        return self.ready is None or self.ready()
+
+    def tick(self):
+        # Stop recording history once nobody has subscribed for the grace period
+        if self.recording and not self.subscribers and time.monotonic() - self.idle_since > HISTORY_GRACE:
+            self.recording = False
+            self._reschedule()
+            return None
+        # Skip this tick while the metric source is still being discovered, or
+        # while the previous collection is still running
+        if not self.is_ready:
+            return None
+        if self.collecting:
+            self.stats.skipped += 1
+            return None
+        self.collecting = True
+        return asyncio.ensure_future(self._collect())
+
+    async def _collect(self):
+        future = asyncio.get_running_loop().run_in_executor(executors[self.pool], self._timed_collect)
+        future.add_done_callback(self._collect_done)
+        try:
+            # Shield the executor future so a timed out call keeps its worker
+            # and blocks new collections of this metric until it returns
+            sample = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except TimeoutError:
+            self.stats.timeouts += 1
+            app_log.warning(f"Timed out collecting {self.name} sample after {self.timeout}s")
+            return
+        except Exception:
+            self.stats.errors += 1
+            app_log.exception(f"Failed to collect {self.name} sample")
+            return
+        self.stats.samples += 1
+        self.latest = sample
+        self.history.append(sample, sample.get("time", time.time() * 1000))
+        self.publish(sample)
+
+    def _timed_collect(self):
+        start = time.perf_counter()
+        try:
+            return self.collect()
+        finally:
+            self.stats.collect.observe(time.perf_counter() - start)
+
+    def _collect_done(self, future):
+        self.collecting = False
+        if not future.cancelled():
+            # Retrieve the exception of abandoned calls so it is not logged as unhandled
+            future.exception()
+
+    def encode(self, sample, encoding):
+        """
+        Return ``encoding(sample)``, computed once per sample and shared by all
+        subscribers requesting the same encoding.
+        """
+        if sample is not self._encoded_sample:
+            self._encoded_sample = sample
+            self._encoded = {}
+        if encoding not in self._encoded:
+            start = time.perf_counter()
+            self._encoded[encoding] = encoding(sample)
+            self.stats.encode.observe(time.perf_counter() - start)
+        return self._encoded[encoding]
+
+    def publish(self, sample):
+        start = time.perf_counter()
+        now = time.monotonic()
+        for subscriber, state in list(self.subscribers.items()):
+            interval, last = state
+            # Allow half a tick of jitter so slower subscribers keep their cadence
+            if (now - last) * 1000 + self.interval / 2 < interval:
+                continue
+            state[1] = now
+            try:
+                subscriber(sample)
+            except Exception:
+                app_log.exception(f"Failed to deliver {self.name} sample")
+        self.stats.publish.observe(time.perf_counter() - start)
+
+
+class Clock:
+    """
+    Tick a group of samplers from a single periodic callback.
+
+    The clock runs at the fastest interval of its samplers. On each tick it
+    calls ``on_tick`` with that interval, then ticks every sampler whose own
+    interval has elapsed, so samplers due together share whatever
+    ``on_tick`` set up for the tick, e.g. one snapshot of the GPUs.
+    """
+
+    def __init__(self, on_tick=None):
+        self.on_tick = on_tick
+        # Sampler -> [interval in ms, monotonic time of its last tick]
+        self.samplers = {}
+        self.interval = None
+        self.callback = None
+
+    def schedule(self, sampler, interval):
+        """Tick ``sampler`` every ``interval`` milliseconds, or no longer if None."""
+        if interval is None:
+            self.samplers.pop(sampler, None)
+        else:
+            self.samplers.setdefault(sampler, [interval, 0.0])[0] = interval
+        interval = min((state[0] for state in self.samplers.values()), default=None)
+        if interval == self.interval:
+            return
+        if self.callback is not None:
+            self.callback.stop()
+            self.callback = None
+        self.interval = interval
+        if interval is not None:
+            self.callback = tornado.ioloop.PeriodicCallback(self.tick, interval)
+            self.callback.start()
+
+    def tick(self):
+        """Tick the samplers that are due, returning their collections."""
+        now = time.monotonic()
+        due = []
+        for sampler, state in self.samplers.items():
+            # Allow half a tick of jitter so slower samplers keep their cadence
+            if (now - state[1]) * 1000 + self.interval / 2 >= state[0] and sampler.is_ready:
+                state[1] = now
+                due.append(sampler)
+        if due and self.on_tick is not None:
+            self.on_tick(self.interval)
+        return [future for future in (sampler.tick() for sampler in due) if future is not None]
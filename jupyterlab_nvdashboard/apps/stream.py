@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import functools
+import json
+import time
+
+import tornado
+from tornado.websocket import WebSocketHandler
+from jupyter_server.base.handlers import JupyterHandler
+
+from jupyterlab_nvdashboard.apps import wire
+from jupyterlab_nvdashboard.apps.sampler import samplers
+from jupyterlab_nvdashboard.apps.utils import FlowControlMixin
+
+
+class StreamWebSocketHandler(FlowControlMixin, JupyterHandler, WebSocketHandler):
+    """
+    Multiplex several metric channels over a single websocket.
+
+    Clients send ``{"channels": {name: updateFrequency, ...}}`` to subscribe
+    to a set of channels, each at its own frequency, and receive one frame
+    per tick of the fastest channel holding the samples that arrived since
+    the previous frame::
+
+        {"time": ..., "channels": {name: sample, ...}}
+
+    Sending a new set of channels replaces the previous subscriptions, and
+    an empty set pauses the stream. While the client lags, samples are
+    coalesced into the next frame, keeping only the latest of each channel.
+
+    Clients send ``{"backfill": {name: count, ...}}`` to receive the last
+    ``count`` samples recorded by the server for each channel, as
+    ``{"history": {name: [sample, ...], ...}}``.
+    """
+
+    def initialize(self, channels=()):
+        # Names of the samplers that may be subscribed to
+        self.available_channels = list(channels)
+        # Requested update frequency of each channel
+        self.channels = {}
+        self.paused = False
+        self.subscriptions = {}
+        self.pending = {}
+        self.callback = None
+
+    def open(self):
+        if not self.current_user:
+            self.write_message(json.dumps({"error": "Unauthorized access"}))
+            self.close()
+            return
+        initializing = [name for name in self.available_channels if name in samplers and not samplers[name].is_ready]
+        self.write_message(
+            json.dumps({"status": "connected", "channels": self.available_channels, "initializing": initializing})
+        )
+        self.track_connection("stream")
+        self.set_nodelay(True)
+
+    def on_message(self, message):
+        message_data = json.loads(message)
+        if not self.current_user:
+            return
+        if "backfill" in message_data:
+            history = {
+                name: samplers[name].history.samples(limit=count)
+                for name, count in message_data["backfill"].items()
+                if name in self.available_channels and name in samplers
+            }
+            self.write_frame(json.dumps({"history": history}))
+        if "visible" in message_data:
+            self.visible = message_data["visible"]
+        if "isPaused" in message_data:
+            self.paused = message_data["isPaused"]
+        if "channels" in message_data:
+            self.channels = {
+                name: frequency
+                for name, frequency in message_data["channels"].items()
+                if name in self.available_channels
+            }
+        self.subscribe()
+
+    def subscribe(self):
+        self.unsubscribe()
+        if self.paused or not self.channels:
+            return
+        frequencies = {name: self.effective_frequency(frequency) for name, frequency in self.channels.items()}
+        for name, frequency in frequencies.items():
+            sampler = samplers[name]
+            subscriber = functools.partial(self.pending.__setitem__, name)
+            sampler.subscribe(subscriber, frequency)
+            self.subscriptions[name] = (sampler, subscriber)
+        # Combine the pending samples into a frame at the fastest channel's cadence
+        self.callback = tornado.ioloop.PeriodicCallback(self.send_data, min(frequencies.values()))
+        self.callback.start()
+
+    def unsubscribe(self):
+        for sampler, subscriber in self.subscriptions.values():
+            sampler.unsubscribe(subscriber)
+        self.subscriptions = {}
+        self.pending.clear()
+        if self.callback is not None:
+            self.callback.stop()
+            self.callback = None
+
+    def on_close(self):
+        self.untrack_connection()
+        self.unsubscribe()
+
+    def send_data(self):
+        if not self.pending:
+            return
+        # Keep the pending samples for the next frame while the client lags
+        if self.lagging:
+            self.drop_frame()
+            return
+        # Splice in the JSON each sampler already encoded for its own subscribers
+        channels = ", ".join(
+            f"{json.dumps(name)}: {samplers[name].encode(sample, wire.encode_json)}"
+            for name, sample in self.pending.items()
+        )
+        self.pending.clear()
+        self.write_frame(f'{{"time": {time.time() * 1000}, "channels": {{{channels}}}}}')
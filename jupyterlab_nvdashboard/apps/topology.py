@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Topology of the GPUs: how they connect to each other and to the CPUs.
+
+Topology only changes with the hardware, so it is discovered once, in the
+background right after the GPUs, and cached for the life of the server.
+Live NVLink rates are not part of it; clients overlay them from the
+``nvlink_throughput`` stream, whose per-link rates are laid out GPU-major
+over ``nvlink_links``.
+"""
+
+import math
+import os
+
+import psutil
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.cpu import format_cpulist, numa_nodes, parse_cpulist
+
+# Sysfs directory of PCI devices, holding the NUMA node of each GPU
+PCI_DEVICES = "/sys/bus/pci/devices"
+
+
+def path_names():
+    """Return the name of each NVML topology level, as used by ``nvidia-smi topo -m``."""
+    pynvml = gpu.pynvml
+    return {
+        pynvml.NVML_TOPOLOGY_INTERNAL: "PIX",
+        pynvml.NVML_TOPOLOGY_SINGLE: "PIX",
+        pynvml.NVML_TOPOLOGY_MULTIPLE: "PXB",
+        pynvml.NVML_TOPOLOGY_HOSTBRIDGE: "PHB",
+        pynvml.NVML_TOPOLOGY_NODE: "NODE",
+        pynvml.NVML_TOPOLOGY_SYSTEM: "SYS",
+    }
+
+
+def _query(function, *args):
+    """Return ``function(*args)``, or None if the device does not support it."""
+    try:
+        return function(*args)
+    except gpu.pynvml.NVMLError:
+        return None
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def normalize_bus_id(bus_id):
+    """Return an NVML PCI bus ID such as ``00000000:17:00.0`` in sysfs form, ``0000:17:00.0``."""
+    domain, _, rest = _decode(bus_id).partition(":")
+    return f"{int(domain, 16):04x}:{rest.lower()}"
+
+
+def cpu_affinity(handle):
+    """Return the CPUs local to GPU ``handle``."""
+    words = math.ceil((psutil.cpu_count() or 1) / 64)
+    mask = gpu.pynvml.nvmlDeviceGetCpuAffinity(handle, words)
+    return [index * 64 + bit for index, word in enumerate(mask) for bit in range(64) if word >> bit & 1]
+
+
+def numa_node(bus_id, cpus, node_cpus):
+    """
+    Return the NUMA node of the GPU at ``bus_id``, falling back to the node
+    holding most of its local ``cpus`` when sysfs does not know it.
+    """
+    if bus_id is not None:
+        try:
+            with open(os.path.join(PCI_DEVICES, bus_id, "numa_node")) as f:
+                node = int(f.read())
+            if node >= 0:
+                return node
+        except (OSError, ValueError):
+            pass
+    overlap = {node: len(node_cpus[node].intersection(cpus)) for node in node_cpus}
+    if not cpus or not any(overlap.values()):
+        return None
+    return max(overlap, key=overlap.get)
+
+
+def _nvlinks(handle, bus_ids):
+    """Return the active NVLinks of GPU ``handle`` and what they connect to."""
+    pynvml = gpu.pynvml
+    links = []
+    for link in gpu.nvlink_links:
+        kind = _query(pynvml.nvmlDeviceGetNvLinkRemoteDeviceType, handle, link)
+        if kind is None:
+            continue
+        peer = None
+        if kind == pynvml.NVML_NVLINK_DEVICE_TYPE_GPU:
+            remote = _query(pynvml.nvmlDeviceGetNvLinkRemotePciInfo, handle, link)
+            if remote is not None and normalize_bus_id(remote.busId) in bus_ids:
+                peer = bus_ids.index(normalize_bus_id(remote.busId))
+        remote_type = {
+            pynvml.NVML_NVLINK_DEVICE_TYPE_GPU: "gpu",
+            pynvml.NVML_NVLINK_DEVICE_TYPE_SWITCH: "switch",
+            pynvml.NVML_NVLINK_DEVICE_TYPE_IBMNPU: "cpu",
+        }.get(kind, "unknown")
+        links.append({"link": link, "remote": remote_type, "peer": peer})
+    return links
+
+
+def _path(handle, other, links, other_links, peer):
+    """Return the ``nvidia-smi topo -m`` name of the fastest path between two GPUs."""
+    direct = sum(1 for link in links if link["peer"] == peer)
+    if direct:
+        return f"NV{direct}"
+    # GPUs on the same NVSwitch fabric talk over all of their switch links
+    switch = min(
+        sum(1 for link in links if link["remote"] == "switch"),
+        sum(1 for link in other_links if link["remote"] == "switch"),
+    )
+    if switch:
+        return f"NV{switch}"
+    level = _query(gpu.pynvml.nvmlDeviceGetTopologyCommonAncestor, handle, other)
+    return path_names().get(level)
+
+
+# Topology of the discovered GPUs, None until they are discovered
+current = None
+
+
+def refresh():
+    """Discover the topology of the GPUs and cache it as ``current``, once they are discovered."""
+    global current
+    if not gpu.ready():
+        return None
+    current = discover()
+    return current
+
+
+gpu.discovery_hooks.append(refresh)
+
+
+def discover():
+    """
+    Return the topology of the GPUs, as a dict of:
+
+    - ``gpus``: the name, PCI bus ID, NUMA node and local CPUs of each GPU
+    - ``nvlinks``: the active NVLinks of each GPU, and the GPU (``peer``) or
+      kind of device (``remote``) at their other end
+    - ``paths``: the fastest path between each pair of GPUs, named as by
+      ``nvidia-smi topo -m``, e.g. ``NV12``, ``PXB`` or ``SYS``
+    - ``numa_nodes``: the CPUs of each NUMA node
+    """
+    pynvml = gpu.pynvml
+    nodes = numa_nodes()
+    node_cpus = {node: set(parse_cpulist(cpulist)) for node, cpulist in nodes.items()}
+    handles = gpu.gpu_handles
+
+    gpus = []
+    for index, handle in enumerate(handles):
+        pci = _query(pynvml.nvmlDeviceGetPciInfo, handle)
+        bus_id = normalize_bus_id(pci.busId) if pci is not None else None
+        cpus = _query(cpu_affinity, handle) or []
+        gpus.append(
+            {
+                "index": index,
+                "name": _decode(_query(pynvml.nvmlDeviceGetName, handle)),
+                "bus_id": bus_id,
+                "numa_node": numa_node(bus_id, cpus, node_cpus),
+                "cpus": format_cpulist(cpus),
+            }
+        )
+
+    bus_ids = [device["bus_id"] for device in gpus]
+    nvlinks = [_nvlinks(handle, bus_ids) for handle in handles]
+    paths = [
+        ["X" if i == j else _path(handle, other, nvlinks[i], nvlinks[j], j) for j, other in enumerate(handles)]
+        for i, handle in enumerate(handles)
+    ]
+    return {
+        "gpus": gpus,
+        "nvlinks": nvlinks,
+        "paths": paths,
+        "numa_nodes": [{"node": node, "cpus": cpulist} for node, cpulist in nodes.items()],
+    }
@@ -3,35 +3,145 @@
 
 from tornado.websocket import WebSocketHandler
 from jupyter_server.base.handlers import JupyterHandler
-import tornado
+import functools
 import json
+import time
+from jupyterlab_nvdashboard.apps import diagnostics, wire
 
+# Frames are dropped while more than this many bytes written to a client
+# have not been flushed yet
+MAX_PENDING_BYTES = 1024 * 1024
+
+# Update frequency in ms of clients whose dashboard is hidden
+HEARTBEAT_INTERVAL = 10000
+
+
+class FlowControlMixin:
+    """
+    Flow control for websocket handlers streaming metric samples.
+
+    Bytes written but not yet flushed to the client are tracked so frames can
+    be dropped while a slow client catches up, instead of piling up in the
+    write buffer. Clients report whether the dashboard is visible with
+    ``{"visible": bool}``, and hidden clients only receive a heartbeat every
+    ``HEARTBEAT_INTERVAL`` ms.
+
+    Clients, frames and bytes are counted in the diagnostics ConnectionStats
+    of the endpoint once ``track_connection`` has been called.
+    """
+
+    pending_bytes = 0
+    dropped_frames = 0
+    visible = True
+    stats = None
+    tracked = False
+
+    @property
+    def lagging(self):
+        """Whether the client is too far behind to be sent another frame."""
+        return self.pending_bytes > MAX_PENDING_BYTES
+
+    def track_connection(self, name):
+        """Count this client in the diagnostics of endpoint ``name``."""
+        self.stats = diagnostics.connection_stats(name)
+        self.stats.clients += 1
+        self.tracked = True
+
+    def untrack_connection(self):
+        if self.tracked:
+            self.stats.clients -= 1
+            self.tracked = False
+
+    def drop_frame(self):
+        """Count a frame skipped while the client lags."""
+        self.dropped_frames += 1
+        if self.stats is not None:
+            self.stats.dropped_frames += 1
+
+    def effective_frequency(self, frequency):
+        """Return the update frequency to use for a requested ``frequency``."""
+        return frequency if self.visible else max(frequency, HEARTBEAT_INTERVAL)
+
+    def write_frame(self, frame, binary=False):
+        """Write ``frame`` to the client, counting it as pending until flushed."""
+        size = len(frame)
+        self.pending_bytes += size
+        if self.stats is not None:
+            self.stats.frames += 1
+            self.stats.bytes += size
+        future = self.write_message(frame, binary=binary)
+        future.add_done_callback(functools.partial(self._flushed, size, time.perf_counter()))
+
+    def _flushed(self, size, started, future):
+        self.pending_bytes -= size
+        if self.stats is not None:
+            self.stats.flush.observe(time.perf_counter() - started)
+        # Writes fail once the connection is closed, which on_close handles
+        if not future.cancelled():
+            future.exception()
+
+
+class CustomWebSocketHandler(FlowControlMixin, JupyterHandler, WebSocketHandler):
+    # Shared per-process Sampler for the metric streamed by this handler
+    sampler = None
+    # Wire format negotiated in the client handshake, JSON unless requested
+    wire_format = wire.JSON
+    # Wire formats the samples of this handler can be encoded in
+    wire_formats = (wire.JSON, wire.BINARY)
+    # Binary frame layout last sent to the client
+    fields = None
+    paused = False
 
-class CustomWebSocketHandler(JupyterHandler, WebSocketHandler):
     def open(self):
         if not self.current_user:
             self.write_message(json.dumps({"error": "Unauthorized access"}))
             self.close()
             return
         self.write_message(json.dumps({"status": "connected"}))
+        self.track_connection(self.sampler.name)
+        if not self.sampler.is_ready:
+            # Samples start flowing once the metric source has been discovered
+            self.write_message(json.dumps({"status": "initializing"}))
         self.set_nodelay(True)
-        # Start a periodic callback to send data every 50ms
-        self.callback = tornado.ioloop.PeriodicCallback(self.send_data, 1000)
-        self.callback.start()
+        # Subscribe to the shared sampler to receive data every second
+        self.update_frequency = 1000
+        self.sampler.subscribe(self.send_data, self.update_frequency)
 
     def on_message(self, message):
         message_data = json.loads(message)
-        # Update the periodic callback frequency
-        new_frequency = message_data["updateFrequency"]
-        if hasattr(self, "callback"):
-            self.callback.stop()
-            self.callback = tornado.ioloop.PeriodicCallback(self.send_data, new_frequency)
-            if not message_data["isPaused"]:
-                self.callback.start()
+        if message_data.get("format") == wire.BINARY and wire.BINARY in self.wire_formats:
+            self.wire_format = wire.BINARY
+        # Backfill the most recent samples recorded by the server
+        if "backfill" in message_data:
+            history = self.sampler.history.samples(limit=message_data["backfill"])
+            self.write_frame(json.dumps({"history": history}))
+        if "visible" in message_data:
+            self.visible = message_data["visible"]
+        if "isPaused" in message_data:
+            self.paused = message_data["isPaused"]
+        # Update the subscription frequency
+        if hasattr(self, "update_frequency"):
+            self.update_frequency = message_data.get("updateFrequency", self.update_frequency)
+            self.sampler.unsubscribe(self.send_data)
+            if not self.paused:
+                self.sampler.subscribe(self.send_data, self.effective_frequency(self.update_frequency))
 
     def on_close(self):
-        if hasattr(self, "callback") and self.callback.is_running():
-            self.callback.stop()
+        self.untrack_connection()
+        if self.sampler is not None:
+            self.sampler.unsubscribe(self.send_data)
 
-    def send_data(self):
-        pass
+    def send_data(self, sample):
+        # Skip frames while the client lags, the next sample supersedes them
+        if self.lagging:
+            self.drop_frame()
+            return
+        if self.wire_format == wire.BINARY:
+            fields, frame = self.sampler.encode(sample, wire.encode_binary)
+            # Send the frame layout once, and again only if it changes
+            if fields != self.fields:
+                self.fields = fields
+                self.write_frame(json.dumps({"schema": fields}))
+            self.write_frame(frame, binary=True)
+        else:
+            self.write_frame(self.sampler.encode(sample, wire.encode_json))
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+# Encodings of metric samples sent over the websocket streams.
+
+import json
+import sys
+
+from jupyterlab_nvdashboard.apps.history import History, flatten
+
+# Wire formats a client can request in its handshake
+JSON = "json"
+BINARY = "binary"
+
+
+def schema(sample):
+    """
+    Return the binary frame layout of ``sample`` as a list of ``(key, width)``.
+
+    Width is None for scalar fields and the list length for list fields.
+    Non-numeric fields are not sent in binary frames.
+    """
+    fields = History.layout(sample)
+    if "time" in sample:
+        fields.insert(0, ("time", None))
+    return fields
+
+
+def pack(sample, fields):
+    """Pack the values of ``sample`` laid out as ``fields`` into little-endian float64s."""
+    values = flatten(sample, fields)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_json(sample):
+    return json.dumps(sample)
+
+
+def encode_binary(sample):
+    """Return the schema of ``sample`` and its packed binary frame."""
+    fields = schema(sample)
+    return fields, pack(sample, fields)
@@ -9,6 +9,20 @@ from . import apps
 URL_PATH = "nvdashboard"
 
 
+def number_argument(handler, name, cast=float, default=None):
+    """
+    Return query argument ``name`` of ``handler`` converted with ``cast``, or
+    ``default`` if it is missing. Malformed values are a 400 Bad Request.
+    """
+    value = handler.get_argument(name, None)
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        raise tornado.web.HTTPError(400, f"Invalid {name} argument: {value!r}") from None
+
+
 class AcceleratorStatusHandler(JupyterHandler):
     """HTTP endpoint to check availability of GPU accelerators."""
 
@@ -20,42 +34,273 @@ class AcceleratorStatusHandler(JupyterHandler):
         response = {
             "has_gpu": apps.gpu.ngpus > 0,
             "ngpus": apps.gpu.ngpus,
+            "gpu_status": apps.gpu.status,
             "accelerators": check_all_accelerators(),
         }
 
         self.finish(json.dumps(response))
 
 
+class TopologyHandler(JupyterHandler):
+    """HTTP endpoint describing how the GPUs connect to each other and to the CPUs."""
+
+    @tornado.web.authenticated
+    async def get(self):
+        """Return the GPU topology, see ``apps.topology.discover``."""
+        if not apps.gpu.ready():
+            # Discovery of the GPUs is still running, or failed and is retried
+            self.set_status(503)
+            self.finish(json.dumps({"status": apps.gpu.status}))
+            return
+        topology = apps.topology.current
+        if topology is None:
+            # Topology is discovered in the background right after the GPUs.
+            # Until then, discovery queries every pair of GPUs off the event loop.
+            topology = await tornado.ioloop.IOLoop.current().run_in_executor(None, apps.topology.refresh)
+        self.finish(json.dumps(topology))
+
+
+class HistoryHandler(JupyterHandler):
+    """HTTP endpoint to query the samples recorded for a metric."""
+
+    @tornado.web.authenticated
+    def get(self, metric):
+        """
+        Return the samples of ``metric`` between the ``start`` and ``end`` query
+        arguments (ms since the epoch).
+
+        With ``points``, samples are returned at the finest resolution that fits
+        the range in that many points, using min/mean/max rollups for long
+        ranges. Otherwise raw samples are returned, the most recent ``limit``
+        of them if given.
+        """
+        sampler = apps.sampler.samplers.get(metric)
+        if sampler is None:
+            raise tornado.web.HTTPError(404, f"Unknown metric {metric}")
+
+        start = number_argument(self, "start")
+        end = number_argument(self, "end")
+        points = number_argument(self, "points", int)
+        if points is not None:
+            result = sampler.history.query(start=start, end=end, points=points)
+        else:
+            result = {
+                "resolution": 0,
+                "samples": sampler.history.samples(start=start, end=end, limit=number_argument(self, "limit", int)),
+            }
+        response = {"metric": metric, **result}
+
+        self.finish(json.dumps(response))
+
+
+class DiagnosticsHandler(JupyterHandler):
+    """HTTP endpoint reporting how the dashboard itself performs."""
+
+    @tornado.web.authenticated
+    def get(self):
+        """
+        Return the collection, encoding and fan-out times of each sampler,
+        the clients and traffic of each websocket endpoint, and the lag of
+        the event loop, see ``apps.diagnostics.report``.
+        """
+        self.finish(json.dumps(apps.diagnostics.report()))
+
+
+class MetricsHandler(JupyterHandler):
+    """
+    HTTP endpoint exposing the dashboard metrics in the OpenMetrics format.
+
+    Metrics are served from the samples already collected for the websocket
+    streams, so scrapes do not query the devices. Scrapers authenticate like
+    any other client, e.g. with an ``Authorization: token <token>`` header.
+    """
+
+    def initialize(self, channels=()):
+        # Names of the samplers to export
+        self.channels = list(channels)
+
+    @tornado.web.authenticated
+    def get(self):
+        self.set_header("Content-Type", apps.exporter.CONTENT_TYPE)
+        self.finish(apps.exporter.render(self.channels))
+
+
+class RecordingHandler(JupyterHandler):
+    """HTTP endpoint to read back the samples recorded to disk for a metric."""
+
+    def initialize(self, recorder):
+        self.recorder = recorder
+
+    @tornado.web.authenticated
+    async def get(self, metric):
+        """
+        Return the recorded samples of ``metric`` between the ``start`` and
+        ``end`` query arguments (ms since the epoch), at most the most recent
+        ``limit`` of them.
+        """
+        if metric not in self.recorder.subscribers:
+            raise tornado.web.HTTPError(404, f"Metric {metric} is not recorded")
+        start = number_argument(self, "start")
+        end = number_argument(self, "end")
+        limit = min(number_argument(self, "limit", int, apps.recorder.READ_LIMIT), apps.recorder.READ_LIMIT)
+        # Segments are read from disk off the event loop
+        samples = await tornado.ioloop.IOLoop.current().run_in_executor(
+            None, self.recorder.read, metric, start, end, limit
+        )
+        self.finish(json.dumps({"metric": metric, "samples": samples}))
+
+
+class ClusterHandler(JupyterHandler):
+    """HTTP endpoint describing the nodes of a federated cluster."""
+
+    def initialize(self, federation):
+        self.federation = federation
+
+    @tornado.web.authenticated
+    def get(self, node=None):
+        """
+        Return the status and latest samples of every node, or of ``node``
+        only, to drill down from the ``cluster_resource`` metric.
+        """
+        nodes = self.federation.nodes
+        if node is not None:
+            nodes = [item for item in nodes if item.name == node]
+            if not nodes:
+                raise tornado.web.HTTPError(404, f"Unknown node {node}")
+        self.finish(json.dumps({"nodes": [self.federation.describe(item) for item in nodes]}))
+
+
+class AlertsHandler(JupyterHandler):
+    """HTTP endpoint listing the active alerts and the alert event log."""
+
+    def initialize(self, engine):
+        self.engine = engine
+
+    @tornado.web.authenticated
+    def get(self):
+        """
+        Return the alert rules, the active alerts and the logged alert events,
+        only those numbered after the ``after`` query argument if given.
+        """
+        after = number_argument(self, "after", int, 0)
+        response = {
+            "rules": [
+                {"name": rule.name, "severity": rule.severity, "message": rule.message} for rule in self.engine.rules
+            ],
+            "active": self.engine.active(),
+            "events": self.engine.history(after),
+        }
+        self.finish(json.dumps(response))
+
+
 def setup_handlers(web_app):
     host_pattern = ".*$"
     base_url = web_app.settings["base_url"]
     handlers = []
-    if apps.gpu.ngpus > 0:
-        # Prepend the base_url so that it works in a JupyterHub setting
-        route_pattern_gpu_util = url_path_join(base_url, URL_PATH, "gpu_utilization")
-        route_pattern_gpu_usage = url_path_join(base_url, URL_PATH, "gpu_usage")
-        route_pattern_gpu_resource = url_path_join(base_url, URL_PATH, "gpu_resource")
-        route_pattern_pci_stats = url_path_join(base_url, URL_PATH, "pci_stats")
-        route_pattern_nvlink_throughput = url_path_join(base_url, URL_PATH, "nvlink_throughput")
-        handlers += [
-            (route_pattern_gpu_util, apps.gpu.GPUUtilizationWebSocketHandler),
-            (route_pattern_gpu_usage, apps.gpu.GPUUsageWebSocketHandler),
-            (route_pattern_gpu_resource, apps.gpu.GPUResourceWebSocketHandler),
-            (route_pattern_pci_stats, apps.gpu.PCIStatsWebSocketHandler),
-            (
-                route_pattern_nvlink_throughput,
-                apps.gpu.NVLinkThroughputWebSocketHandler,
-            ),
-        ]
+    # Metric channels that can be subscribed to over the multiplexed stream
+    channels = []
+    # GPU routes are registered before the GPUs are discovered, so the server
+    # starts without waiting on NVML. Their samplers idle until discovery
+    # completes, and handlers report "initializing" meanwhile.
+    apps.gpu.start_discovery()
+
+    # Prepend the base_url so that it works in a JupyterHub setting
+    route_pattern_gpu_util = url_path_join(base_url, URL_PATH, "gpu_utilization")
+    route_pattern_gpu_usage = url_path_join(base_url, URL_PATH, "gpu_usage")
+    route_pattern_gpu_resource = url_path_join(base_url, URL_PATH, "gpu_resource")
+    route_pattern_pci_stats = url_path_join(base_url, URL_PATH, "pci_stats")
+    route_pattern_nvlink_throughput = url_path_join(base_url, URL_PATH, "nvlink_throughput")
+    route_pattern_gpu_processes = url_path_join(base_url, URL_PATH, "gpu_processes")
+    route_pattern_gpu_health = url_path_join(base_url, URL_PATH, "gpu_health")
+    route_pattern_topology = url_path_join(base_url, URL_PATH, "topology")
+    handlers += [
+        (route_pattern_gpu_util, apps.gpu.GPUUtilizationWebSocketHandler),
+        (route_pattern_gpu_usage, apps.gpu.GPUUsageWebSocketHandler),
+        (route_pattern_gpu_resource, apps.gpu.GPUResourceWebSocketHandler),
+        (route_pattern_pci_stats, apps.gpu.PCIStatsWebSocketHandler),
+        (
+            route_pattern_nvlink_throughput,
+            apps.gpu.NVLinkThroughputWebSocketHandler,
+        ),
+        (route_pattern_gpu_processes, apps.processes.GPUProcessesWebSocketHandler),
+        (route_pattern_gpu_health, apps.health.GPUHealthWebSocketHandler),
+        (route_pattern_topology, TopologyHandler),
+    ]
+    channels += [
+        "gpu_utilization",
+        "gpu_usage",
+        "gpu_resource",
+        "pci_stats",
+        "nvlink_throughput",
+        "gpu_processes",
+        "gpu_health",
+    ]
+    # Attribute GPU processes to the kernels of this server
+    apps.processes.GPUProcessesWebSocketHandler.sampler.configure(
+        web_app.settings.get("kernel_manager"), web_app.settings.get("session_manager")
+    )
 
     route_pattern_cpu_resource = url_path_join(base_url, URL_PATH, "cpu_resource")
+    route_pattern_host_resource = url_path_join(base_url, URL_PATH, "host_resource")
+    channels += ["cpu_resource", "host_resource"]
+
+    # Single websocket multiplexing all of the metric channels above
+    route_pattern_stream = url_path_join(base_url, URL_PATH, "stream")
 
     # HTTP endpoint for checking accelerator availability
     route_pattern_accelerator_status = url_path_join(base_url, URL_PATH, "accelerators/check")
 
+    # HTTP endpoint for querying the recorded history of a metric
+    route_pattern_history = url_path_join(base_url, URL_PATH, "history", "(?P<metric>[^/]+)")
+
+    # OpenMetrics endpoint for Prometheus scrapers
+    route_pattern_metrics = url_path_join(base_url, URL_PATH, "metrics")
+
+    # HTTP endpoint reporting the performance of the dashboard itself
+    route_pattern_diagnostics = url_path_join(base_url, URL_PATH, "diagnostics")
+    apps.diagnostics.monitor.start()
+
     handlers += [
         (route_pattern_cpu_resource, apps.cpu.CPUResourceWebSocketHandler),
+        (route_pattern_host_resource, apps.cpu.HostResourceWebSocketHandler),
+        (route_pattern_stream, apps.stream.StreamWebSocketHandler, {"channels": channels}),
         (route_pattern_accelerator_status, AcceleratorStatusHandler),
+        (route_pattern_history, HistoryHandler),
+        (route_pattern_metrics, MetricsHandler, {"channels": channels}),
+        (route_pattern_diagnostics, DiagnosticsHandler),
     ]
 
+    # Merge the metrics of other nvdashboard servers when NVDASHBOARD_PEERS is set
+    federation = apps.federation.from_environment()
+    if federation is not None:
+        federation.start()
+        channels.append("cluster_resource")
+        route_pattern_cluster_resource = url_path_join(base_url, URL_PATH, "cluster_resource")
+        route_pattern_cluster = url_path_join(base_url, URL_PATH, "cluster")
+        route_pattern_cluster_node = url_path_join(base_url, URL_PATH, "cluster", "(?P<node>[^/]+)")
+        handlers += [
+            (route_pattern_cluster_resource, apps.federation.ClusterWebSocketHandler, {"federation": federation}),
+            (route_pattern_cluster, ClusterHandler, {"federation": federation}),
+            (route_pattern_cluster_node, ClusterHandler, {"federation": federation}),
+        ]
+
+    # Persist metric samples to disk when NVDASHBOARD_RECORD_DIR is set
+    recorder = apps.recorder.from_environment()
+    if recorder is not None:
+        # Process lists are not numeric, so they cannot be stored in fixed-width rows
+        recorder.start([name for name in channels if name != "gpu_processes"])
+        route_pattern_recording = url_path_join(base_url, URL_PATH, "recording", "(?P<metric>[^/]+)")
+        handlers += [(route_pattern_recording, RecordingHandler, {"recorder": recorder})]
+
+    # Evaluate alert rules when NVDASHBOARD_ALERT_RULES is set
+    engine = apps.alerts.from_environment()
+    if engine is not None:
+        engine.start()
+        route_pattern_alerts = url_path_join(base_url, URL_PATH, "alerts")
+        route_pattern_alerts_ws = url_path_join(base_url, URL_PATH, "alerts", "events")
+        handlers += [
+            (route_pattern_alerts, AlertsHandler, {"engine": engine}),
+            (route_pattern_alerts_ws, apps.alerts.AlertsWebSocketHandler, {"engine": engine}),
+        ]
+
     web_app.add_handlers(host_pattern, handlers)
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import pytest
+import tornado
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps import alerts
+from jupyterlab_nvdashboard.apps.alerts import AlertEngine, parse_rules
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.handlers import AlertsHandler
+
+MEMORY_RULE = {
+    "name": "gpu-memory-high",
+    "when": {"metric": "gpu_usage", "field": "memory_usage", "of": "total_memory", "op": ">", "value": 95},
+    "for": 120,
+}
+
+NVLINK_IDLE_RULE = {
+    "name": "nvlink-idle-while-busy",
+    "when": [
+        {"metric": "gpu_utilization", "field": "gpu_utilization", "op": ">", "value": 80},
+        {"metric": "nvlink_throughput", "field": "nvlink_rx", "op": "<", "value": 1e6},
+    ],
+}
+
+
+def memory_sample(time, used):
+    return {"time": time, "memory_usage": used, "total_memory": [100] * len(used)}
+
+
+def test_threshold_rule_fires_after_duration():
+    engine = AlertEngine(parse_rules([MEMORY_RULE]))
+    engine.on_sample("gpu_usage", memory_sample(0, [96, 50]))
+    engine.on_sample("gpu_usage", memory_sample(60_000, [97, 99]))
+    assert engine.active() == []
+
+    engine.on_sample("gpu_usage", memory_sample(120_000, [98, 99]))
+    (event,) = engine.active()
+    assert (event["rule"], event["gpu"], event["state"], event["since"]) == ("gpu-memory-high", 0, "firing", 0)
+    assert event["values"] == {"gpu_usage.memory_usage % of total_memory > 95": 98}
+
+    # Firing alerts are not raised again, and resolve once the condition stops holding
+    engine.on_sample("gpu_usage", memory_sample(180_000, [50, 99]))
+    assert [(event["gpu"], event["state"]) for event in engine.history()] == [
+        (0, "firing"),
+        (0, "resolved"),
+        (1, "firing"),
+    ]
+    assert [event["gpu"] for event in engine.active()] == [1]
+
+
+def test_rule_over_several_metrics():
+    engine = AlertEngine(parse_rules([NVLINK_IDLE_RULE]))
+    engine.on_sample("gpu_utilization", {"gpu_utilization": [90, 90]})
+    # Not evaluated until every metric has been sampled
+    assert engine.active() == []
+
+    engine.on_sample("nvlink_throughput", {"time": 1000, "nvlink_rx": [0, 5e6]})
+    assert [event["gpu"] for event in engine.active()] == [0]
+
+
+def test_rate_of_change_rule():
+    rules = parse_rules(
+        [
+            {
+                "name": "leak",
+                "when": {"metric": "gpu_usage", "field": "memory_usage", "op": ">", "value": 10, "rate": True},
+            }
+        ]
+    )
+    engine = AlertEngine(rules)
+    engine.on_sample("gpu_usage", memory_sample(0, [0]))
+    engine.on_sample("gpu_usage", memory_sample(2000, [10]))
+    assert engine.active() == []
+    engine.on_sample("gpu_usage", memory_sample(3000, [30]))
+    (event,) = engine.active()
+    assert event["values"] == {"rate(gpu_usage.memory_usage) > 10": 20}
+
+
+def test_scalar_rule_and_listeners():
+    rules = parse_rules(
+        [{"name": "cpu", "when": {"metric": "cpu_resource", "field": "cpu_utilization", "op": ">=", "value": 90}}]
+    )
+    engine = AlertEngine(rules)
+    listener = MagicMock()
+    engine.listeners.add(listener)
+
+    engine.on_sample("cpu_resource", {"time": 0, "cpu_utilization": 95})
+    engine.on_sample("cpu_resource", {"time": 1000, "cpu_utilization": 10})
+    assert [call.args[0]["state"] for call in listener.call_args_list] == ["firing", "resolved"]
+    assert listener.call_args.args[0]["gpu"] is None
+    assert [event["id"] for event in engine.history(after=1)] == [2]
+
+
+def test_parse_rules_rejects_invalid_rules():
+    with pytest.raises(ValueError, match="Unknown operator"):
+        parse_rules([{"name": "bad", "when": {"metric": "gpu_usage", "field": "memory_usage", "op": "!=", "value": 1}}])
+    with pytest.raises(ValueError, match="Invalid condition"):
+        parse_rules([{"name": "bad", "when": {"metric": "gpu_usage", "value": 1}}])
+    with pytest.raises(ValueError, match="no conditions"):
+        parse_rules({"rules": [{"name": "empty"}]})
+    with pytest.raises(ValueError, match="unique"):
+        parse_rules([MEMORY_RULE, MEMORY_RULE])
+    with pytest.raises(ValueError, match="not an object"):
+        parse_rules(["gpu-memory-high"])
+
+
+def test_engine_subscribes_to_samplers(tmp_path, monkeypatch):
+    path = tmp_path / "rules.json"
+    rule = {"name": "test", "when": {"metric": "test_alerts", "field": "value", "op": ">", "value": 1}}
+    path.write_text(json.dumps([rule]))
+    monkeypatch.setenv(alerts.ALERT_RULES_ENV, str(path))
+    engine = alerts.from_environment()
+
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        sampler = Sampler("test_alerts", MagicMock(), ready=lambda: False)
+        engine.start()
+        assert sampler.interval == alerts.RULE_INTERVAL
+        engine.stop()
+        assert sampler.subscribers == {}
+
+    monkeypatch.delenv(alerts.ALERT_RULES_ENV)
+    assert alerts.from_environment() is None
+
+
+@pytest.mark.parametrize("content", ["[{", json.dumps({"rules": 1}), json.dumps([{"name": "bad", "when": {}}])])
+def test_engine_ignores_malformed_rules_file(tmp_path, monkeypatch, content):
+    path = tmp_path / "rules.json"
+    path.write_text(content)
+    monkeypatch.setenv(alerts.ALERT_RULES_ENV, str(path))
+    with patch("jupyterlab_nvdashboard.apps.alerts.app_log") as log:
+        engine = alerts.from_environment()
+
+    assert engine.rules == []
+    log.error.assert_called_once()
+
+
+def test_engine_ignores_missing_rules_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(alerts.ALERT_RULES_ENV, str(tmp_path / "missing.json"))
+    assert alerts.from_environment().rules == []
+
+
+def test_alerts_handler(handler_args):
+    engine = AlertEngine(parse_rules([MEMORY_RULE]))
+    engine.on_sample("gpu_usage", memory_sample(0, [99]))
+    engine.on_sample("gpu_usage", memory_sample(120_000, [99]))
+
+    handler = AlertsHandler(*handler_args, engine=engine)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.get_argument = MagicMock(return_value="0")
+    handler.get()
+
+    response = json.loads(handler.finish.call_args[0][0])
+    assert response["rules"][0]["name"] == "gpu-memory-high"
+    assert [event["state"] for event in response["active"]] == ["firing"]
+    assert [event["id"] for event in response["events"]] == [1]
+
+    handler.get_argument = MagicMock(return_value="latest")
+    with pytest.raises(tornado.web.HTTPError) as error:
+        handler.get()
+    assert error.value.status_code == 400
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import contextlib
+import json
+import pytest
+import pynvml
+
+from jupyterlab_nvdashboard.apps import backends, gpu
+from jupyterlab_nvdashboard.apps.backends import ReplayNVML, SyntheticNVML, load_backend, record_trace
+
+
+@pytest.fixture
+def use_backend(monkeypatch):
+    def use(nvml):
+        monkeypatch.setattr(gpu, "pynvml", nvml)
+        for name in [
+            "ngpus",
+            "gpu_handles",
+            "total_memory",
+            "devices",
+            "device_names",
+            "nvlink_ver",
+            "nvlink_links",
+            "max_bw",
+            "max_link_bw",
+            "pci_gen",
+            "pci_width",
+            "pci_counters",
+            "status",
+        ]:
+            monkeypatch.setattr(gpu, name, None, raising=False)
+        monkeypatch.setattr(gpu, "_snapshot", None)
+        # Failed discovery is left for the test to retry
+        with contextlib.suppress(pynvml.NVMLError):
+            gpu.init_devices()
+        return nvml
+
+    return use
+
+
+def test_load_backend(monkeypatch):
+    assert load_backend("pynvml") is pynvml
+    nvml = load_backend("synthetic:ngpus=4,nvlinks=0,waveform=square")
+    assert isinstance(nvml, SyntheticNVML)
+    assert nvml.nvmlDeviceGetCount() == 4
+    assert nvml.nvlinks == 0
+
+    monkeypatch.setenv(backends.BACKEND_ENV, "synthetic")
+    assert isinstance(load_backend(), SyntheticNVML)
+
+    with pytest.raises(ValueError, match="Unknown NVDASHBOARD_NVML_BACKEND"):
+        load_backend("cuda")
+    with pytest.raises(ValueError, match="Unknown waveform"):
+        load_backend("synthetic:waveform=triangle")
+
+
+def test_synthetic_backend_serves_gpu_metrics(use_backend):
+    use_backend(SyntheticNVML(ngpus=4, nvlinks=2, memory=16, pcie_gen=5, pcie_width=8))
+    assert gpu.ngpus == 4
+    assert gpu.total_memory == [16 * 2**30] * 4
+    assert (gpu.pci_gen, gpu.pci_width) == (5, 8)
+    assert gpu.nvlink_ver == 4
+    # Two links of 25 GB/s, split between RX and TX
+    assert gpu.max_bw == 25_000 * 1024**2
+    assert gpu.max_link_bw == 25_000 * 1024**2 / 2
+    assert gpu.nvlink_links == [0, 1]
+    assert gpu.pci_counters
+
+    stats = gpu.collect_gpu_resource()
+    assert len(stats["gpu_utilization_individual"]) == 4
+    assert all(0 <= utilization <= 100 for utilization in stats["gpu_utilization_individual"])
+    assert gpu.PCIStatsCollector()()["max_rxtx_tp"] == 8 * gpu.PCI_LANE_BANDWIDTH[5]
+    nvlink = gpu.NVLinkThroughputCollector()()
+    assert len(nvlink["nvlink_rx"]) == 4
+    assert len(nvlink["nvlink_rx_links"]) == 8
+
+
+def test_synthetic_backend_without_nvlink(use_backend):
+    nvml = use_backend(SyntheticNVML(ngpus=2, nvlinks=0, pcie_counters=False))
+    assert gpu.nvlink_ver is None
+    assert gpu.nvlink_links == []
+    # PCIe throughput falls back to NVML's estimate
+    assert not gpu.pci_counters
+    assert gpu.PCIStatsCollector()()["pci_tx"] == gpu.get_snapshot().pci_tx
+    with pytest.raises(pynvml.NVMLError_NotSupported):
+        nvml.nvmlDeviceGetFanSpeed(0)
+
+
+def test_synthetic_nvlink_counters_increase(use_backend):
+    nvml = use_backend(SyntheticNVML(ngpus=2, nvlinks=2, waveform="constant"))
+    fields = [(pynvml.NVML_FI_DEV_NVLINK_THROUGHPUT_DATA_RX, link) for link in range(3)]
+    first = [value.value.ullVal for value in nvml.nvmlDeviceGetFieldValues(0, fields)]
+    nvml.counters_updated[0] -= 1
+    second = [value.value.ullVal for value in nvml.nvmlDeviceGetFieldValues(0, fields)]
+    assert second[0] > first[0]
+    assert second[1] > first[1]
+    # Inactive links never carry traffic
+    assert first[2] == second[2] == 0
+
+
+def test_record_and_replay_trace(use_backend, tmp_path):
+    use_backend(SyntheticNVML(ngpus=2, nvlinks=2, pcie_gen=3))
+    path = tmp_path / "trace.jsonl"
+    record_trace(path, duration=0, interval=0)
+    with open(path) as f:
+        header, frame = [json.loads(line) for line in f]
+    assert header["ngpus"] == 2
+    assert header["nvlink_speed"][:3] == [25_000, 25_000, 0]
+
+    use_backend(ReplayNVML(path))
+    assert gpu.ngpus == 2
+    assert gpu.pci_gen == 3
+    assert gpu.nvlink_ver == 4
+    snapshot = gpu.DeviceSnapshot()
+    assert snapshot.utilization == frame["utilization"]
+    assert snapshot.memory_used == frame["memory_used"]
+    assert snapshot.nvlink_throughput == frame["nvlink_throughput"]
+
+
+class FlakyNVML(SyntheticNVML):
+    """Synthetic backend whose initialization fails a number of times first."""
+
+    def __init__(self, failures, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+
+    def nvmlInit(self):
+        if self.failures:
+            self.failures -= 1
+            raise pynvml.NVMLError(pynvml.NVML_ERROR_UNKNOWN)
+        super().nvmlInit()
+
+
+def test_discovery_retries_failed_nvml(use_backend, monkeypatch):
+    monkeypatch.setattr(gpu, "DISCOVERY_RETRY", 0)
+    nvml = use_backend(FlakyNVML(failures=3, ngpus=2, nvlinks=0))
+    assert gpu.status == gpu.FAILED
+
+    with pytest.raises(pynvml.NVMLError):
+        gpu.init_devices()
+    assert gpu.ngpus == 0
+    assert not gpu.ready()
+
+    asyncio.run(gpu.discover_devices())
+    assert nvml.failures == 0
+    assert gpu.ready()
+    assert gpu.ngpus == 2
@@ -3,9 +3,18 @@
 
 import json
 import pytest
+from concurrent.futures import Future
+from typing import NamedTuple
 from unittest.mock import MagicMock
 
-from jupyterlab_nvdashboard.apps.cpu import CPUResourceWebSocketHandler
+from jupyterlab_nvdashboard.apps import wire
+from jupyterlab_nvdashboard.apps.cpu import (
+    CPUResourceWebSocketHandler,
+    HostResourceCollector,
+    HostResourceWebSocketHandler,
+    parse_cpulist,
+)
+from jupyterlab_nvdashboard.apps.utils import HEARTBEAT_INTERVAL, MAX_PENDING_BYTES
 
 
 @pytest.fixture
@@ -20,7 +29,7 @@ def mock_handler(monkeypatch):
 
 def test_cpu_resource_handler(mock_handler, handler_args):
     handler = CPUResourceWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "time" in data
@@ -30,3 +39,109 @@ def test_cpu_resource_handler(mock_handler, handler_args):
     assert "disk_write" in data
     assert "network_read" in data
     assert "network_write" in data
+
+
+def test_cpu_resource_handler_binary(mock_handler, handler_args):
+    handler = CPUResourceWebSocketHandler(*handler_args)
+    handler.wire_format = wire.BINARY
+    handler.send_data(handler.sampler.collect())
+    handler.send_data(handler.sampler.collect())
+
+    schema_call, frame_call, second_frame_call = mock_handler.call_args_list
+    fields = json.loads(schema_call.args[0])["schema"]
+    assert fields[0][0] == "time"
+    assert frame_call.kwargs == {"binary": True}
+    assert len(frame_call.args[0]) == 8 * len(fields)
+    assert second_frame_call.kwargs == {"binary": True}
+
+
+def test_cpu_resource_handler_drops_frames_while_lagging(mock_handler, handler_args):
+    handler = CPUResourceWebSocketHandler(*handler_args)
+    handler.pending_bytes = MAX_PENDING_BYTES + 1
+    handler.send_data(handler.sampler.collect())
+
+    mock_handler.assert_not_called()
+    assert handler.dropped_frames == 1
+
+
+def test_cpu_resource_handler_releases_flushed_bytes(mock_handler, handler_args):
+    flushed = Future()
+    mock_handler.return_value = flushed
+    handler = CPUResourceWebSocketHandler(*handler_args)
+    handler.send_data(handler.sampler.collect())
+    assert handler.pending_bytes == len(mock_handler.call_args.args[0])
+
+    flushed.set_result(None)
+    assert handler.pending_bytes == 0
+
+
+def test_cpu_resource_handler_heartbeat_when_hidden(mock_handler, handler_args):
+    handler = CPUResourceWebSocketHandler(*handler_args)
+    handler.sampler = MagicMock()
+    handler.update_frequency = 1000
+
+    handler.on_message(json.dumps({"visible": False}))
+    handler.sampler.subscribe.assert_called_with(handler.send_data, HEARTBEAT_INTERVAL)
+
+    handler.on_message(json.dumps({"visible": True}))
+    handler.sampler.subscribe.assert_called_with(handler.send_data, 1000)
+
+
+def test_host_resource_handler(mock_handler, handler_args):
+    handler = HostResourceWebSocketHandler(*handler_args)
+    handler.send_data(handler.sampler.collect())
+    args, _ = mock_handler.call_args
+    data = json.loads(args[0])
+    assert len(data["cpu_utilization"]) >= 1
+    assert len(data["numa_utilization"]) == len(data["numa_cpus"])
+    assert len(data["disk_read"]) == len(data["disks"])
+    assert len(data["network_write"]) == len(data["nics"])
+
+
+def test_parse_cpulist():
+    assert parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpulist("") == []
+
+
+class CPUTimes(NamedTuple):
+    user: float
+    system: float
+    idle: float
+    iowait: float
+
+
+class DiskIO(NamedTuple):
+    read_bytes: int
+    write_bytes: int
+
+
+class NetIO(NamedTuple):
+    bytes_sent: int
+    bytes_recv: int
+
+
+def test_host_resource_rates(monkeypatch):
+    readings = [
+        (0.0, [CPUTimes(0, 0, 0, 0), CPUTimes(0, 0, 0, 0)], DiskIO(0, 0), NetIO(0, 0)),
+        (2.0, [CPUTimes(1, 0, 1, 0), CPUTimes(0, 0, 1, 1)], DiskIO(4096, 0), NetIO(200, 100)),
+    ]
+    collector = HostResourceCollector()
+    collector.nodes = {0: "0", 1: "1"}
+    collector.node_cpus = [[0], [1]]
+
+    for monotonic, cores, disk, nic in readings:
+        monkeypatch.setattr("jupyterlab_nvdashboard.apps.cpu.time.monotonic", lambda monotonic=monotonic: monotonic)
+        monkeypatch.setattr("psutil.cpu_times", lambda percpu, cores=cores: cores)
+        monkeypatch.setattr("psutil.disk_io_counters", lambda perdisk, disk=disk: {"nvme0n1": disk})
+        monkeypatch.setattr("psutil.net_io_counters", lambda pernic, nic=nic: {"lo": nic, "eth0": nic})
+        monkeypatch.setattr("jupyterlab_nvdashboard.apps.cpu._is_disk", lambda name: True)
+        stats = collector()
+
+    assert stats["cpu_utilization"] == [50, 0]
+    assert stats["numa_utilization"] == [50, 0]
+    assert stats["disks"] == ["nvme0n1"]
+    assert stats["disk_read"] == [2048]
+    # Loopback traffic never leaves the host
+    assert stats["nics"] == ["eth0"]
+    assert stats["network_read"] == [50]
+    assert stats["network_write"] == [100]
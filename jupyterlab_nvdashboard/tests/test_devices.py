@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+
+
+@pytest.fixture
+def synthetic_gpus(monkeypatch):
+    monkeypatch.delenv(gpu.CUDA_VISIBLE_DEVICES, raising=False)
+    monkeypatch.delenv(gpu.NVIDIA_VISIBLE_DEVICES, raising=False)
+
+    def use(**kwargs):
+        nvml = SyntheticNVML(nvlinks=0, waveform="constant", **kwargs)
+        monkeypatch.setattr(gpu, "pynvml", nvml)
+        for name in [
+            "ngpus",
+            "gpu_handles",
+            "total_memory",
+            "devices",
+            "device_names",
+            "nvlink_ver",
+            "nvlink_links",
+            "max_bw",
+            "max_link_bw",
+            "pci_gen",
+            "pci_width",
+            "pci_counters",
+            "status",
+        ]:
+            monkeypatch.setattr(gpu, name, None, raising=False)
+        monkeypatch.setattr(gpu, "_snapshot", None)
+        gpu.init_devices()
+        return nvml
+
+    return use
+
+
+def test_visible_devices():
+    assert gpu.visible_devices({}) is None
+    assert gpu.visible_devices({"CUDA_VISIBLE_DEVICES": "1, GPU-5e1f"}) == ["1", "GPU-5e1f"]
+    assert gpu.visible_devices({"CUDA_VISIBLE_DEVICES": ""}) == [""]
+    # The container runtime already limits the GPUs NVML sees
+    assert gpu.visible_devices({"NVIDIA_VISIBLE_DEVICES": "all"}) is None
+    assert gpu.visible_devices({"NVIDIA_VISIBLE_DEVICES": "0,1"}) is None
+    assert gpu.visible_devices({"NVIDIA_VISIBLE_DEVICES": "MIG-5e1f,GPU-5e1f"}) == ["MIG-5e1f", "GPU-5e1f"]
+    # CUDA's own variable takes precedence
+    assert gpu.visible_devices({"CUDA_VISIBLE_DEVICES": "0", "NVIDIA_VISIBLE_DEVICES": "GPU-5e1f"}) == ["0"]
+
+
+def test_mig_devices(synthetic_gpus):
+    synthetic_gpus(ngpus=2, memory=80, mig="3g.40gb+2g.20gb")
+    assert gpu.ngpus == 2
+    assert gpu.device_names == [
+        "GPU 0 MIG 0 (3g.40gb)",
+        "GPU 0 MIG 1 (2g.20gb)",
+        "GPU 1 MIG 0 (3g.40gb)",
+        "GPU 1 MIG 1 (2g.20gb)",
+    ]
+
+    usage = gpu.collect_gpu_usage()
+    assert usage["total_memory"] == [40 * 2**30, 20 * 2**30] * 2
+    # Memory of each MIG device, not of the whole GPU
+    assert usage["memory_usage"] == [int(0.5 * 40 * 2**30), int(0.5 * 20 * 2**30)] * 2
+    # Without GPM, MIG devices report the utilization of their GPU
+    assert gpu.collect_gpu_utilization()["gpu_utilization"] == [50] * 4
+    resource = gpu.collect_gpu_resource()
+    assert resource["gpu_memory_total"] == 50
+
+
+def test_cuda_visible_devices(synthetic_gpus, monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "2,0")
+    synthetic_gpus(ngpus=4)
+    # Numbered as CUDA programs see them
+    assert gpu.gpu_handles == [2, 0]
+    assert gpu.device_names == ["GPU 0", "GPU 1"]
+
+    # CUDA ignores the devices following an invalid one
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "1,7,2")
+    synthetic_gpus(ngpus=4)
+    assert gpu.gpu_handles == [1]
+
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "-1")
+    synthetic_gpus(ngpus=4)
+    assert gpu.ngpus == 0
+    assert gpu.collect_gpu_resource()["gpu_utilization_total"] == 0
+
+
+def test_visible_mig_device(synthetic_gpus, monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "MIG-5e1f0001-0000-0000-0000-000000000001")
+    synthetic_gpus(ngpus=2, mig="3g.40gb+2g.20gb")
+    assert gpu.gpu_handles == [1]
+    assert gpu.device_names == ["GPU 0 MIG 1 (2g.20gb)"]
+    assert gpu.collect_gpu_usage()["total_memory"] == [20 * 2**30]
+
+    # Older drivers name MIG devices by GPU UUID and instance IDs
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "MIG-GPU-5e1f0000-0000-0000-0000-000000000000/1/0")
+    synthetic_gpus(ngpus=2, mig="3g.40gb+2g.20gb")
+    assert gpu.device_names == ["GPU 0 MIG 0 (3g.40gb)"]
+
+
+def test_mig_reconfiguration(synthetic_gpus, monkeypatch):
+    nvml = synthetic_gpus(ngpus=1, mig="7g.80gb")
+    assert gpu.device_names == ["GPU 0 MIG 0 (7g.80gb)"]
+
+    # The layout is cached until a reconfiguration event arrives
+    nvml.mig_profiles = ["3g.40gb", "3g.40gb"]
+    gpu.get_snapshot(max_age=0)
+    assert gpu.device_names == ["GPU 0 MIG 0 (7g.80gb)"]
+
+    monkeypatch.setattr(gpu, "_mig_reconfigured", lambda: True)
+    gpu.get_snapshot(max_age=0)
+    assert gpu.device_names == ["GPU 0 MIG 0 (3g.40gb)", "GPU 0 MIG 1 (3g.40gb)"]
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import json
+import pytest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps import diagnostics, wire
+from jupyterlab_nvdashboard.apps.cpu import CPUResourceWebSocketHandler
+from jupyterlab_nvdashboard.apps.diagnostics import Histogram, LoopLagMonitor
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.apps.utils import MAX_PENDING_BYTES
+from jupyterlab_nvdashboard.handlers import DiagnosticsHandler
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert histogram.summary()["p99_ms"] == 0.0
+    for _ in range(98):
+        histogram.observe(0.001)
+    histogram.observe(0.1)
+    histogram.observe(5.0)
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["max_ms"] == 5000
+    # Quantiles are the upper bound of their bucket
+    assert 1 <= summary["p50_ms"] < 2
+    assert 100 <= summary["p99_ms"] < 200
+    assert histogram.quantile(1.0) == 5.0
+
+
+def test_sampler_stats():
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        sampler = Sampler("test_diagnostics", MagicMock(side_effect=[{"value": 1}, RuntimeError]))
+        sampler.subscribe(MagicMock(), 1000)
+
+    async def tick():
+        await sampler.tick()
+
+    asyncio.run(tick())
+    asyncio.run(tick())
+    sampler.encode(sampler.latest, wire.encode_json)
+    sampler.encode(sampler.latest, wire.encode_json)
+
+    stats = diagnostics.report()["samplers"]["test_diagnostics"]
+    assert (stats["samples"], stats["errors"], stats["subscribers"]) == (1, 1, 1)
+    assert stats["collect"]["count"] == 2
+    assert stats["publish"]["count"] == 1
+    # Encodings are cached, so only timed once per sample
+    assert stats["encode"]["count"] == 1
+
+
+@pytest.fixture
+def connection(monkeypatch, handler_args):
+    monkeypatch.setattr(diagnostics, "connections", {})
+    write_message = MagicMock()
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.cpu.CustomWebSocketHandler.write_message", write_message)
+    handler = CPUResourceWebSocketHandler(*handler_args)
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.set_nodelay = MagicMock()
+    handler.sampler = MagicMock(is_ready=True)
+    handler.sampler.name = "cpu_resource"
+    handler.open()
+    return handler, write_message
+
+
+def test_connection_stats(connection):
+    handler, write_message = connection
+    flushed = Future()
+    write_message.return_value = flushed
+    handler.send_data({"time": 0})
+    flushed.set_result(None)
+    handler.pending_bytes = MAX_PENDING_BYTES + 1
+    handler.send_data({"time": 1})
+
+    stats = diagnostics.connections["cpu_resource"]
+    assert (stats.clients, stats.frames, stats.dropped_frames) == (1, 1, 1)
+    assert stats.bytes == len(write_message.call_args.args[0])
+    assert stats.flush.count == 1
+
+    handler.on_close()
+    handler.on_close()
+    assert stats.clients == 0
+
+
+def test_loop_lag_monitor():
+    monitor = LoopLagMonitor(interval=0.01)
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.015)
+        # Block the event loop past the next check
+        blocked_until = asyncio.get_running_loop().time() + 0.05
+        while asyncio.get_running_loop().time() < blocked_until:
+            pass
+        await asyncio.sleep(0.001)
+        monitor.stop()
+
+    asyncio.run(run())
+    assert monitor.lag.count >= 2
+    assert monitor.lag.max >= 0.03
+
+
+def test_diagnostics_handler(handler_args):
+    handler = DiagnosticsHandler(*handler_args)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.get()
+
+    response = json.loads(handler.finish.call_args[0][0])
+    assert {"event_loop", "executors", "samplers", "connections"} <= set(response)
+    assert "cpu_resource" in response["samplers"]
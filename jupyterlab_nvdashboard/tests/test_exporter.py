@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps import exporter, gpu
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.handlers import MetricsHandler
+
+FAMILIES = [
+    ("utilization", "test_utilization_percent", "gauge", "Utilization."),
+    ("reads", "test_read_bytes", "counter", "Data read."),
+]
+
+
+@pytest.fixture
+def sampler(monkeypatch):
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        sampler = Sampler("test_exporter", MagicMock())
+    renderer = exporter.Renderer(FAMILIES)
+    monkeypatch.setitem(exporter.renderers, "test_exporter", renderer)
+    return sampler
+
+
+def keep_sampling(sampler, monkeypatch):
+    keeper = exporter.KeepSampling(sampler)
+    monkeypatch.setitem(exporter.keepers, "test_exporter", keeper)
+    sampler.subscribers[keeper] = [exporter.SCRAPE_INTERVAL, 0.0]
+
+
+def test_renderer_formats_families():
+    text = exporter.Renderer(FAMILIES)({"utilization": [10, 20], "reads": 1024, "time": 0})
+    assert text.splitlines() == [
+        "# TYPE test_utilization_percent gauge",
+        "# HELP test_utilization_percent Utilization.",
+        'test_utilization_percent{gpu="0"} 10',
+        'test_utilization_percent{gpu="1"} 20',
+        "# TYPE test_read_bytes counter",
+        "# HELP test_read_bytes Data read.",
+        "test_read_bytes_total 1024",
+    ]
+
+
+def test_renderer_labels_mig_devices(monkeypatch):
+    devices = [gpu.Device(0, "gpu0", "GPU-0"), gpu.Device(1, "mig0", "MIG-0"), gpu.Device(1, "mig1", "MIG-1")]
+    devices[1].mig_index, devices[2].mig_index = 0, 1
+    monkeypatch.setattr(gpu, "devices", devices)
+
+    text = exporter.Renderer(FAMILIES[:1], per_device=True)({"utilization": [10, 20, 30]})
+    assert text.splitlines()[2:] == [
+        'test_utilization_percent{gpu="0"} 10',
+        'test_utilization_percent{gpu="1",mig_instance="0"} 20',
+        'test_utilization_percent{gpu="1",mig_instance="1"} 30',
+    ]
+    # Per-GPU metrics keep one series per GPU
+    text = exporter.Renderer(FAMILIES[:1])({"utilization": [10, 20]})
+    assert text.splitlines()[2:] == ['test_utilization_percent{gpu="0"} 10', 'test_utilization_percent{gpu="1"} 20']
+
+
+def test_render_starts_sampler(sampler):
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        assert exporter.render(["test_exporter"]) == "# EOF\n"
+    assert sampler.subscribers[exporter.keepers["test_exporter"]][0] == exporter.SCRAPE_INTERVAL
+
+
+def test_render_stops_sampler_after_scrapes_stop(sampler, monkeypatch):
+    monkeypatch.setattr(exporter, "keepers", {})
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        exporter.render(["test_exporter"])
+        keeper = exporter.keepers["test_exporter"]
+        keeper({})
+        assert keeper in sampler.subscribers
+
+        keeper.last_scrape -= exporter.SCRAPE_IDLE + 1
+        keeper({})
+        assert not sampler.subscribers
+        # History keeps being recorded for the grace period only
+        assert sampler.idle_since is not None
+
+        # The next scrape starts sampling again
+        exporter.render(["test_exporter"])
+    assert exporter.keepers["test_exporter"] in sampler.subscribers
+
+
+def test_render_is_cached_per_sample(sampler, monkeypatch):
+    renderer = MagicMock(return_value="test 1\n")
+    monkeypatch.setitem(exporter.renderers, "test_exporter", renderer)
+    keep_sampling(sampler, monkeypatch)
+    sampler.latest = {"utilization": 1}
+
+    assert exporter.render(["test_exporter"]) == "test 1\n# EOF\n"
+    assert exporter.render(["test_exporter"]) == "test 1\n# EOF\n"
+    renderer.assert_called_once_with(sampler.latest)
+
+
+def test_metrics_handler(handler_args, sampler, monkeypatch):
+    keep_sampling(sampler, monkeypatch)
+    sampler.latest = {"utilization": 50, "reads": 0}
+    handler = MetricsHandler(*handler_args, channels=["test_exporter"])
+    handler.finish = MagicMock()
+    handler.set_header = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.get()
+
+    handler.set_header.assert_called_with("Content-Type", exporter.CONTENT_TYPE)
+    text = handler.finish.call_args[0][0]
+    assert "test_utilization_percent 50\n" in text
+    assert text.endswith("# EOF\n")
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import tornado
+from tornado.testing import bind_unused_port
+from tornado.websocket import WebSocketHandler
+
+from jupyterlab_nvdashboard.apps import federation
+from jupyterlab_nvdashboard.apps.federation import ClusterCollector, Federation, PeerNode, parse_peers
+from jupyterlab_nvdashboard.handlers import ClusterHandler
+
+GPU_RESOURCE = {"gpu_utilization_total": 50, "gpu_utilization_individual": [40, 60]}
+
+
+class FakeStreamHandler(WebSocketHandler):
+    """Stream endpoint of a peer, dropping its first connection after one frame."""
+
+    def initialize(self, state):
+        self.state = state
+
+    def open(self):
+        self.state["headers"].append(self.request.headers.get("Authorization"))
+        self.write_message(json.dumps({"status": "connected", "channels": ["gpu_resource", "gpu_processes"]}))
+
+    def on_message(self, message):
+        self.state["subscriptions"].append(json.loads(message))
+        self.write_message(json.dumps({"time": 0, "channels": {"gpu_resource": GPU_RESOURCE}}))
+        if len(self.state["subscriptions"]) == 1:
+            self.close()
+
+
+def test_peer_streams_and_reconnects(monkeypatch):
+    monkeypatch.setattr(federation, "RECONNECT_DELAY", 0.01)
+    state = {"headers": [], "subscriptions": []}
+
+    async def run():
+        sock, port = bind_unused_port()
+        app = tornado.web.Application([("/nvdashboard/stream", FakeStreamHandler, {"state": state})])
+        server = tornado.httpserver.HTTPServer(app)
+        server.add_sockets([sock])
+        peer = PeerNode("node1", f"http://127.0.0.1:{port}/", "abc")
+        task = asyncio.ensure_future(peer.run())
+        for _ in range(500):
+            if len(state["subscriptions"]) >= 2 and peer.status == federation.CONNECTED:
+                break
+            await asyncio.sleep(0.01)
+        peer.stop()
+        await asyncio.wait_for(task, 5)
+        server.stop()
+        return peer
+
+    peer = asyncio.run(run())
+    assert state["headers"][:2] == ["token abc", "token abc"]
+    # Only the channels the peer serves are subscribed to
+    assert state["subscriptions"][-1] == {"channels": {"gpu_resource": federation.NODE_INTERVAL}}
+    assert peer.latest == {"gpu_resource": GPU_RESOURCE}
+
+
+def test_cluster_collector_merges_nodes():
+    nodes = [
+        SimpleNamespace(
+            name="node1",
+            status=federation.CONNECTED,
+            latest={
+                "gpu_resource": GPU_RESOURCE,
+                "gpu_usage": {"memory_usage": [1, 2], "total_memory": [10, 10]},
+                "cpu_resource": {"cpu_utilization": 5, "memory_usage": 100},
+            },
+        ),
+        SimpleNamespace(name="node2", status=federation.STALE, latest={"gpu_resource": GPU_RESOURCE}),
+        SimpleNamespace(
+            name="node3",
+            status=federation.CONNECTED,
+            latest={"gpu_resource": {"gpu_utilization_total": 100, "gpu_utilization_individual": [100]}},
+        ),
+    ]
+    sample = ClusterCollector(nodes)()
+
+    assert sample["nodes"] == ["node1", "node2", "node3"]
+    assert sample["node_status"] == ["connected", "stale", "connected"]
+    assert sample["node_gpus"] == [2, 0, 1]
+    assert sample["gpu_utilization"] == [40, 60, 100]
+    # Memory of nodes that did not report it is zero
+    assert sample["gpu_memory_used"] == [1, 2, 0]
+    assert sample["gpu_utilization_total"] == pytest.approx(200 / 3)
+    assert sample["gpu_memory_total_total"] == 20
+    assert sample["node_cpu_utilization"] == [5, 0, 0]
+
+
+def test_parse_peers():
+    peers = parse_peers("http://node1:8888/?token=abc, https://node2:8888/lab/", "shared")
+    assert [(peer.name, peer.url, peer.token) for peer in peers] == [
+        ("node1:8888", "http://node1:8888/", "abc"),
+        ("node2:8888", "https://node2:8888/lab/", "shared"),
+    ]
+    assert peers[1].stream_url == "wss://node2:8888/lab/nvdashboard/stream"
+
+    with pytest.raises(ValueError, match="Invalid"):
+        parse_peers("node1:8888")
+    with pytest.raises(ValueError, match="twice"):
+        parse_peers("http://node1:8888/,http://node1:8888/?token=abc")
+
+
+@pytest.mark.parametrize("spec", ["node1:8888", "http://node1:8888/,http://node1:8888/"])
+def test_malformed_peers_disable_federation(monkeypatch, spec):
+    monkeypatch.setenv(federation.PEERS_ENV, spec)
+    with patch("jupyterlab_nvdashboard.apps.federation.app_log") as log:
+        assert federation.from_environment() is None
+    log.error.assert_called_once()
+
+    monkeypatch.setenv(federation.PEERS_ENV, "http://node1:8888/")
+    assert federation.from_environment().nodes[-1].name == "node1:8888"
+
+
+def test_cluster_handler(handler_args):
+    cluster = Federation(parse_peers("http://node1:8888/"), local_name="local")
+    cluster.local.store("gpu_resource", GPU_RESOURCE)
+
+    handler = ClusterHandler(*handler_args, federation=cluster)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.get()
+    response = json.loads(handler.finish.call_args[0][0])
+    assert [(node["name"], node["status"]) for node in response["nodes"]] == [
+        ("local", "connected"),
+        ("node1:8888", "connecting"),
+    ]
+
+    handler.get("local")
+    (node,) = json.loads(handler.finish.call_args[0][0])["nodes"]
+    assert node["channels"] == {"gpu_resource": GPU_RESOURCE}
+
+    with pytest.raises(tornado.web.HTTPError):
+        handler.get("node2")
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import asyncio
 import json
+import threading
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from jupyterlab_nvdashboard.apps.gpu import (
     GPUUtilizationWebSocketHandler,
@@ -11,7 +13,12 @@ from jupyterlab_nvdashboard.apps.gpu import (
     GPUResourceWebSocketHandler,
     NVLinkThroughputWebSocketHandler,
     PCIStatsWebSocketHandler,
+    PCIStatsCollector,
+    DeviceSnapshot,
+    get_snapshot,
+    start_tick,
 )
+from jupyterlab_nvdashboard.apps.sampler import GPU, Clock, Sampler
 
 
 @pytest.fixture
@@ -26,7 +33,7 @@ def mock_handler(monkeypatch):
 
 def test_gpu_utilization_handler(mock_handler, handler_args):
     handler = GPUUtilizationWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "gpu_utilization" in data
@@ -34,7 +41,7 @@ def test_gpu_utilization_handler(mock_handler, handler_args):
 
 def test_gpu_usage_handler(mock_handler, handler_args):
     handler = GPUUsageWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "memory_usage" in data
@@ -43,7 +50,7 @@ def test_gpu_usage_handler(mock_handler, handler_args):
 
 def test_gpu_resource_handler(mock_handler, handler_args):
     handler = GPUResourceWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "time" in data
@@ -57,7 +64,7 @@ def test_gpu_resource_handler(mock_handler, handler_args):
 
 def test_nvlink_throughput_handler(mock_handler, handler_args):
     handler = NVLinkThroughputWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "nvlink_rx" in data
@@ -67,9 +74,100 @@ def test_nvlink_throughput_handler(mock_handler, handler_args):
 
 def test_pci_stats_handler(mock_handler, handler_args):
     handler = PCIStatsWebSocketHandler(*handler_args)
-    handler.send_data()
+    handler.send_data(handler.sampler.collect())
     args, _ = mock_handler.call_args
     data = json.loads(args[0])
     assert "pci_tx" in data
     assert "pci_rx" in data
     assert "max_rxtx_tp" in data
+
+
+@pytest.fixture
+def mock_nvml(monkeypatch):
+    mock = MagicMock()
+    mock.nvmlDeviceGetUtilizationRates.return_value.gpu = 50
+    mock.nvmlDeviceGetMemoryInfo.return_value.used = 1024
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.pynvml", mock)
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.gpu_handles", ["gpu0", "gpu1"])
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu._snapshot", None)
+    return mock
+
+
+def test_device_snapshot_reads_each_field_once(mock_nvml):
+    snapshot = DeviceSnapshot()
+    assert snapshot.utilization == [50, 50]
+    assert snapshot.utilization == [50, 50]
+    assert snapshot.memory_used == [1024, 1024]
+    assert mock_nvml.nvmlDeviceGetUtilizationRates.call_count == 2
+    assert mock_nvml.nvmlDeviceGetMemoryInfo.call_count == 2
+
+
+def test_device_snapshot_is_shared_within_max_age(mock_nvml):
+    assert get_snapshot(max_age=60) is get_snapshot(max_age=60)
+    assert get_snapshot(max_age=-1) is not get_snapshot(max_age=-1)
+
+
+def test_gpu_samplers_share_one_snapshot_per_tick(mock_nvml, monkeypatch):
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu._tick", 0)
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu._tick_lifetime", 0.0)
+    snapshots = []
+
+    def collect():
+        snapshots.append(get_snapshot())
+        return {"gpu_utilization": snapshots[-1].utilization}
+
+    clock = Clock(on_tick=start_tick)
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        metrics = [
+            Sampler(f"test_snapshot_tick_{index}", collect, history_interval=None, pool=GPU, clock=clock)
+            for index in range(5)
+        ]
+        for sampler in metrics:
+            sampler.subscribe(MagicMock(), 1000)
+
+    async def ticks():
+        for _ in range(2):
+            for state in clock.samplers.values():
+                state[1] -= 1
+            await asyncio.gather(*clock.tick())
+
+    asyncio.run(ticks())
+
+    assert len(snapshots) == 10
+    assert len({id(snapshot) for snapshot in snapshots}) == 2
+    assert mock_nvml.nvmlDeviceGetUtilizationRates.call_count == 2 * 2
+
+
+def test_device_snapshot_reads_outside_lock(mock_nvml):
+    release = threading.Event()
+    mock_nvml.nvmlDeviceGetUtilizationRates.side_effect = lambda handle: release.wait(5) and MagicMock(gpu=50)
+    snapshot = DeviceSnapshot()
+    hung = threading.Thread(target=lambda: snapshot.utilization)
+    hung.start()
+
+    # Other fields are read while the utilization read hangs
+    assert snapshot.memory_used == [1024, 1024]
+    release.set()
+    hung.join()
+    assert snapshot.utilization == [50, 50]
+    assert mock_nvml.nvmlDeviceGetUtilizationRates.call_count == 2
+
+
+@pytest.mark.parametrize(("pci_gen", "pci_width", "expected"), [(None, None, 0), (4, 16, 16 * 1969.0 * 1024**2)])
+def test_pci_stats_max_throughput(mock_nvml, monkeypatch, pci_gen, pci_width, expected):
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.pci_gen", pci_gen)
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.pci_width", pci_width)
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.pci_counters", False)
+    assert PCIStatsCollector()()["max_rxtx_tp"] == expected
+
+
+def test_handler_reports_initializing(mock_handler, handler_args, monkeypatch):
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.status", "initializing")
+    handler = GPUUtilizationWebSocketHandler(*handler_args)
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.set_nodelay = MagicMock()
+    monkeypatch.setattr(handler.sampler, "subscribe", MagicMock())
+
+    handler.open()
+    messages = [json.loads(args[0]) for args, _ in mock_handler.call_args_list]
+    assert messages == [{"status": "connected"}, {"status": "initializing"}]
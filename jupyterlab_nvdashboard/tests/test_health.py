@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+import pynvml
+
+from jupyterlab_nvdashboard.apps import gpu, health
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+
+
+@pytest.fixture
+def synthetic_gpus(monkeypatch):
+    def use(nvml):
+        monkeypatch.setattr(gpu, "pynvml", nvml)
+        for name in [
+            "ngpus",
+            "gpu_handles",
+            "devices",
+            "device_names",
+            "nvlink_links",
+            "nvlink_ver",
+            "max_bw",
+            "max_link_bw",
+            "status",
+        ]:
+            monkeypatch.setattr(gpu, name, None, raising=False)
+        monkeypatch.setattr(gpu, "_snapshot", None)
+        gpu.init_devices()
+        return nvml
+
+    return use
+
+
+def test_health_collector(synthetic_gpus):
+    # The first GPU is busy and power capped, the second idle
+    synthetic_gpus(SyntheticNVML(ngpus=2, nvlinks=0, waveform="square"))
+    sample = health.HealthCollector()()
+
+    assert sample["gpu_utilization"] == [100, 0]
+    assert sample["power"] == [700, 70]
+    assert sample["power_limit"] == [700, 700]
+    assert sample["sm_clock"] == [1584, 1980]
+    assert sample["max_sm_clock"] == [1980, 1980]
+    assert sample["temperature"] == [85, 35]
+    assert sample["ecc_dbe_volatile"] == [0, 0]
+    assert sample["throttle_reasons"] == [
+        pynvml.nvmlClocksThrottleReasonSwPowerCap,
+        pynvml.nvmlClocksThrottleReasonGpuIdle,
+    ]
+    # Idling does not count as throttling
+    assert sample["throttled"] == [1, 0]
+    # Fan speed and XID events are not supported by the synthetic GPUs
+    assert "fan_speed" not in sample
+    assert "xid_errors" not in sample
+
+
+class NoPowerFieldNVML(SyntheticNVML):
+    """Synthetic backend of a driver without the instant power field."""
+
+    def nvmlDeviceGetFieldValues(self, handle, fields):
+        values = super().nvmlDeviceGetFieldValues(handle, fields)
+        for value in values:
+            if value.fieldId == pynvml.NVML_FI_DEV_POWER_INSTANT:
+                value.nvmlReturn = pynvml.NVML_ERROR_NOT_SUPPORTED
+        return values
+
+
+def test_health_collector_falls_back_to_readings(synthetic_gpus):
+    synthetic_gpus(NoPowerFieldNVML(ngpus=1, nvlinks=0, waveform="constant"))
+    collector = health.HealthCollector()
+    collector()
+
+    assert ("field", "power") in collector.unsupported
+    # Power is then read one device at a time
+    assert collector()["power"] == [420]
+
+
+def test_health_collector_reads_slow_fields_less_often(synthetic_gpus, monkeypatch):
+    nvml = synthetic_gpus(SyntheticNVML(ngpus=1, nvlinks=0, waveform="constant"))
+    collector = health.HealthCollector(slow_interval=60)
+    collector()
+
+    calls = []
+    monkeypatch.setattr(nvml, "nvmlDeviceGetMaxClockInfo", lambda *args: calls.append(args) or 0)
+    collector()
+    assert calls == []
+
+    collector.slow_updated -= 60
+    assert collector()["max_sm_clock"] == [0]
+
+
+class XidEventsNVML(SyntheticNVML):
+    """Synthetic backend supporting XID events, tracking its event sets."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.event_sets = set()
+        self.created = 0
+
+    def nvmlEventSetCreate(self):
+        self.created += 1
+        self.event_sets.add(self.created)
+        return self.created
+
+    def nvmlEventSetFree(self, event_set):
+        self.event_sets.remove(event_set)
+
+    def nvmlDeviceRegisterEvents(self, handle, event_types, event_set):
+        pass
+
+    def nvmlEventSetWait(self, event_set, timeout):
+        raise pynvml.NVMLError(pynvml.NVML_ERROR_TIMEOUT)
+
+
+def test_xid_events_free_their_event_set(synthetic_gpus, monkeypatch):
+    nvml = synthetic_gpus(XidEventsNVML(ngpus=2, nvlinks=0, waveform="constant"))
+    xid = health.XidEvents()
+    assert xid.poll() == {"xid_errors": [0, 0], "last_xid": [0, 0]}
+
+    # Restarted when the number of GPUs changes
+    monkeypatch.setattr(gpu, "ngpus", 1)
+    xid.poll()
+    assert nvml.created == 2
+    assert nvml.event_sets == {2}
+
+    xid.stop()
+    assert nvml.event_sets == set()
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from jupyterlab_nvdashboard.apps.history import History
+
+
+def test_history_round_trips_samples():
+    history = History(capacity=4)
+    history.append({"cpu_utilization": 10, "gpu_utilization": [1, 2]}, 1000)
+
+    assert history.samples() == [{"time": 1000, "cpu_utilization": 10, "gpu_utilization": [1, 2]}]
+
+
+def test_history_overwrites_oldest_samples():
+    history = History(capacity=3)
+    for i in range(5):
+        history.append({"value": i}, i)
+
+    assert len(history) == 3
+    assert [sample["value"] for sample in history.samples()] == [2, 3, 4]
+
+
+def test_history_memory_is_preallocated():
+    history = History(capacity=10, tiers=[])
+    history.append({"value": 0, "per_gpu": [0, 0]}, 0)
+    nbytes = history.nbytes
+    for i in range(100):
+        history.append({"value": i, "per_gpu": [i, i]}, i)
+
+    assert history.nbytes == nbytes == 8 * 10 * 4
+
+
+def test_history_range_queries():
+    history = History(capacity=5)
+    for i in range(8):
+        history.append({"value": i}, i * 100)
+
+    assert [sample["time"] for sample in history.samples(start=400, end=600)] == [400, 500, 600]
+    assert [sample["time"] for sample in history.samples(limit=2)] == [600, 700]
+    assert [sample["time"] for sample in history.samples(start=0, limit=10)] == [300, 400, 500, 600, 700]
+
+
+def test_history_resets_when_layout_changes():
+    history = History(capacity=5)
+    history.append({"gpu_utilization": [1, 2]}, 0)
+    history.append({"gpu_utilization": [1, 2, 3]}, 1)
+
+    assert history.samples() == [{"time": 1, "gpu_utilization": [1, 2, 3]}]
+
+
+def test_history_skips_non_numeric_fields():
+    history = History(capacity=2)
+    history.append({"name": "gpu", "value": 1, "nested": [[1]]}, 0)
+
+    assert history.samples() == [{"time": 0, "value": 1}]
+
+
+def test_rollup_aggregates_buckets_incrementally():
+    history = History(capacity=100, tiers=[(10, 10)])
+    for t, value in enumerate([1, 5, 3, 0, 10, 20, 2, 4, 6, 8, 7, 7]):
+        history.append({"value": value, "per_gpu": [value, -value]}, t)
+
+    rollup = history.rollups[0]
+    # The bucket starting at 10 is still open and not yet stored
+    assert rollup.samples() == [
+        {
+            "time": 0,
+            "value": 5.9,
+            "per_gpu": [5.9, -5.9],
+            "min": {"value": 0, "per_gpu": [0, -20]},
+            "max": {"value": 20, "per_gpu": [20, 0]},
+        }
+    ]
+
+
+def test_history_query_picks_resolution_within_point_budget():
+    history = History(capacity=50, tiers=[(10, 100), (100, 100)])
+    for t in range(0, 1000, 2):
+        history.append({"value": t}, t)
+
+    # Raw samples only cover the last 100ms
+    assert history.query(start=950)["resolution"] == 0
+    assert len(history.query(start=950)["samples"]) == 25
+    # Older ranges fall back to rollups
+    assert history.query(start=500)["resolution"] == 10
+    assert history.query(start=0, points=20)["resolution"] == 100
+    assert len(history.query(start=0, points=20)["samples"]) == 9
+
+
+def test_history_query_without_budget_returns_raw_samples():
+    history = History(capacity=10, tiers=[(10, 10)])
+    history.append({"value": 1}, 0)
+
+    assert history.query() == {"resolution": 0, "samples": [{"time": 0, "value": 1}]}
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import pytest
+import tornado
+from unittest.mock import MagicMock
+
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.handlers import HistoryHandler
+
+
+@pytest.fixture
+def authenticated_handler(handler_args):
+    handler = HistoryHandler(*handler_args)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    handler.query = {}
+    handler.get_argument = MagicMock(side_effect=lambda name, default=None: handler.query.get(name, default))
+    return handler
+
+
+@pytest.fixture
+def sampler():
+    sampler = Sampler("test_history_handler", MagicMock())
+    for i in range(5):
+        sampler.history.append({"value": i}, i * 1000)
+    return sampler
+
+
+def test_history_handler_returns_samples(authenticated_handler, sampler):
+    authenticated_handler.get("test_history_handler")
+
+    response = json.loads(authenticated_handler.finish.call_args[0][0])
+    assert response["metric"] == "test_history_handler"
+    assert [sample["value"] for sample in response["samples"]] == [0, 1, 2, 3, 4]
+
+
+def test_history_handler_range_query(authenticated_handler, sampler):
+    authenticated_handler.query = {"start": "1000", "end": "3000", "limit": "2"}
+    authenticated_handler.get("test_history_handler")
+
+    response = json.loads(authenticated_handler.finish.call_args[0][0])
+    assert [sample["time"] for sample in response["samples"]] == [2000, 3000]
+
+
+def test_history_handler_unknown_metric(authenticated_handler):
+    with pytest.raises(tornado.web.HTTPError):
+        authenticated_handler.get("no_such_metric")
+
+
+def test_history_handler_point_budget(authenticated_handler, sampler):
+    authenticated_handler.query = {"start": "0", "points": "1"}
+    authenticated_handler.get("test_history_handler")
+
+    response = json.loads(authenticated_handler.finish.call_args[0][0])
+    assert response["resolution"] == 600_000
+    assert response["samples"] == []
+
+
+@pytest.mark.parametrize("query", [{"points": "abc"}, {"start": "yesterday"}, {"limit": "1.5"}])
+def test_history_handler_rejects_malformed_arguments(authenticated_handler, sampler, query):
+    authenticated_handler.query = query
+    with pytest.raises(tornado.web.HTTPError) as error:
+        authenticated_handler.get("test_history_handler")
+    assert error.value.status_code == 400
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import os
+import pytest
+import pynvml
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+from jupyterlab_nvdashboard.apps.processes import ProcessSampler
+
+
+@pytest.fixture
+def mock_nvml(monkeypatch):
+    mock = MagicMock()
+    mock.NVMLError_NotFound = pynvml.NVMLError_NotFound
+    mock.NVMLError_NotSupported = pynvml.NVMLError_NotSupported
+    mock.nvmlDeviceGetComputeRunningProcesses.return_value = [SimpleNamespace(pid=os.getpid(), usedGpuMemory=2**30)]
+    mock.nvmlDeviceGetGraphicsRunningProcesses.side_effect = pynvml.NVMLError_NotSupported
+    mock.nvmlDeviceGetProcessUtilization.return_value = [
+        SimpleNamespace(pid=os.getpid(), timeStamp=100, smUtil=40, memUtil=10)
+    ]
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.pynvml", mock)
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.gpu.devices", [gpu.Device(0, "gpu0", "GPU-0")])
+    return mock
+
+
+@pytest.fixture
+def sampler():
+    sampler = ProcessSampler("test_processes", history_interval=None)
+    # The test process stands in for a child of a kernel running this test
+    kernel = SimpleNamespace(provisioner=SimpleNamespace(pid=os.getppid()), kernel_name="python3")
+    kernel_manager = MagicMock()
+    kernel_manager.list_kernel_ids.return_value = ["kernel-1"]
+    kernel_manager.get_kernel.return_value = kernel
+    session_manager = MagicMock()
+    session_manager.list_sessions = AsyncMock(
+        return_value=[{"id": "session-1", "path": "analysis.ipynb", "kernel": {"id": "kernel-1"}}]
+    )
+    sampler.configure(kernel_manager, session_manager)
+    return sampler
+
+
+def test_processes_are_attributed_to_kernels(mock_nvml, sampler):
+    asyncio.run(sampler.refresh_kernels())
+    (process,) = sampler.collect()["processes"]
+
+    assert process["pid"] == os.getpid()
+    assert process["memory_used"] == 2**30
+    assert process["sm_utilization"] == 40
+    assert process["kernel_id"] == "kernel-1"
+    assert process["kernel_name"] == "python3"
+    assert process["path"] == "analysis.ipynb"
+
+
+def test_process_lookups_are_cached(mock_nvml, sampler):
+    sampler.collect()
+    sampler.process_info[os.getpid()] = ("cached", None, [os.getpid()])
+    assert sampler.collect()["processes"][0]["name"] == "cached"
+
+    # Processes that leave the GPU are forgotten
+    mock_nvml.nvmlDeviceGetComputeRunningProcesses.return_value = []
+    sampler.collect()
+    assert sampler.process_info == {}
+
+
+def test_process_utilization_since_last_sample(mock_nvml, sampler):
+    sampler.collect()
+    mock_nvml.nvmlDeviceGetProcessUtilization.side_effect = pynvml.NVMLError_NotFound
+
+    (process,) = sampler.collect()["processes"]
+    assert process["sm_utilization"] == 0
+    mock_nvml.nvmlDeviceGetProcessUtilization.assert_called_with("gpu0", 100)
+    assert process["kernel_id"] is None
+
+
+def test_processes_are_indexed_by_visible_device(mock_nvml, sampler, monkeypatch):
+    monkeypatch.setenv(gpu.CUDA_VISIBLE_DEVICES, "1,0")
+    monkeypatch.setattr(gpu, "pynvml", SyntheticNVML(ngpus=3, nvlinks=0, mig="3g.40gb+2g.20gb"))
+    for name in ["ngpus", "gpu_handles", "total_memory", "devices", "device_names", "status"]:
+        monkeypatch.setattr(gpu, name, None)
+    gpu.init_devices()
+    monkeypatch.setattr(gpu, "pynvml", mock_nvml)
+    # Processes on MIG device 1 of GPU 1 and MIG device 0 of GPU 0, by NVML index
+    pids = {(1, 1): 1, (0, 0): 2}
+    mock_nvml.nvmlDeviceGetComputeRunningProcesses.side_effect = lambda handle: (
+        [SimpleNamespace(pid=pids[handle], usedGpuMemory=None)] if handle in pids else []
+    )
+
+    processes = sampler.collect()["processes"]
+    assert gpu.device_names[1] == "GPU 0 MIG 1 (2g.20gb)"
+    assert [(process["gpu"], process["pid"]) for process in processes] == [(1, 1), (2, 2)]
+    queried = [call.args[0] for call in mock_nvml.nvmlDeviceGetComputeRunningProcesses.call_args_list]
+    assert queried == [(1, 0), (1, 1), (0, 0), (0, 1)]
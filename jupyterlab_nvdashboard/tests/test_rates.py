@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+from types import SimpleNamespace
+
+from jupyterlab_nvdashboard.apps import gpu
+from jupyterlab_nvdashboard.apps.rates import CounterRates
+
+
+def test_counter_rates_are_per_second():
+    rates = CounterRates()
+    assert list(rates.update([100, 200], timestamp=10.0)) == [0, 0]
+    assert list(rates.update([300, 200], timestamp=12.0)) == [100, 0]
+    # No time elapsed, or a different set of counters
+    assert list(rates.update([400, 300], timestamp=12.0)) == [0, 0]
+    assert list(rates.update([400, 300, 0], timestamp=13.0)) == [0, 0, 0]
+
+
+def test_counter_rates_handle_wraparound_and_resets():
+    rates = CounterRates(wrap=2**64)
+    rates.update([2**64 - 10, 1000], timestamp=0.0)
+    # The first counter wrapped around, the second was reset
+    assert list(rates.update([10, 5], timestamp=1.0)) == [20, 0]
+
+    rates = CounterRates()
+    rates.update([2**64 - 10], timestamp=0.0)
+    assert list(rates.update([10], timestamp=1.0)) == [0]
+
+
+def test_nvlink_rates_per_link(monkeypatch):
+    monkeypatch.setattr(gpu, "nvlink_links", [0, 3])
+    collector = gpu.NVLinkThroughputCollector()
+
+    def sample(monotonic, throughput):
+        snapshot = SimpleNamespace(monotonic=monotonic, nvlink_throughput=throughput)
+        monkeypatch.setattr(gpu, "get_snapshot", lambda: snapshot)
+        return collector()
+
+    # Two GPUs, each reporting RX for links 0 and 3 then TX, in KiB
+    first = sample(1.0, [[0, 0, 0, 0], [0, 0, 0, 0]])
+    assert first["nvlink_rx_links"] == [0, 0, 0, 0]
+    stats = sample(3.0, [[2, 4, 6, 8], [0, 2, 0, 0]])
+    assert stats["nvlink_links"] == [0, 3]
+    assert stats["nvlink_rx_links"] == [1024, 2048, 0, 1024]
+    assert stats["nvlink_tx_links"] == [3072, 4096, 0, 0]
+    assert stats["nvlink_rx"] == [3072, 1024]
+    assert stats["nvlink_tx"] == [7168, 0]
+    assert stats["nvlink_rx_total"] == [6144, 2048]
+
+
+def test_pci_rates_from_counters(monkeypatch):
+    monkeypatch.setattr(gpu, "pci_counters", True)
+    monkeypatch.setattr(gpu, "pci_gen", 4)
+    monkeypatch.setattr(gpu, "pci_width", 16)
+    collector = gpu.PCIStatsCollector()
+
+    def sample(monotonic, counters):
+        snapshot = SimpleNamespace(monotonic=monotonic, pci_counters=counters)
+        monkeypatch.setattr(gpu, "get_snapshot", lambda: snapshot)
+        return collector()
+
+    sample(0.0, [[1000, 2000]])
+    stats = sample(0.5, [[2000, 2500]])
+    assert stats["pci_tx"] == [2000]
+    assert stats["pci_rx"] == [1000]
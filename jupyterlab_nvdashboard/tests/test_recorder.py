@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import json
+import os
+import pytest
+import tornado
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps import gpu, wire
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+from jupyterlab_nvdashboard.apps.recorder import Recorder, Segment
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.handlers import RecordingHandler
+
+
+def rows(samples):
+    return [wire.encode_binary(sample) for sample in samples]
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = Recorder(str(tmp_path), retention=float("inf"))
+    yield recorder
+    recorder.close()
+
+
+def test_recorder_round_trip(recorder):
+    samples = [{"time": i * 1000, "load": [i, 2 * i], "memory": i} for i in range(10)]
+    recorder.write({"gpu": rows(samples)})
+    recorder.write({"gpu": rows([{"time": 10_000, "load": [10, 20], "memory": 10}])})
+
+    assert recorder.read("gpu") == [*samples, {"time": 10_000, "load": [10, 20], "memory": 10}]
+    assert [sample["time"] for sample in recorder.read("gpu", start=2000, end=4000)] == [2000, 3000, 4000]
+    assert [sample["time"] for sample in recorder.read("gpu", start=2000, limit=2)] == [9000, 10_000]
+    assert recorder.read("unknown") == []
+
+
+def test_recorder_rotates_segments(recorder):
+    recorder.segment_bytes = 100
+    recorder.write({"cpu": rows([{"time": i * 1000, "load": i} for i in range(20)])})
+    # Layout changes also start a new segment
+    recorder.write({"cpu": rows([{"time": 20_000, "load": 20, "disk": 1}])})
+
+    paths = recorder.segment_paths("cpu")
+    assert len(paths) > 2
+    assert os.path.basename(paths[0]) == "0.seg"
+    assert [sample["time"] for sample in recorder.read("cpu", start=9500, end=12_000)] == [10_000, 11_000, 12_000]
+    assert recorder.read("cpu", start=20_000) == [{"time": 20_000, "load": 20, "disk": 1}]
+
+
+def test_recorder_enforces_disk_budget(recorder):
+    recorder.segment_bytes = 100
+    recorder.max_bytes = 400
+    recorder.write({"cpu": rows([{"time": i * 1000, "load": i} for i in range(100)])})
+
+    total = sum(os.path.getsize(path) for path in recorder.segment_paths("cpu"))
+    assert total <= 400 + recorder.segment_bytes
+    assert recorder.read("cpu")[-1]["time"] == 99_000
+
+
+def test_segment_ignores_partial_rows(recorder):
+    recorder.write({"cpu": rows([{"time": 0, "load": 1}, {"time": 1000, "load": 2}])})
+    (path,) = recorder.segment_paths("cpu")
+    with open(path, "ab") as f:
+        f.write(b"\0" * 12)
+
+    with Segment(path) as segment:
+        assert segment.count == 2
+        assert segment.fields == [("time", None), ("load", None)]
+
+
+def test_recorder_stamps_samples_without_time(recorder, monkeypatch):
+    monkeypatch.setattr(gpu, "pynvml", SyntheticNVML(ngpus=2, nvlinks=0, waveform="constant"))
+    for name in ["ngpus", "gpu_handles", "devices", "device_names", "status"]:
+        monkeypatch.setattr(gpu, name, None, raising=False)
+    monkeypatch.setattr(gpu, "_snapshot", None)
+    gpu.init_devices()
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        recorder.start(["gpu_utilization"])
+        for _ in range(2):
+            recorder.record("gpu_utilization", gpu.collect_gpu_utilization())
+        recorder.stop()
+
+    samples = recorder.read("gpu_utilization")
+    assert [sample["gpu_utilization"] for sample in samples] == [[50, 50], [50, 50]]
+    assert samples[0]["time"] > 0
+
+
+def test_recording_handler(handler_args, recorder):
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"):
+        Sampler("test_recording", MagicMock())
+        recorder.start(["test_recording"])
+    recorder.write({"test_recording": rows([{"time": 0, "load": 1}, {"time": 1000, "load": 2}])})
+    handler = RecordingHandler(*handler_args, recorder=recorder)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+    query = {"start": "500"}
+    handler.get_argument = MagicMock(side_effect=lambda name, default=None: query.get(name, default))
+
+    asyncio.run(handler.get("test_recording"))
+    response = json.loads(handler.finish.call_args[0][0])
+    assert response["samples"] == [{"time": 1000, "load": 2}]
+
+    with pytest.raises(tornado.web.HTTPError):
+        asyncio.run(handler.get("not_recorded"))
+
+    query = {"limit": "all"}
+    with pytest.raises(tornado.web.HTTPError) as error:
+        asyncio.run(handler.get("test_recording"))
+    assert error.value.status_code == 400
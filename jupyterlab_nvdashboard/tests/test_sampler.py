@@ -0,0 +1,237 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps.sampler import GPU, HISTORY_INTERVAL, HOST, MAX_WORKERS, Clock, Sampler, samplers
+
+
+@pytest.fixture
+def mock_periodic_callback():
+    with patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback") as mock:
+        yield mock
+
+
+def run_tick(sampler):
+    """Run a single sampler tick to completion on a fresh event loop."""
+
+    async def tick():
+        task = sampler.tick()
+        if task is not None:
+            await task
+
+    asyncio.run(tick())
+
+
+def test_sampler_registers_itself(mock_periodic_callback):
+    sampler = Sampler("test_registry", MagicMock())
+    assert samplers["test_registry"] is sampler
+
+
+def test_sampler_collects_once_per_tick(mock_periodic_callback):
+    collect = MagicMock(return_value={"value": 1})
+    sampler = Sampler("test_fanout", collect)
+    first, second = MagicMock(), MagicMock()
+    sampler.subscribe(first, 1000)
+    sampler.subscribe(second, 1000)
+
+    run_tick(sampler)
+
+    collect.assert_called_once()
+    first.assert_called_once_with({"value": 1})
+    second.assert_called_once_with({"value": 1})
+    assert sampler.latest == {"value": 1}
+    assert sampler.history.samples()[0]["value"] == 1
+
+
+def test_sampler_ticks_at_fastest_interval(mock_periodic_callback):
+    sampler = Sampler("test_interval", MagicMock(), history_interval=None)
+    slow, fast = MagicMock(), MagicMock()
+
+    sampler.subscribe(slow, 1000)
+    assert sampler.interval == 1000
+    sampler.subscribe(fast, 100)
+    assert sampler.interval == 100
+    mock_periodic_callback.assert_called_with(sampler.tick, 100)
+
+    sampler.unsubscribe(fast)
+    assert sampler.interval == 1000
+    sampler.unsubscribe(slow)
+    assert sampler.interval is None
+    assert sampler.callback is None
+
+
+def test_sampler_min_interval(mock_periodic_callback):
+    sampler = Sampler("test_min_interval", MagicMock(), history_interval=None, min_interval=5000)
+
+    sampler.subscribe(MagicMock(), 100)
+    assert sampler.interval == 5000
+
+
+def test_sampler_downsamples_slow_subscribers(mock_periodic_callback):
+    sampler = Sampler("test_downsample", MagicMock(return_value={}))
+    slow, fast = MagicMock(), MagicMock()
+    sampler.subscribe(slow, 1000)
+    sampler.subscribe(fast, 100)
+
+    with patch("jupyterlab_nvdashboard.apps.sampler.time.monotonic") as monotonic:
+        for i in range(10):
+            monotonic.return_value = 1000 + i * 0.1
+            sampler.publish({})
+
+    assert fast.call_count == 10
+    assert slow.call_count == 1
+
+
+def test_sampler_isolates_failing_subscribers(mock_periodic_callback):
+    sampler = Sampler("test_isolation", MagicMock(return_value={}))
+    failing = MagicMock(side_effect=RuntimeError("closed"))
+    healthy = MagicMock()
+    sampler.subscribe(failing, 100)
+    sampler.subscribe(healthy, 100)
+
+    sampler.publish({})
+
+    healthy.assert_called_once()
+
+
+def test_sampler_collects_off_event_loop(mock_periodic_callback):
+    threads = []
+
+    def collect():
+        threads.append(threading.current_thread())
+        return {}
+
+    sampler = Sampler("test_executor", collect)
+    sampler.subscribe(MagicMock(), 100)
+    run_tick(sampler)
+
+    assert threads
+    assert threads[0] is not threading.main_thread()
+
+
+def test_sampler_timeout_skips_hung_collection(mock_periodic_callback):
+    release = threading.Event()
+    collect = MagicMock(side_effect=lambda: release.wait() and {})
+    subscriber = MagicMock()
+    sampler = Sampler("test_timeout", collect, timeout=0.01)
+    sampler.subscribe(subscriber, 100)
+
+    async def ticks():
+        await sampler.tick()
+        # The hung call is still in flight, so further ticks do not pile up
+        assert sampler.tick() is None
+        release.set()
+
+    asyncio.run(ticks())
+
+    collect.assert_called_once()
+    subscriber.assert_not_called()
+
+
+def test_hung_gpu_does_not_delay_host_metrics(mock_periodic_callback):
+    release = threading.Event()
+    # More hung GPU collections than there are GPU workers
+    gpu_samplers = [
+        Sampler(f"test_hung_gpu_{index}", lambda: release.wait() and {}, timeout=0.01, pool=GPU)
+        for index in range(MAX_WORKERS[GPU] + 1)
+    ]
+    subscriber = MagicMock()
+    host_sampler = Sampler("test_host_with_hung_gpu", MagicMock(return_value={"value": 1}), timeout=1, pool=HOST)
+    host_sampler.subscribe(subscriber, 100)
+
+    async def ticks():
+        for sampler in gpu_samplers:
+            await sampler.tick()
+        await host_sampler.tick()
+        release.set()
+
+    asyncio.run(ticks())
+
+    subscriber.assert_called_once_with({"value": 1})
+
+
+def test_sampler_survives_collection_errors(mock_periodic_callback):
+    sampler = Sampler("test_errors", MagicMock(side_effect=RuntimeError("NVML error")))
+    subscriber = MagicMock()
+    sampler.subscribe(subscriber, 100)
+
+    run_tick(sampler)
+
+    subscriber.assert_not_called()
+    assert not sampler.collecting
+
+
+def test_sampler_keeps_recording_history_without_subscribers(mock_periodic_callback):
+    sampler = Sampler("test_history", MagicMock())
+    assert sampler.interval is None
+
+    subscriber = MagicMock()
+    sampler.subscribe(subscriber, 100)
+    sampler.unsubscribe(subscriber)
+
+    assert sampler.interval == HISTORY_INTERVAL
+
+
+def test_sampler_stops_recording_history_after_grace_period(mock_periodic_callback, monkeypatch):
+    collect = MagicMock(return_value={})
+    sampler = Sampler("test_history_grace", collect)
+    subscriber = MagicMock()
+    sampler.subscribe(subscriber, 100)
+    sampler.unsubscribe(subscriber)
+
+    run_tick(sampler)
+    collect.assert_called_once()
+
+    monkeypatch.setattr("jupyterlab_nvdashboard.apps.sampler.HISTORY_GRACE", -1)
+    run_tick(sampler)
+    collect.assert_called_once()
+    assert not sampler.recording
+    assert sampler.interval is None
+
+
+def test_sampler_waits_until_ready(mock_periodic_callback):
+    collect = MagicMock(return_value={"value": 1})
+    ready = MagicMock(return_value=False)
+    sampler = Sampler("test_ready", collect, ready=ready)
+    subscriber = MagicMock()
+    sampler.subscribe(subscriber, 1000)
+
+    run_tick(sampler)
+    collect.assert_not_called()
+    subscriber.assert_not_called()
+
+    ready.return_value = True
+    run_tick(sampler)
+    subscriber.assert_called_once_with({"value": 1})
+
+
+def test_clock_ticks_due_samplers_together(mock_periodic_callback):
+    on_tick = MagicMock()
+    clock = Clock(on_tick=on_tick)
+    fast = Sampler("test_clock_fast", MagicMock(return_value={}), history_interval=None, clock=clock)
+    slow = Sampler("test_clock_slow", MagicMock(return_value={}), history_interval=None, clock=clock)
+    fast.subscribe(MagicMock(), 100)
+    slow.subscribe(MagicMock(), 1000)
+    # One periodic callback for the whole clock, at its fastest sampler's interval
+    mock_periodic_callback.assert_called_once_with(clock.tick, 100)
+    assert fast.callback is None
+
+    async def ticks():
+        await asyncio.gather(*clock.tick())
+        # Only the fast sampler is due again a tick later
+        clock.samplers[fast][1] -= 0.1
+        clock.samplers[slow][1] -= 0.1
+        await asyncio.gather(*clock.tick())
+
+    asyncio.run(ticks())
+
+    assert fast.collect.call_count == 2
+    assert slow.collect.call_count == 1
+    on_tick.assert_called_with(100)
+
+    fast.unsubscribe(next(iter(fast.subscribers)))
+    assert clock.interval == 1000
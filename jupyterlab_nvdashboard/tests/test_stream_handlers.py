@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+from jupyterlab_nvdashboard.apps.stream import StreamWebSocketHandler
+from jupyterlab_nvdashboard.apps.utils import HEARTBEAT_INTERVAL, MAX_PENDING_BYTES
+
+
+@pytest.fixture
+def mock_periodic_callback():
+    with (
+        patch("jupyterlab_nvdashboard.apps.sampler.tornado.ioloop.PeriodicCallback"),
+        patch("jupyterlab_nvdashboard.apps.stream.tornado.ioloop.PeriodicCallback") as mock,
+    ):
+        yield mock
+
+
+@pytest.fixture
+def stream_samplers(mock_periodic_callback):
+    return Sampler("test_stream_a", MagicMock()), Sampler("test_stream_b", MagicMock())
+
+
+@pytest.fixture
+def handler(handler_args):
+    handler = StreamWebSocketHandler(*handler_args, channels=["test_stream_a", "test_stream_b"])
+    handler._jupyter_current_user = "test_user"
+    handler.write_message = MagicMock()
+    return handler
+
+
+def test_stream_handler_combines_channels(handler, stream_samplers, mock_periodic_callback):
+    sampler_a, sampler_b = stream_samplers
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 100, "test_stream_b": 1000}}))
+
+    assert sampler_a.subscribers
+    assert sampler_b.subscribers
+    mock_periodic_callback.assert_called_with(handler.send_data, 100)
+
+    sampler_a.publish({"value": 1})
+    sampler_b.publish({"value": 2})
+    handler.send_data()
+
+    frame = json.loads(handler.write_message.call_args[0][0])
+    assert frame["channels"] == {"test_stream_a": {"value": 1}, "test_stream_b": {"value": 2}}
+    assert "time" in frame
+
+
+def test_stream_handler_skips_empty_frames(handler, stream_samplers):
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 100}}))
+    handler.send_data()
+
+    handler.write_message.assert_not_called()
+
+
+def test_stream_handler_ignores_unknown_channels(handler, stream_samplers):
+    handler.on_message(json.dumps({"channels": {"gpu_secret": 100, "test_stream_a": 100}}))
+
+    assert list(handler.subscriptions) == ["test_stream_a"]
+
+
+def test_stream_handler_backfills_channels(handler, stream_samplers):
+    sampler_a, _ = stream_samplers
+    for value in range(3):
+        sampler_a.history.append({"time": value, "value": value}, value)
+    handler.on_message(json.dumps({"backfill": {"test_stream_a": 2, "gpu_secret": 2}}))
+
+    frame = json.loads(handler.write_message.call_args[0][0])
+    assert frame["history"] == {"test_stream_a": [{"time": 1, "value": 1}, {"time": 2, "value": 2}]}
+
+
+def test_stream_handler_pauses(handler, stream_samplers):
+    sampler_a, _ = stream_samplers
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 100}}))
+    handler.on_message(json.dumps({"isPaused": True}))
+    assert not sampler_a.subscribers
+    assert handler.callback is None
+
+    # Changing channels while paused keeps the stream paused
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 500}}))
+    assert not sampler_a.subscribers
+
+    handler.on_message(json.dumps({"isPaused": False}))
+    assert sampler_a.interval == 500
+
+
+def test_stream_handler_unsubscribes_on_close(handler, stream_samplers):
+    sampler_a, _ = stream_samplers
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 100}}))
+    handler.on_close()
+
+    assert not sampler_a.subscribers
+    assert handler.callback is None
+
+
+def test_stream_handler_coalesces_while_lagging(handler, stream_samplers):
+    sampler_a, _ = stream_samplers
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 0}}))
+    handler.pending_bytes = MAX_PENDING_BYTES + 1
+
+    sampler_a.publish({"value": 1})
+    handler.send_data()
+    sampler_a.publish({"value": 2})
+    handler.send_data()
+    handler.write_message.assert_not_called()
+
+    handler.pending_bytes = 0
+    handler.send_data()
+    frame = json.loads(handler.write_message.call_args[0][0])
+    assert frame["channels"] == {"test_stream_a": {"value": 2}}
+
+
+def test_stream_handler_heartbeat_when_hidden(handler, stream_samplers, mock_periodic_callback):
+    handler.on_message(json.dumps({"channels": {"test_stream_a": 100}}))
+    handler.on_message(json.dumps({"visible": False}))
+    mock_periodic_callback.assert_called_with(handler.send_data, HEARTBEAT_INTERVAL)
+
+    handler.on_message(json.dumps({"visible": True}))
+    mock_periodic_callback.assert_called_with(handler.send_data, 100)
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from jupyterlab_nvdashboard.apps import gpu, topology
+from jupyterlab_nvdashboard.apps.backends import SyntheticNVML
+from jupyterlab_nvdashboard.apps.cpu import format_cpulist
+from jupyterlab_nvdashboard.handlers import TopologyHandler
+
+
+@pytest.fixture
+def synthetic_gpus(monkeypatch):
+    def use(**kwargs):
+        monkeypatch.setattr(gpu, "pynvml", SyntheticNVML(**kwargs))
+        for name in [
+            "ngpus",
+            "gpu_handles",
+            "devices",
+            "device_names",
+            "nvlink_links",
+            "nvlink_ver",
+            "max_bw",
+            "max_link_bw",
+            "status",
+        ]:
+            monkeypatch.setattr(gpu, name, None, raising=False)
+        monkeypatch.setattr(topology, "current", None)
+        gpu.init_devices()
+
+    return use
+
+
+def test_format_cpulist():
+    assert format_cpulist([11, 0, 1, 2, 3, 8, 10]) == "0-3,8,10-11"
+    assert format_cpulist([]) == ""
+
+
+def test_topology_of_nvswitch_system(synthetic_gpus):
+    synthetic_gpus(ngpus=4, nvlinks=6, topology="switch")
+    result = topology.discover()
+
+    assert [device["bus_id"] for device in result["gpus"]] == [f"0000:{0x10 + i:02x}:00.0" for i in range(4)]
+    assert all(link["remote"] == "switch" for links in result["nvlinks"] for link in links)
+    assert [len(links) for links in result["nvlinks"]] == [6] * 4
+    assert result["paths"][0] == ["X", "NV6", "NV6", "NV6"]
+
+
+def test_topology_of_pcie_system(synthetic_gpus):
+    synthetic_gpus(ngpus=4, nvlinks=0)
+    result = topology.discover()
+
+    assert result["nvlinks"] == [[], [], [], []]
+    # Two GPUs per simulated socket
+    assert result["paths"][0] == ["X", "NODE", "SYS", "SYS"]
+
+
+def test_topology_of_nvlink_ring(synthetic_gpus):
+    synthetic_gpus(ngpus=4, nvlinks=4, topology="ring")
+    result = topology.discover()
+
+    assert [link["peer"] for link in result["nvlinks"][0]] == [1, 3, 1, 3]
+    assert result["paths"][0] == ["X", "NV2", "SYS", "NV2"]
+
+
+def test_numa_node_falls_back_to_cpu_affinity(tmp_path, monkeypatch):
+    monkeypatch.setattr(topology, "PCI_DEVICES", str(tmp_path))
+    node_cpus = {0: {0, 1}, 1: {2, 3}}
+    assert topology.numa_node("0000:10:00.0", [2, 3], node_cpus) == 1
+    assert topology.numa_node(None, [], node_cpus) is None
+
+    (tmp_path / "0000:10:00.0").mkdir()
+    (tmp_path / "0000:10:00.0" / "numa_node").write_text("0\n")
+    assert topology.numa_node("0000:10:00.0", [2, 3], node_cpus) == 0
+
+
+def test_topology_handler(synthetic_gpus, handler_args):
+    synthetic_gpus(ngpus=2, nvlinks=2)
+    handler = TopologyHandler(*handler_args)
+    handler.finish = MagicMock()
+    handler.get_current_user = MagicMock(return_value="test_user")
+
+    asyncio.run(handler.get())
+    response = json.loads(handler.finish.call_args[0][0])
+    assert len(response["gpus"]) == 2
+    assert response["paths"] == [["X", "NV2"], ["NV2", "X"]]
+
+
+def test_topology_discovered_after_gpus(synthetic_gpus, monkeypatch):
+    synthetic_gpus(ngpus=2, nvlinks=2)
+    monkeypatch.setattr(gpu, "status", gpu.INITIALIZING)
+    # Not cached before the GPUs are discovered
+    assert topology.refresh() is None
+    assert topology.current is None
+
+    monkeypatch.setattr(gpu, "init_devices", lambda: monkeypatch.setattr(gpu, "status", gpu.READY))
+    asyncio.run(gpu.discover_devices())
+    assert len(topology.current["gpus"]) == 2
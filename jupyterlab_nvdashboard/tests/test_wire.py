@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import struct
+from unittest.mock import MagicMock
+
+from jupyterlab_nvdashboard.apps import wire
+from jupyterlab_nvdashboard.apps.sampler import Sampler
+
+
+def test_schema_puts_time_first():
+    sample = {"gpu_utilization": [1, 2], "time": 1000.0, "total": 3}
+    assert wire.schema(sample) == [("time", None), ("gpu_utilization", 2), ("total", None)]
+
+
+def test_encode_binary_packs_little_endian_float64():
+    fields, frame = wire.encode_binary({"time": 1000.0, "gpu_utilization": [1, 2]})
+
+    assert fields == [("time", None), ("gpu_utilization", 2)]
+    assert struct.unpack("<3d", frame) == (1000.0, 1.0, 2.0)
+
+
+def test_encode_json():
+    assert json.loads(wire.encode_json({"value": 1})) == {"value": 1}
+
+
+def test_sampler_encodes_each_sample_once():
+    sampler = Sampler("test_wire_encode", MagicMock())
+    encoding = MagicMock(return_value="encoded")
+    sample = {"value": 1}
+
+    assert sampler.encode(sample, encoding) == "encoded"
+    assert sampler.encode(sample, encoding) == "encoded"
+    encoding.assert_called_once_with(sample)
+
+    sampler.encode({"value": 2}, encoding)
+    assert encoding.call_count == 2
@@ -0,0 +1,153 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+/**
+ * Tests for StreamClient
+ */
+
+import { connectToWebSocket } from '../handler';
+import { StreamClient } from '../streamClient';
+
+jest.mock('../handler', () => ({
+  connectToWebSocket: jest.fn()
+}));
+
+class FakeWebSocket {
+  sent: any[] = [];
+  closed = false;
+  onmessage: ((event: { data: string }) => void) | null = null;
+  onclose: (() => void) | null = null;
+
+  send(data: string) {
+    this.sent.push(JSON.parse(data));
+  }
+
+  close() {
+    this.closed = true;
+  }
+
+  receive(message: unknown) {
+    this.onmessage!({ data: JSON.stringify(message) });
+  }
+}
+
+describe('StreamClient', () => {
+  let sockets: FakeWebSocket[];
+
+  beforeEach(() => {
+    sockets = [];
+    (connectToWebSocket as jest.Mock).mockImplementation(() => {
+      const ws = new FakeWebSocket();
+      sockets.push(ws);
+      return ws;
+    });
+  });
+
+  it('shares one connection between subscribers', () => {
+    const client = new StreamClient();
+    const first = jest.fn();
+    const second = jest.fn();
+    client.subscribe('gpu_resource', first, {
+      updateFrequency: 1000,
+      isPaused: false
+    });
+    client.subscribe('gpu_resource', second, {
+      updateFrequency: 100,
+      isPaused: false
+    });
+    const ws = sockets[0];
+    ws.receive({ status: 'connected', channels: ['gpu_resource'] });
+
+    expect(sockets).toHaveLength(1);
+    // Each channel at the fastest frequency requested
+    expect(ws.sent).toEqual([
+      { channels: { gpu_resource: 100 }, visible: true }
+    ]);
+
+    ws.receive({ time: 1, channels: { gpu_resource: { value: 1 } } });
+    expect(first).toHaveBeenCalledWith({ value: 1 });
+    expect(second).toHaveBeenCalledWith({ value: 1 });
+  });
+
+  it('delivers frames at the frequency of each subscriber', () => {
+    const now = jest.spyOn(Date, 'now');
+    const client = new StreamClient();
+    const slow = jest.fn();
+    const fast = jest.fn();
+    client.subscribe('gpu_resource', slow, {
+      updateFrequency: 5000,
+      isPaused: false
+    });
+    client.subscribe('gpu_resource', fast, {
+      updateFrequency: 500,
+      isPaused: false
+    });
+    const ws = sockets[0];
+    ws.receive({ status: 'connected', channels: ['gpu_resource'] });
+
+    for (let value = 0; value < 20; value++) {
+      now.mockReturnValue(10000 + value * 500);
+      ws.receive({ channels: { gpu_resource: { value } } });
+    }
+
+    expect(fast).toHaveBeenCalledTimes(20);
+    expect(slow.mock.calls).toEqual([[{ value: 0 }], [{ value: 10 }]]);
+    now.mockRestore();
+  });
+
+  it('backfills only the subscribers that ask for it', () => {
+    const client = new StreamClient();
+    const live = jest.fn();
+    const backfilled = jest.fn();
+    client.subscribe('cpu_resource', live, {
+      updateFrequency: 1000,
+      isPaused: false
+    });
+    const ws = sockets[0];
+    ws.receive({ status: 'connected', channels: ['cpu_resource'] });
+    client.subscribe('cpu_resource', backfilled, {
+      updateFrequency: 1000,
+      isPaused: false,
+      backfill: 2
+    });
+    ws.receive({ history: { cpu_resource: [{ time: 1 }, { time: 2 }] } });
+
+    expect(ws.sent).toContainEqual({ backfill: { cpu_resource: 2 } });
+    expect(backfilled.mock.calls).toEqual([[{ time: 1 }], [{ time: 2 }]]);
+    expect(live).not.toHaveBeenCalled();
+  });
+
+  it('drops paused channels and closes with the last subscriber', () => {
+    const client = new StreamClient();
+    const subscription = client.subscribe('gpu_usage', jest.fn(), {
+      updateFrequency: 500,
+      isPaused: false
+    });
+    const ws = sockets[0];
+    ws.receive({ status: 'connected', channels: ['gpu_usage'] });
+    subscription.update({ isPaused: true });
+
+    expect(ws.sent[ws.sent.length - 1]).toEqual({
+      channels: {},
+      visible: true
+    });
+    subscription.dispose();
+    expect(ws.closed).toBe(true);
+  });
+
+  it('reconnects while subscribed', () => {
+    jest.useFakeTimers();
+    const client = new StreamClient();
+    client.subscribe('gpu_usage', jest.fn(), {
+      updateFrequency: 500,
+      isPaused: false
+    });
+    sockets[0].onclose!();
+    jest.advanceTimersByTime(1000);
+
+    expect(sockets).toHaveLength(2);
+    jest.useRealTimers();
+  });
+});
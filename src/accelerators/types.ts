@@ -61,6 +61,12 @@ export interface IAcceleratorSystemInfo {
   /** Number of GPUs detected */
   ngpus: number;
 
+  /**
+   * State of GPU discovery, which runs in the background after the server
+   * starts: 'initializing', 'ready', 'unavailable' or 'failed'
+   */
+  gpu_status?: string;
+
   /** Availability status for each registered accelerator */
   accelerators: Record<string, IAcceleratorStatus>;
 }
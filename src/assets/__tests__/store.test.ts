@@ -0,0 +1,95 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+/**
+ * Tests for TimeSeriesStore
+ */
+
+import { TimeSeriesStore, getTimeSeriesStore } from '../store';
+
+const sample = (time: number, ngpus = 2) => ({
+  time,
+  total: time * 10,
+  individual: Array.from({ length: ngpus }, (_, gpu) => time + gpu),
+  label: 'ignored'
+});
+
+describe('TimeSeriesStore', () => {
+  it('keeps the latest samples up to its capacity', () => {
+    const store = new TimeSeriesStore(3);
+    for (let time = 1; time <= 5; time++) {
+      store.push(sample(time));
+    }
+
+    expect(store.total).toBe(5);
+    expect(store.size).toBe(3);
+    expect(store.latest('total')).toBe(50);
+    const view = store.view(10);
+    expect(view.length).toBe(3);
+    expect(view.map(row => row.time)).toEqual([3, 4, 5]);
+    expect(Array.from(view[2].individual as Float64Array)).toEqual([5, 6]);
+    expect(view[2].label).toBeUndefined();
+    expect(view[3]).toBeUndefined();
+  });
+
+  it('returns windows without copying', () => {
+    const store = new TimeSeriesStore(4);
+    [1, 2, 3].forEach(time => store.push(sample(time)));
+
+    const view = store.view(2);
+    expect(view.slice(0).map(row => row.time)).toEqual([2, 3]);
+    // Rows are shared until their slot is reused
+    expect(store.view(2)[0]).toBe(view[0]);
+    // Windows ending before the latest sample, e.g. while paused
+    expect(store.view(2, 2).map(row => row.time)).toEqual([1, 2]);
+  });
+
+  it('drops duplicate samples', () => {
+    const store = new TimeSeriesStore(4);
+    expect(store.push(sample(1))).toBe(true);
+    expect(store.push(sample(2))).toBe(true);
+    expect(store.push(sample(2))).toBe(false);
+    expect(store.push(sample(1))).toBe(false);
+    expect(store.total).toBe(2);
+  });
+
+  it('starts over when the fields change', () => {
+    const store = new TimeSeriesStore(4);
+    store.push(sample(1));
+    store.push(sample(2, 3));
+
+    expect(store.size).toBe(1);
+    expect((store.view(4)[0].individual as Float64Array).length).toBe(3);
+  });
+
+  it('keeps its samples when resized', () => {
+    const store = new TimeSeriesStore(3);
+    [1, 2, 3, 4].forEach(time => store.push(sample(time)));
+    store.setCapacity(5);
+    store.push(sample(5));
+
+    expect(store.view(5).map(row => row.time)).toEqual([2, 3, 4, 5]);
+    store.setCapacity(2);
+    expect(store.view(5).map(row => row.time)).toEqual([4, 5]);
+  });
+
+  it('notifies its listeners', () => {
+    const store = new TimeSeriesStore(2);
+    const listener = jest.fn();
+    const unsubscribe = store.subscribe(listener);
+    store.push(sample(1));
+    store.push(sample(1));
+    unsubscribe();
+    store.push(sample(2));
+
+    expect(listener).toHaveBeenCalledTimes(1);
+  });
+
+  it('is shared by metric', () => {
+    const store = getTimeSeriesStore('test_metric', 2);
+    expect(getTimeSeriesStore('test_metric', 10)).toBe(store);
+    expect(store.capacity).toBe(10);
+  });
+});
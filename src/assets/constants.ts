@@ -13,3 +13,5 @@ export const COMMAND_OPEN_SETTINGS = 'settingeditor:open';
 export const COMMAND_OPEN_WIDGET = 'gpu-dashboard-widget:open';
 export const DEFAULT_UPDATE_FREQUENCY = 100; // ms
 export const DEFAULT_MAX_RECORDS_TIMESERIES = 1000; // count
+export const DEFAULT_WIRE_FORMAT = 'json';
+export const DEFAULT_CHART_RENDERER = 'svg';
@@ -4,13 +4,57 @@
  */
 
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
-import { SetStateAction, useEffect, useRef } from 'react';
+import { SetStateAction, useEffect, useRef, useState } from 'react';
 import {
+  DEFAULT_CHART_RENDERER,
   DEFAULT_MAX_RECORDS_TIMESERIES,
   DEFAULT_UPDATE_FREQUENCY,
+  DEFAULT_WIRE_FORMAT,
   PLUGIN_ID_CONFIG
 } from './constants';
 import { connectToWebSocket } from '../handler';
+import { IStreamSubscription, streamClient } from '../streamClient';
+import { TimeSeriesStore, getTimeSeriesStore } from './store';
+
+/**
+ * Wire format requested from the server when a WebSocket connects.
+ */
+let wireFormat = DEFAULT_WIRE_FORMAT;
+
+/**
+ * Renderer of the time series charts, 'svg' or 'canvas'.
+ */
+let chartRenderer = DEFAULT_CHART_RENDERER;
+
+/**
+ * Returns the renderer selected for the time series charts.
+ */
+export const getChartRenderer = (): string => chartRenderer;
+
+/**
+ * Layout of the binary frames of a stream, as `[key, width]` pairs where width
+ * is null for scalar fields and the list length for list fields.
+ */
+type FrameSchema = [string, number | null][];
+
+/**
+ * Decodes a packed little-endian float64 frame into a sample object.
+ */
+export const decodeFrame = <T>(buffer: ArrayBuffer, schema: FrameSchema): T => {
+  const values = new Float64Array(buffer);
+  const sample: { [key: string]: number | number[] } = {};
+  let offset = 0;
+  for (const [key, width] of schema) {
+    if (width === null) {
+      sample[key] = values[offset];
+      offset += 1;
+    } else {
+      sample[key] = Array.from(values.subarray(offset, offset + width));
+      offset += width;
+    }
+  }
+  return sample as T;
+};
 
 /**
  * Updates the settings for update frequency and maximum records for time series charts.
@@ -24,6 +68,11 @@ const updateSettings = (
     (settings.get('updateFrequency').composite as number) ||
       DEFAULT_UPDATE_FREQUENCY
   );
+  wireFormat =
+    (settings.get('wireFormat').composite as string) || DEFAULT_WIRE_FORMAT;
+  chartRenderer =
+    (settings.get('chartRenderer').composite as string) ||
+    DEFAULT_CHART_RENDERER;
   if (setMaxRecords) {
     setMaxRecords(
       (settings.get('maxTimeSeriesDataRecords').composite as number) ||
@@ -59,35 +108,87 @@ export const loadSettingRegistry = (
 };
 
 /**
- * Custom hook to establish a WebSocket connection and handle incoming messages.
+ * Custom hook to receive the samples of a metric and handle incoming messages.
+ * If `backfill` is set, the last `backfill` samples recorded by the server are
+ * passed to `processData` as soon as the connection is established.
+ *
+ * Metrics are received over the stream shared by every widget of the page,
+ * except with the binary wire format, whose frames are per metric and so
+ * need a WebSocket of their own.
  */
 export const useWebSocket = <T>(
   endpoint: string,
   isPaused: boolean,
   updateFrequency: number,
   processData: (response: T, isPaused: boolean) => void,
-  isSettingsLoaded: boolean
+  isSettingsLoaded: boolean,
+  backfill?: number
 ) => {
   const wsRef = useRef<WebSocket | null>(null);
+  const subscriptionRef = useRef<IStreamSubscription | null>(null);
 
   useEffect(() => {
     if (!isSettingsLoaded) {
       return;
     }
 
+    if (wireFormat !== 'binary') {
+      const subscription = streamClient.subscribe<T>(
+        endpoint,
+        sample => processData(sample, isPaused),
+        { updateFrequency, isPaused, backfill }
+      );
+      subscriptionRef.current = subscription;
+      return () => {
+        subscriptionRef.current = null;
+        subscription.dispose();
+      };
+    }
+
     wsRef.current = connectToWebSocket(endpoint);
     const ws = wsRef.current;
+    ws.binaryType = 'arraybuffer';
+    let schema: FrameSchema | null = null;
 
     ws.onopen = () => {
       console.log('WebSocket connected');
     };
 
+    // The server drops to a heartbeat rate while the page is hidden
+    const onVisibilityChange = () => {
+      if (ws.readyState === WebSocket.OPEN) {
+        ws.send(JSON.stringify({ visible: !document.hidden }));
+      }
+    };
+    document.addEventListener('visibilitychange', onVisibilityChange);
+
     ws.onmessage = event => {
+      if (event.data instanceof ArrayBuffer) {
+        if (schema) {
+          processData(decodeFrame<T>(event.data, schema), isPaused);
+        }
+        return;
+      }
       const response = JSON.parse(event.data);
-      if (response.status !== 'connected') {
+      if (response.schema) {
+        schema = response.schema;
+      } else if (response.history) {
+        response.history.forEach((sample: T) => processData(sample, isPaused));
+      } else if (response.status === undefined) {
         processData(response, isPaused);
+      } else if (response.status === 'connected') {
+        ws.send(
+          JSON.stringify({
+            updateFrequency,
+            isPaused,
+            backfill,
+            format: wireFormat,
+            visible: !document.hidden
+          })
+        );
       } else {
-        ws.send(JSON.stringify({ updateFrequency, isPaused }));
+        // e.g. 'initializing' until the server has discovered the GPUs
+        console.log(`WebSocket ${endpoint} ${response.status}`);
       }
     };
 
@@ -100,13 +201,67 @@ export const useWebSocket = <T>(
     };
 
     return () => {
+      document.removeEventListener('visibilitychange', onVisibilityChange);
       ws.close();
     };
   }, [isSettingsLoaded]);
 
   useEffect(() => {
+    subscriptionRef.current?.update({ updateFrequency, isPaused });
     if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
       wsRef.current.send(JSON.stringify({ updateFrequency, isPaused }));
     }
   }, [isPaused, updateFrequency]);
 };
+
+/**
+ * Custom hook streaming `endpoint` into its shared TimeSeriesStore, returning
+ * a view of the last `maxRecords` samples. `transform` is applied to each
+ * sample before it is stored, e.g. to derive rates from counters.
+ *
+ * Samples keep streaming into the store while paused, and the view stays on
+ * the samples shown when the chart was paused. The store holds twice
+ * `maxRecords` samples, so that window survives `maxRecords` more samples.
+ */
+export const useTimeSeries = <T>(
+  endpoint: string,
+  isPaused: boolean,
+  updateFrequency: number,
+  isSettingsLoaded: boolean,
+  maxRecords: number,
+  transform?: (response: T, store: TimeSeriesStore) => T
+): T[] => {
+  const store = getTimeSeriesStore(endpoint, 2 * maxRecords);
+  const [, setVersion] = useState(store.total);
+  const pausedAt = useRef<number | null>(null);
+  if (!isPaused) {
+    pausedAt.current = null;
+  } else if (pausedAt.current === null) {
+    pausedAt.current = store.total;
+  }
+
+  useEffect(() => {
+    if (isPaused) {
+      return;
+    }
+    setVersion(store.total);
+    return store.subscribe(() => setVersion(store.total));
+  }, [store, isPaused]);
+
+  const processData = (response: T) => {
+    store.push(transform ? transform(response, store) : response);
+  };
+
+  // The server keeps streaming while paused, so nothing is missed on resume
+  useWebSocket<T>(
+    endpoint,
+    false,
+    updateFrequency,
+    processData,
+    isSettingsLoaded,
+    maxRecords
+  );
+
+  const end = pausedAt.current ?? store.total;
+  return store.view(maxRecords, end) as unknown as T[];
+};
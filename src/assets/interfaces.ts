@@ -36,11 +36,14 @@ export interface IGpuResourceProps {
 
 export interface IGpuUtilizationProps {
   gpu_utilization: number[];
+  // Name of each device, e.g. "GPU 0 MIG 1 (3g.40gb)", not sent in binary frames
+  device_names?: string[];
 }
 
 export interface IGpuUsageProps {
   memory_usage: number[];
   total_memory: number[];
+  device_names?: string[];
 }
 
 export interface ICPUResourceProps {
@@ -57,10 +60,30 @@ export interface ICPUResourceProps {
   network_write_current: number;
 }
 
+export interface IHostResourceProps {
+  time: number;
+  // Utilization of each core and NUMA node, in percent
+  cpu_utilization: number[];
+  numa_cpus: string[];
+  numa_utilization: number[];
+  // Throughput of each disk and network interface, in B/s
+  disks: string[];
+  disk_read: number[];
+  disk_write: number[];
+  nics: string[];
+  network_read: number[];
+  network_write: number[];
+}
+
 export interface INVLinkThroughputProps {
   nvlink_tx: number[];
   nvlink_rx: number[];
+  // Active link indices, and the rate of each of them on every GPU (GPU-major)
+  nvlink_links: number[];
+  nvlink_tx_links: number[];
+  nvlink_rx_links: number[];
   max_rxtx_bw: number;
+  max_link_bw: number;
 }
 
 export interface INVLinkTimeLineProps {
@@ -75,3 +98,109 @@ export interface IPCIThroughputProps {
   pci_rx: number[];
   max_rxtx_tp: number;
 }
+
+export interface IGpuProcess {
+  gpu: number;
+  pid: number;
+  name: string | null;
+  user: string | null;
+  memory_used: number | null;
+  sm_utilization: number;
+  memory_utilization: number;
+  kernel_id: string | null;
+  kernel_name: string | null;
+  session_id: string | null;
+  path: string | null;
+}
+
+export interface IGpuProcessesProps {
+  time: number;
+  processes: IGpuProcess[];
+}
+
+export interface ITopologyGpu {
+  index: number;
+  name: string | null;
+  bus_id: string | null;
+  numa_node: number | null;
+  // Linux cpulist of the CPUs local to the GPU, e.g. "0-31,64-95"
+  cpus: string;
+}
+
+export interface ITopologyNvLink {
+  link: number;
+  remote: 'gpu' | 'switch' | 'cpu' | 'unknown';
+  peer: number | null;
+}
+
+export interface ITopologyProps {
+  gpus: ITopologyGpu[];
+  nvlinks: ITopologyNvLink[][];
+  // Fastest path between each pair of GPUs, as named by `nvidia-smi topo -m`
+  paths: (string | null)[][];
+  numa_nodes: { node: number; cpus: string }[];
+}
+
+export interface IDiagnosticsHistogram {
+  count: number;
+  mean_ms: number;
+  p50_ms: number;
+  p99_ms: number;
+  max_ms: number;
+}
+
+export interface IDiagnosticsSampler {
+  interval: number | null;
+  subscribers: number;
+  collect: IDiagnosticsHistogram;
+  encode: IDiagnosticsHistogram;
+  publish: IDiagnosticsHistogram;
+  samples: number;
+  errors: number;
+  timeouts: number;
+  skipped: number;
+}
+
+export interface IDiagnosticsConnection {
+  clients: number;
+  frames: number;
+  bytes: number;
+  dropped_frames: number;
+  flush: IDiagnosticsHistogram;
+}
+
+export interface IDiagnosticsProps {
+  time: number;
+  event_loop: { lag: IDiagnosticsHistogram; latest_lag_ms: number };
+  // Collections in flight on the GPU and host sampler pools
+  executors: Record<string, { max_workers: number; in_flight: number }>;
+  samplers: Record<string, IDiagnosticsSampler>;
+  connections: Record<string, IDiagnosticsConnection>;
+}
+
+export interface IGpuHealthProps {
+  time: number;
+  gpu_utilization: number[];
+  // Readings a system does not support are left out
+  sm_clock?: number[];
+  max_sm_clock?: number[];
+  memory_clock?: number[];
+  max_memory_clock?: number[];
+  // In W
+  power?: number[];
+  power_limit?: number[];
+  // In degrees Celsius
+  temperature?: number[];
+  memory_temperature?: number[];
+  slowdown_temperature?: number[];
+  fan_speed?: number[];
+  throttle_reasons?: number[];
+  // 1 while a GPU is held back by power or thermal limits
+  throttled?: number[];
+  ecc_sbe_volatile?: number[];
+  ecc_dbe_volatile?: number[];
+  ecc_sbe_aggregate?: number[];
+  ecc_dbe_aggregate?: number[];
+  xid_errors?: number[];
+  last_xid?: number[];
+}
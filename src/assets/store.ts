@@ -0,0 +1,273 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+/**
+ * A sample as stored: numeric fields, and list fields as Float64Array views
+ * into the store.
+ */
+export type StoredSample = { [key: string]: number | Float64Array };
+
+interface IColumn {
+  // Number of values per sample, null for scalar fields
+  width: number | null;
+  values: Float64Array;
+}
+
+/**
+ * Returns the width of a numeric field, null for scalars, or undefined for
+ * fields that cannot be stored, e.g. strings.
+ */
+const fieldWidth = (value: unknown): number | null | undefined => {
+  if (typeof value === 'number') {
+    return null;
+  }
+  if (value instanceof Float64Array) {
+    return value.length;
+  }
+  if (Array.isArray(value) && value.every(item => typeof item === 'number')) {
+    return value.length;
+  }
+  return undefined;
+};
+
+/**
+ * Columnar ring buffer of the samples of a metric.
+ *
+ * Each field is stored in a Float64Array holding `capacity` samples, so
+ * appending a sample writes its values in place instead of copying the
+ * series. Samples are numbered from 0 in the order they were pushed, and
+ * views over a range of them read the columns without copying. Samples whose
+ * `time` is not later than the latest stored one are dropped, so several
+ * connections can feed the same store.
+ */
+export class TimeSeriesStore {
+  private _capacity: number;
+  private columns = new Map<string, IColumn>();
+  // Sample objects handed out by views, by slot, until the slot is reused
+  private rows: (StoredSample | undefined)[];
+  private listeners = new Set<() => void>();
+  // Number of the oldest sample still stored, and of the next sample
+  private first = 0;
+  private _total = 0;
+  private lastTime = -Infinity;
+
+  constructor(capacity: number) {
+    this._capacity = Math.max(Math.floor(capacity), 1);
+    this.rows = new Array(this._capacity);
+  }
+
+  /**
+   * Number of samples the store holds before overwriting the oldest.
+   */
+  get capacity(): number {
+    return this._capacity;
+  }
+
+  /**
+   * Number of samples pushed since the store was created.
+   */
+  get total(): number {
+    return this._total;
+  }
+
+  /**
+   * Number of samples currently stored.
+   */
+  get size(): number {
+    return this._total - this.first;
+  }
+
+  /**
+   * Appends a sample, returning false if it was dropped as a duplicate.
+   */
+  push(sample: object): boolean {
+    const fields = sample as { [key: string]: unknown };
+    const time = fields.time;
+    if (typeof time === 'number') {
+      if (time <= this.lastTime) {
+        return false;
+      }
+      this.lastTime = time;
+    }
+    if (!this.matchesLayout(fields)) {
+      this.resetLayout(fields);
+    }
+    const slot = this._total % this._capacity;
+    this.columns.forEach((column, key) => {
+      const value = fields[key] as number | ArrayLike<number>;
+      if (column.width === null) {
+        column.values[slot] = value as number;
+      } else {
+        column.values.set(value as ArrayLike<number>, slot * column.width);
+      }
+    });
+    this.rows[slot] = undefined;
+    this._total += 1;
+    this.first = Math.max(this.first, this._total - this._capacity);
+    this.listeners.forEach(listener => listener());
+    return true;
+  }
+
+  /**
+   * Returns the latest value of a scalar field, or undefined if there is none.
+   */
+  latest(key: string): number | undefined {
+    const column = this.columns.get(key);
+    if (!column || column.width !== null || this.size === 0) {
+      return undefined;
+    }
+    return column.values[(this._total - 1) % this._capacity];
+  }
+
+  /**
+   * Returns sample number `index`, which must still be stored.
+   */
+  row(index: number): StoredSample {
+    const slot = index % this._capacity;
+    let row = this.rows[slot];
+    if (!row) {
+      row = {};
+      this.columns.forEach((column, key) => {
+        row![key] =
+          column.width === null
+            ? column.values[slot]
+            : column.values.subarray(
+                slot * column.width,
+                (slot + 1) * column.width
+              );
+      });
+      this.rows[slot] = row;
+    }
+    return row;
+  }
+
+  /**
+   * Returns a read-only array view of the last `count` samples pushed before
+   * sample number `end`, by default all of the latest ones. The view reads
+   * the store when indexed, so it is meant to be read right away, e.g. by the
+   * render it was made for, before more samples overwrite its range.
+   */
+  view(count: number, end: number = this._total): StoredSample[] {
+    const last = Math.min(end, this._total);
+    const start = Math.max(this.first, last - count);
+    const length = Math.max(last - start, 0);
+    const index = (property: string | symbol): number | undefined => {
+      if (typeof property !== 'string') {
+        return undefined;
+      }
+      const value = Number(property);
+      return Number.isInteger(value) && String(value) === property
+        ? value
+        : undefined;
+    };
+    return new Proxy([] as StoredSample[], {
+      get: (target, property, receiver) => {
+        if (property === 'length') {
+          return length;
+        }
+        const i = index(property);
+        if (i !== undefined) {
+          return i >= 0 && i < length ? this.row(start + i) : undefined;
+        }
+        return Reflect.get(target, property, receiver);
+      },
+      has: (target, property) => {
+        const i = index(property);
+        return i !== undefined
+          ? i >= 0 && i < length
+          : Reflect.has(target, property);
+      }
+    });
+  }
+
+  /**
+   * Resizes the store, keeping the latest samples that still fit.
+   */
+  setCapacity(capacity: number): void {
+    capacity = Math.max(Math.floor(capacity), 1);
+    if (capacity === this._capacity) {
+      return;
+    }
+    const first = Math.max(this.first, this._total - capacity);
+    this.columns.forEach(column => {
+      const width = column.width ?? 1;
+      const values = new Float64Array(capacity * width);
+      for (let index = first; index < this._total; index++) {
+        const from = (index % this._capacity) * width;
+        values.set(
+          column.values.subarray(from, from + width),
+          (index % capacity) * width
+        );
+      }
+      column.values = values;
+    });
+    this._capacity = capacity;
+    this.first = first;
+    this.rows = new Array(capacity);
+  }
+
+  /**
+   * Calls `listener` after each sample is stored, until the returned
+   * function is called.
+   */
+  subscribe(listener: () => void): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  private matchesLayout(sample: { [key: string]: unknown }): boolean {
+    let fields = 0;
+    for (const key in sample) {
+      const width = fieldWidth(sample[key]);
+      if (width === undefined) {
+        continue;
+      }
+      const column = this.columns.get(key);
+      if (!column || column.width !== width) {
+        return false;
+      }
+      fields += 1;
+    }
+    return fields === this.columns.size;
+  }
+
+  // Starts over with the fields of `sample`, e.g. when GPUs are added
+  private resetLayout(sample: { [key: string]: unknown }): void {
+    this.columns.clear();
+    for (const key in sample) {
+      const width = fieldWidth(sample[key]);
+      if (width !== undefined) {
+        this.columns.set(key, {
+          width,
+          values: new Float64Array(this._capacity * (width ?? 1))
+        });
+      }
+    }
+    this.rows = new Array(this._capacity);
+    this.first = this._total;
+  }
+}
+
+// Store of each metric, shared by every chart of that metric
+const stores = new Map<string, TimeSeriesStore>();
+
+/**
+ * Returns the store of `metric`, holding at least `capacity` samples.
+ */
+export const getTimeSeriesStore = (
+  metric: string,
+  capacity: number
+): TimeSeriesStore => {
+  let store = stores.get(metric);
+  if (!store) {
+    store = new TimeSeriesStore(capacity);
+    stores.set(metric, store);
+  } else if (store.capacity < capacity) {
+    store.setCapacity(capacity);
+  }
+  return store;
+};
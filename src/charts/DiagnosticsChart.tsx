@@ -0,0 +1,170 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import React, { useEffect, useState } from 'react';
+import { ReactWidget } from '@jupyterlab/ui-components';
+import { URLExt } from '@jupyterlab/coreutils';
+import { ServerConnection } from '@jupyterlab/services';
+import { ISettingRegistry } from '@jupyterlab/settingregistry';
+import { format } from 'd3-format';
+import { DEFAULT_UPDATE_FREQUENCY } from '../assets/constants';
+import { loadSettingRegistry } from '../assets/hooks';
+import {
+  IChartProps,
+  IDiagnosticsHistogram,
+  IDiagnosticsProps
+} from '../assets/interfaces';
+
+// Diagnostics are polled no faster than this, in ms
+const MIN_POLL_INTERVAL = 2000;
+
+/**
+ * Fetches the diagnostics the server keeps about its own performance.
+ */
+const fetchDiagnostics = async (): Promise<IDiagnosticsProps | null> => {
+  const settings = ServerConnection.makeSettings();
+  const url = URLExt.join(settings.baseUrl, 'nvdashboard', 'diagnostics');
+  try {
+    const response = await ServerConnection.makeRequest(url, {}, settings);
+    if (!response.ok) {
+      throw new ServerConnection.ResponseError(response);
+    }
+    return (await response.json()) as IDiagnosticsProps;
+  } catch (error) {
+    console.error('Error fetching nvdashboard diagnostics:', error);
+    return null;
+  }
+};
+
+const formatMs = (ms: number): string => `${format('.3~r')(ms)} ms`;
+
+// p50 / p99 of a histogram, with its maximum as a tooltip
+const Latency: React.FC<{ histogram: IDiagnosticsHistogram }> = ({
+  histogram
+}) => (
+  <td title={`max ${formatMs(histogram.max_ms)}, ${histogram.count} samples`}>
+    {histogram.count
+      ? `${formatMs(histogram.p50_ms)} / ${formatMs(histogram.p99_ms)}`
+      : '-'}
+  </td>
+);
+
+// DiagnosticsChart component shows where the dashboard spends its time: in the
+// metric sources, in encoding samples, or in writing them to clients.
+const DiagnosticsChart: React.FC<IChartProps> = ({ settingRegistry }) => {
+  const [diagnostics, setDiagnostics] = useState<IDiagnosticsProps | null>(
+    null
+  );
+  const [updateFrequency, setUpdateFrequency] = useState<number>(
+    DEFAULT_UPDATE_FREQUENCY
+  );
+  const [isSettingsLoaded, setIsSettingsLoaded] = useState<boolean>(false);
+
+  loadSettingRegistry(settingRegistry, setUpdateFrequency, setIsSettingsLoaded);
+
+  useEffect(() => {
+    if (!isSettingsLoaded) {
+      return;
+    }
+    const poll = () => fetchDiagnostics().then(setDiagnostics);
+    poll();
+    const interval = setInterval(
+      poll,
+      Math.max(updateFrequency, MIN_POLL_INTERVAL)
+    );
+    return () => clearInterval(interval);
+  }, [isSettingsLoaded, updateFrequency]);
+
+  const formatBytes = (bytes: number): string => `${format('.3s')(bytes)}B`;
+
+  return (
+    <div className="gradient-background nv-diagnostics-container">
+      <strong className="chart-title"> Dashboard Diagnostics </strong>
+      {diagnostics && (
+        <>
+          <div className="nv-diagnostics-summary">
+            Event loop lag (p50 / p99):{' '}
+            {formatMs(diagnostics.event_loop.lag.p50_ms)} /{' '}
+            {formatMs(diagnostics.event_loop.lag.p99_ms)}, collections in
+            flight:{' '}
+            {Object.entries(diagnostics.executors)
+              .map(
+                ([pool, executor]) =>
+                  `${executor.in_flight} of ${executor.max_workers} (${pool})`
+              )
+              .join(', ')}
+          </div>
+          <table className="nv-process-table">
+            <thead>
+              <tr>
+                <th>Metric</th>
+                <th>Subscribers</th>
+                <th>Collect p50 / p99</th>
+                <th>Encode p50 / p99</th>
+                <th>Publish p50 / p99</th>
+                <th>Errors</th>
+                <th>Timeouts</th>
+                <th>Skipped</th>
+              </tr>
+            </thead>
+            <tbody>
+              {Object.entries(diagnostics.samplers).map(([name, sampler]) => (
+                <tr key={name}>
+                  <td>{name}</td>
+                  <td>{sampler.subscribers}</td>
+                  <Latency histogram={sampler.collect} />
+                  <Latency histogram={sampler.encode} />
+                  <Latency histogram={sampler.publish} />
+                  <td>{sampler.errors}</td>
+                  <td>{sampler.timeouts}</td>
+                  <td>{sampler.skipped}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+          <table className="nv-process-table">
+            <thead>
+              <tr>
+                <th>Endpoint</th>
+                <th>Clients</th>
+                <th>Frames</th>
+                <th>Written</th>
+                <th>Dropped</th>
+                <th>Flush p50 / p99</th>
+              </tr>
+            </thead>
+            <tbody>
+              {Object.entries(diagnostics.connections).map(
+                ([name, connection]) => (
+                  <tr key={name}>
+                    <td>{name}</td>
+                    <td>{connection.clients}</td>
+                    <td>{connection.frames}</td>
+                    <td>{formatBytes(connection.bytes)}</td>
+                    <td>{connection.dropped_frames}</td>
+                    <Latency histogram={connection.flush} />
+                  </tr>
+                )
+              )}
+            </tbody>
+          </table>
+        </>
+      )}
+    </div>
+  );
+};
+
+// DiagnosticsChartWidget is a ReactWidget that renders the DiagnosticsChart component.
+export class DiagnosticsChartWidget extends ReactWidget {
+  constructor(private settingRegistry: ISettingRegistry) {
+    super();
+    this.addClass('size-constrained-widgets');
+    this.settingRegistry = settingRegistry;
+  }
+
+  render(): JSX.Element {
+    return <DiagnosticsChart settingRegistry={this.settingRegistry} />;
+  }
+}
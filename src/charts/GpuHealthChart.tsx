@@ -0,0 +1,358 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import React, { useState } from 'react';
+import { ReactWidget, Button } from '@jupyterlab/ui-components';
+import {
+  Line,
+  XAxis,
+  YAxis,
+  Tooltip,
+  Legend,
+  LineChart,
+  ReferenceArea
+} from 'recharts';
+import AutoSizer from 'react-virtualized-auto-sizer';
+import { scaleLinear } from 'd3-scale';
+import { ISettingRegistry } from '@jupyterlab/settingregistry';
+import { CustomLineChart } from '../components/customLineChart';
+import { formatDate } from '../components/formatUtils';
+import { renderCustomTooltip } from '../components/tooltipUtils';
+import {
+  DEFAULT_MAX_RECORDS_TIMESERIES,
+  DEFAULT_UPDATE_FREQUENCY,
+  GPU_COLOR_CATEGORICAL_RANGE
+} from '../assets/constants';
+import { pauseIcon, playIcon } from '../assets/icons';
+import { loadSettingRegistry, useTimeSeries } from '../assets/hooks';
+import { IChartProps, IGpuHealthProps } from '../assets/interfaces';
+
+// Bits of the clock throttle reasons bitmask, as named by nvidia-smi
+export const THROTTLE_REASONS: [number, string][] = [
+  [0x1, 'Idle'],
+  [0x2, 'Applications Clocks Setting'],
+  [0x4, 'SW Power Cap'],
+  [0x8, 'HW Slowdown'],
+  [0x10, 'Sync Boost'],
+  [0x20, 'SW Thermal Slowdown'],
+  [0x40, 'HW Thermal Slowdown'],
+  [0x80, 'HW Power Brake Slowdown'],
+  [0x100, 'Display Clock Setting']
+];
+
+// Drop in utilization points below the level before a throttled span that
+// marks the throttling as costing throughput
+const UTILIZATION_DROP = 10;
+
+/**
+ * Returns the names of the throttle reasons set in `mask`.
+ */
+export const throttleReasonNames = (mask: number): string[] =>
+  THROTTLE_REASONS.filter(([bit]) => mask & bit).map(([, name]) => name);
+
+export interface IThrottleSpan {
+  gpu: number;
+  start: number;
+  end: number;
+  // True if the utilization of the GPU dropped while throttled
+  utilizationDrop: boolean;
+}
+
+/**
+ * Returns the spans of consecutive samples in which each GPU was throttled.
+ */
+export const throttleSpans = (
+  data: IGpuHealthProps[],
+  ngpus: number
+): IThrottleSpan[] => {
+  const spans: IThrottleSpan[] = [];
+  for (let gpu = 0; gpu < ngpus; gpu++) {
+    let span: IThrottleSpan | null = null;
+    // Utilization of the GPU before the span started
+    let baseline = 0;
+    for (let i = 0; i < data.length; i++) {
+      const row = data[i];
+      if (!row.throttled?.[gpu]) {
+        span = null;
+        continue;
+      }
+      const utilization = row.gpu_utilization[gpu];
+      if (!span) {
+        span = { gpu, start: row.time, end: row.time, utilizationDrop: false };
+        spans.push(span);
+        baseline = i > 0 ? data[i - 1].gpu_utilization[gpu] : utilization;
+      }
+      span.end = row.time;
+      if (baseline - utilization >= UTILIZATION_DROP) {
+        span.utilizationDrop = true;
+      }
+    }
+  }
+  return spans;
+};
+
+// Cell of the summary table, '-' when the reading is not supported
+const Reading: React.FC<{
+  values?: number[];
+  gpu: number;
+  unit?: string;
+}> = ({ values, gpu, unit = '' }) => (
+  <td>{values ? `${Math.round(values[gpu])}${unit}` : '-'}</td>
+);
+
+// Line per GPU of a field of the health samples
+const gpuLines = (
+  field: string,
+  ngpus: number,
+  colorScale: (index: number) => string
+) =>
+  Array.from({ length: ngpus }, (_, index) => (
+    <Line
+      key={index}
+      dataKey={`${field}[${index}]`}
+      name={`GPU ${index}`}
+      stroke={colorScale(index)}
+      type="monotone"
+      activeDot={{ fill: 'transparent' }}
+      dot={{ fill: 'transparent' }}
+      isAnimationActive={false}
+    />
+  ));
+
+/**
+ * Component to display the health and throttling of the GPUs, highlighting
+ * when throttling coincides with a drop in utilization.
+ */
+const GpuHealthChart: React.FC<IChartProps> = ({ settingRegistry }) => {
+  const [isPaused, setIsPaused] = useState(false);
+  const [updateFrequency, setUpdateFrequency] = useState<number>(
+    DEFAULT_UPDATE_FREQUENCY
+  );
+  const [maxRecords, setMaxRecords] = useState<number>(
+    DEFAULT_MAX_RECORDS_TIMESERIES
+  );
+  const [isSettingsLoaded, setIsSettingsLoaded] = useState<boolean>(false);
+
+  loadSettingRegistry(
+    settingRegistry,
+    setUpdateFrequency,
+    setIsSettingsLoaded,
+    setMaxRecords
+  );
+
+  const healthData = useTimeSeries<IGpuHealthProps>(
+    'gpu_health',
+    isPaused,
+    updateFrequency,
+    isSettingsLoaded,
+    maxRecords
+  );
+  const latest = healthData[healthData.length - 1];
+  const ngpus = latest?.gpu_utilization.length || 0;
+  const gpus = Array.from({ length: ngpus }, (_, index) => index);
+  const spans = throttleSpans(healthData, ngpus);
+  // Axes up to the maximum clock, power limit and slowdown temperature
+  const maxOf = (values?: number[]): number =>
+    values ? Math.max(...Array.from(values)) : 0;
+  const maxSmClock = maxOf(latest?.max_sm_clock);
+  const powerLimit = maxOf(latest?.power_limit);
+  const maxTemperature = Math.max(100, maxOf(latest?.slowdown_temperature));
+
+  const colorScale = scaleLinear<string>()
+    .domain([0, ngpus])
+    .range(GPU_COLOR_CATEGORICAL_RANGE);
+
+  return (
+    <div className="gradient-background">
+      <AutoSizer>
+        {({ height, width }: { height: number; width: number }) => (
+          <div style={{ width, height }}>
+            <div
+              className="nv-process-table-container nv-health-summary"
+              style={{ height: (height - 60) / 5 }}
+            >
+              <table className="nv-process-table">
+                <thead>
+                  <tr>
+                    <th>GPU</th>
+                    <th>SM Clock [MHz]</th>
+                    <th>Power [W]</th>
+                    <th>Temp. [°C]</th>
+                    <th>Fan</th>
+                    <th>Throttle Reasons</th>
+                    <th>ECC Corrected / Uncorrected</th>
+                    <th>XID Errors</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {latest &&
+                    gpus.map(gpu => (
+                      <tr
+                        key={gpu}
+                        className={
+                          latest.throttled?.[gpu] ? 'nv-health-throttled' : ''
+                        }
+                      >
+                        <td>{gpu}</td>
+                        <Reading values={latest.sm_clock} gpu={gpu} />
+                        <td>
+                          {latest.power
+                            ? `${Math.round(latest.power[gpu])}` +
+                              (latest.power_limit
+                                ? ` / ${Math.round(latest.power_limit[gpu])}`
+                                : '')
+                            : '-'}
+                        </td>
+                        <Reading values={latest.temperature} gpu={gpu} />
+                        <Reading values={latest.fan_speed} gpu={gpu} unit="%" />
+                        <td>
+                          {latest.throttle_reasons
+                            ? throttleReasonNames(
+                                latest.throttle_reasons[gpu]
+                              ).join(', ') || 'None'
+                            : '-'}
+                        </td>
+                        <td>
+                          {latest.ecc_sbe_volatile && latest.ecc_dbe_volatile
+                            ? `${latest.ecc_sbe_volatile[gpu]} / ${latest.ecc_dbe_volatile[gpu]}`
+                            : '-'}
+                        </td>
+                        <td>
+                          {latest.xid_errors && latest.last_xid
+                            ? latest.xid_errors[gpu] +
+                              (latest.xid_errors[gpu]
+                                ? ` (last XID ${latest.last_xid[gpu]})`
+                                : '')
+                            : '-'}
+                        </td>
+                      </tr>
+                    ))}
+                </tbody>
+              </table>
+            </div>
+            {/* Throttled spans are shaded, darker where utilization dropped */}
+            <strong className="multi-chart-title">
+              GPU Utilization and Throttling [%]
+            </strong>
+            <LineChart
+              data={healthData}
+              width={width * 0.95}
+              height={(height - 60) / 5}
+              syncId="gpu-health-sync"
+            >
+              <XAxis
+                dataKey="time"
+                tickFormatter={formatDate}
+                className="nv-axis-custom"
+              />
+              <YAxis
+                domain={[0, 100]}
+                tickFormatter={value => `${value}%`}
+                className="nv-axis-custom"
+              />
+              <Tooltip
+                content={(data: any) =>
+                  renderCustomTooltip(data, {
+                    labelFormatter: formatDate,
+                    valueFormatter: value => `${value}%`
+                  })
+                }
+              />
+              <Legend verticalAlign="top" align="right" />
+              {spans.map(span => (
+                <ReferenceArea
+                  key={`${span.gpu}-${span.start}`}
+                  x1={span.start}
+                  x2={span.end}
+                  fill={colorScale(span.gpu)}
+                  fillOpacity={span.utilizationDrop ? 0.45 : 0.12}
+                  className={
+                    span.utilizationDrop ? 'nv-health-utilization-drop' : ''
+                  }
+                  ifOverflow="hidden"
+                />
+              ))}
+              {gpuLines('gpu_utilization', ngpus, colorScale)}
+            </LineChart>
+            <hr className="gpu-dashboard-divider" />
+            <CustomLineChart
+              data={healthData}
+              title={'SM Clock (per Device) [MHz]'}
+              yDomain={maxSmClock ? [0, maxSmClock] : undefined}
+              xFormatter={formatDate}
+              yFormatter={value => `${value}`}
+              width={width}
+              height={(height - 60) / 5}
+              syncId="gpu-health-sync"
+            >
+              {gpuLines('sm_clock', latest?.sm_clock ? ngpus : 0, colorScale)}
+            </CustomLineChart>
+            <CustomLineChart
+              data={healthData}
+              title={'Power Draw (per Device) [W]'}
+              yDomain={powerLimit ? [0, powerLimit] : undefined}
+              xFormatter={formatDate}
+              yFormatter={value => `${value}W`}
+              width={width}
+              height={(height - 60) / 5}
+              syncId="gpu-health-sync"
+            >
+              {gpuLines('power', latest?.power ? ngpus : 0, colorScale)}
+            </CustomLineChart>
+            <CustomLineChart
+              data={healthData}
+              title={'Temperature (per Device) [°C]'}
+              yDomain={[0, maxTemperature]}
+              xFormatter={formatDate}
+              yFormatter={value => `${value}°C`}
+              width={width}
+              height={(height - 60) / 5}
+              syncId="gpu-health-sync"
+            >
+              {gpuLines(
+                'temperature',
+                latest?.temperature ? ngpus : 0,
+                colorScale
+              )}
+            </CustomLineChart>
+            <div
+              style={{
+                display: 'flex',
+                alignItems: 'center',
+                width: width,
+                height: 50
+              }}
+            >
+              <Button
+                onClick={() => setIsPaused(!isPaused)}
+                className="gpu-dashboard-button gpu-dashboard-toolbar-button"
+              >
+                {isPaused ? (
+                  <playIcon.react className="nv-icon-custom-time-series" />
+                ) : (
+                  <pauseIcon.react className="nv-icon-custom-time-series" />
+                )}
+              </Button>
+            </div>
+          </div>
+        )}
+      </AutoSizer>
+    </div>
+  );
+};
+
+/**
+ * A widget for rendering the GPU health chart in JupyterLab.
+ */
+export class GpuHealthChartWidget extends ReactWidget {
+  constructor(private settingRegistry: ISettingRegistry) {
+    super();
+    this.addClass('size-constrained-widgets-lg');
+    this.settingRegistry = settingRegistry;
+  }
+  render(): JSX.Element {
+    return <GpuHealthChart settingRegistry={this.settingRegistry} />;
+  }
+}
@@ -21,6 +21,7 @@ import {
   DEFAULT_UPDATE_FREQUENCY
 } from '../assets/constants';
 import { format } from 'd3-format';
+import { categoryAxisWidth } from '../components/formatUtils';
 import AutoSizer from 'react-virtualized-auto-sizer';
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
 import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
@@ -51,7 +52,7 @@ const GpuMemoryChart: React.FC<IChartProps> = ({
 
   // Prepare data for rendering
   const data = gpuMemory.memory_usage.map((memory, index) => ({
-    name: `GPU ${index}`,
+    name: gpuMemory.device_names?.[index] ?? `GPU ${index}`,
     memory: memory,
     totalMemory: gpuMemory.total_memory[index]
   }));
@@ -88,7 +89,12 @@ const GpuMemoryChart: React.FC<IChartProps> = ({
               tickFormatter={formatBytes}
               className="nv-axis-custom"
             />
-            <YAxis type="category" dataKey="name" className="nv-axis-custom" />
+            <YAxis
+              type="category"
+              dataKey="name"
+              width={categoryAxisWidth(data.map(entry => entry.name))}
+              className="nv-axis-custom"
+            />
             <Tooltip
               cursor={{ fill: 'transparent' }}
               content={(data: any) =>
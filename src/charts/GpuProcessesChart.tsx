@@ -0,0 +1,99 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import React, { useState } from 'react';
+import { ReactWidget } from '@jupyterlab/ui-components';
+import { format } from 'd3-format';
+import { ISettingRegistry } from '@jupyterlab/settingregistry';
+import { DEFAULT_UPDATE_FREQUENCY } from '../assets/constants';
+import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
+import { IChartProps, IGpuProcessesProps } from '../assets/interfaces';
+
+// GpuProcessesChart component lists the processes running on each GPU and the notebook they belong to.
+const GpuProcessesChart: React.FC<IChartProps> = ({
+  settingRegistry
+}): JSX.Element => {
+  const [gpuProcesses, setGpuProcesses] = useState<IGpuProcessesProps>({
+    time: 0,
+    processes: []
+  });
+  const [updateFrequency, setUpdateFrequency] = useState<number>(
+    DEFAULT_UPDATE_FREQUENCY
+  );
+  const [isSettingsLoaded, setIsSettingsLoaded] = useState<boolean>(false);
+
+  // Load settings and initialize WebSocket connection
+  loadSettingRegistry(settingRegistry, setUpdateFrequency, setIsSettingsLoaded);
+  useWebSocket<IGpuProcessesProps>(
+    'gpu_processes',
+    false,
+    updateFrequency,
+    setGpuProcesses,
+    isSettingsLoaded
+  );
+
+  // Largest memory users first
+  const processes = [...gpuProcesses.processes].sort(
+    (a, b) => (b.memory_used ?? 0) - (a.memory_used ?? 0)
+  );
+
+  // Formatter for displaying bytes
+  const formatBytes = (value: number | null): string => {
+    return value === null ? 'n/a' : `${format('.2s')(value)}B`;
+  };
+
+  return (
+    <div className="gradient-background nv-process-table-container">
+      <strong className="chart-title">
+        {' '}
+        GPU Processes: {processes.length}{' '}
+      </strong>
+      <table className="nv-process-table">
+        <thead>
+          <tr>
+            <th>GPU</th>
+            <th>PID</th>
+            <th>Process</th>
+            <th>User</th>
+            <th>Memory</th>
+            <th>SM</th>
+            <th>Notebook</th>
+          </tr>
+        </thead>
+        <tbody>
+          {processes.map(process => (
+            <tr key={`${process.gpu}-${process.pid}`}>
+              <td>{process.gpu}</td>
+              <td>{process.pid}</td>
+              <td>{process.name ?? '?'}</td>
+              <td>{process.user ?? '?'}</td>
+              <td>{formatBytes(process.memory_used)}</td>
+              <td>{process.sm_utilization}%</td>
+              <td title={process.kernel_id ?? undefined}>
+                {process.path ??
+                  (process.kernel_id
+                    ? `${process.kernel_name} kernel ${process.kernel_id.slice(0, 8)}`
+                    : '')}
+              </td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+};
+
+// GpuProcessesChartWidget is a ReactWidget that renders the GpuProcessesChart component.
+export class GpuProcessesChartWidget extends ReactWidget {
+  constructor(private settingRegistry: ISettingRegistry) {
+    super();
+    this.addClass('size-constrained-widgets');
+    this.settingRegistry = settingRegistry;
+  }
+
+  render(): JSX.Element {
+    return <GpuProcessesChart settingRegistry={this.settingRegistry} />;
+  }
+}
@@ -16,7 +16,11 @@ import {
   GPU_COLOR_CATEGORICAL_RANGE
 } from '../assets/constants';
 import { pauseIcon, playIcon } from '../assets/icons';
-import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
+import {
+  getChartRenderer,
+  loadSettingRegistry,
+  useTimeSeries
+} from '../assets/hooks';
 import { IChartProps, IGpuResourceProps } from '../assets/interfaces';
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
 
@@ -24,10 +28,7 @@ import { ISettingRegistry } from '@jupyterlab/settingregistry';
  * Component to display GPU resource charts in the Nvdashboard.
  */
 const GpuResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
-  const [gpuData, setGpuData] = useState<IGpuResourceProps[]>([]);
-  const [tempData, setTempData] = useState<IGpuResourceProps[]>([]);
   const [isPaused, setIsPaused] = useState(false);
-  const ngpus = gpuData[0]?.gpu_utilization_individual.length || 0;
   const [updateFrequency, setUpdateFrequency] = useState<number>(
     DEFAULT_UPDATE_FREQUENCY
   );
@@ -44,34 +45,15 @@ const GpuResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
     setMaxRecords
   );
 
-  // Process incoming data from the WebSocket and manage the GPU data state.
-  const processData = (response: IGpuResourceProps, isPaused: boolean) => {
-    if (!isPaused) {
-      setGpuData(prevData => {
-        let newData =
-          tempData.length > 1
-            ? [...prevData, ...tempData, response]
-            : [...prevData, response];
-        // Truncate data if it exceeds the maximum records limit.
-        if (newData.length > maxRecords) {
-          newData = newData.slice(-maxRecords);
-        }
-        return newData;
-      });
-      setTempData([]);
-    } else {
-      setTempData(prevTempData => [...prevTempData, response]);
-    }
-  };
-
-  // Establish a WebSocket connection and listen for data updates.
-  useWebSocket<IGpuResourceProps>(
+  // Stream the GPU data into its shared store and read the latest window.
+  const gpuData = useTimeSeries<IGpuResourceProps>(
     'gpu_resource',
     isPaused,
     updateFrequency,
-    processData,
-    isSettingsLoaded
+    isSettingsLoaded,
+    maxRecords
   );
+  const ngpus = gpuData[0]?.gpu_utilization_individual.length || 0;
 
   // Handle click events for the pause/play button.
   const handlePauseClick = () => {
@@ -209,23 +191,26 @@ const GpuResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
                 height: 50
               }}
             >
-              <LineChart
-                data={gpuData}
-                width={width * 0.95}
-                syncId="gpu-resource-sync"
-                height={50}
-                compact={true}
-              >
-                <XAxis dataKey="time" height={0} />
-                <YAxis height={0} />
+              {/* The canvas renderer draws the whole window */}
+              {getChartRenderer() !== 'canvas' && (
+                <LineChart
+                  data={gpuData}
+                  width={width * 0.95}
+                  syncId="gpu-resource-sync"
+                  height={50}
+                  compact={true}
+                >
+                  <XAxis dataKey="time" height={0} />
+                  <YAxis height={0} />
 
-                <Brush
-                  dataKey={'time'}
-                  tickFormatter={formatDate}
-                  startIndex={Math.max(gpuData.length - 10, 0)}
-                  fill="none"
-                />
-              </LineChart>
+                  <Brush
+                    dataKey={'time'}
+                    tickFormatter={formatDate}
+                    startIndex={Math.max(gpuData.length - 10, 0)}
+                    fill="none"
+                  />
+                </LineChart>
+              )}
               <Button
                 onClick={handlePauseClick}
                 className="gpu-dashboard-button gpu-dashboard-toolbar-button"
@@ -20,6 +20,7 @@ import {
   BAR_COLOR_LINEAR_RANGE,
   DEFAULT_UPDATE_FREQUENCY
 } from '../assets/constants';
+import { categoryAxisWidth } from '../components/formatUtils';
 import AutoSizer from 'react-virtualized-auto-sizer';
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
 import { IChartProps, IGpuUtilizationProps } from '../assets/interfaces';
@@ -48,7 +49,7 @@ const GpuUtilizationChart: React.FC<IChartProps> = ({
 
   // Prepare data for rendering
   const data = gpuUtilization?.gpu_utilization.map((utilization, index) => ({
-    name: `GPU ${index}`,
+    name: gpuUtilization?.device_names?.[index] ?? `GPU ${index}`,
     utilization: utilization
   }));
 
@@ -80,6 +81,7 @@ const GpuUtilizationChart: React.FC<IChartProps> = ({
             <YAxis
               type="category"
               dataKey="name"
+              width={categoryAxisWidth(data?.map(entry => entry.name) ?? [])}
               tick={{ fill: 'var(--nv-custom-tick-color)' }}
               className="nv-axis-custom"
             />
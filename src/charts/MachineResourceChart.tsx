@@ -18,14 +18,17 @@ import {
 import { pauseIcon, playIcon } from '../assets/icons';
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
 import { ICPUResourceProps, IChartProps } from '../assets/interfaces';
-import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
+import {
+  getChartRenderer,
+  loadSettingRegistry,
+  useTimeSeries
+} from '../assets/hooks';
+import { TimeSeriesStore } from '../assets/store';
 
 /**
  * Component to display CPU resource charts in the Nvdashboard.
  */
 const MachineResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
-  const [cpuData, setCpuData] = useState<ICPUResourceProps[]>([]);
-  const [tempData, setTempData] = useState<ICPUResourceProps[]>([]);
   const [isPaused, setIsPaused] = useState(false);
   const [updateFrequency, setUpdateFrequency] = useState<number>(
     DEFAULT_UPDATE_FREQUENCY
@@ -43,48 +46,33 @@ const MachineResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
     setMaxRecords
   );
 
-  // Process incoming data from the WebSocket and manage the CPU data state.
-  const processData = (response: ICPUResourceProps, isPaused: any) => {
-    if (cpuData.length > 0) {
-      response = {
-        ...response,
-        disk_read_current:
-          response.disk_read - cpuData[cpuData.length - 1].disk_read,
-        disk_write_current:
-          response.disk_write - cpuData[cpuData.length - 1].disk_write,
-        network_read_current:
-          response.network_read - cpuData[cpuData.length - 1].network_read,
-        network_write_current:
-          response.network_write - cpuData[cpuData.length - 1].network_write
-      };
-    }
-    if (!isPaused) {
-      setCpuData(prevData => {
-        let newData;
-        if (tempData.length > 1) {
-          newData = [...prevData, ...tempData, response];
-        } else {
-          newData = [...prevData, response];
-        }
-        // Truncate data if it exceeds the maximum records limit.
-        if (newData.length > maxRecords) {
-          newData = newData.slice(-1 * maxRecords);
-        }
-        return newData;
-      });
-      setTempData([]);
-    } else {
-      setTempData([...tempData, response]);
+  // Bandwidths are the change of the I/O counters since the previous sample.
+  const transform = (
+    response: ICPUResourceProps,
+    store: TimeSeriesStore
+  ): ICPUResourceProps => {
+    if (store.size === 0) {
+      return response;
     }
+    return {
+      ...response,
+      disk_read_current: response.disk_read - store.latest('disk_read')!,
+      disk_write_current: response.disk_write - store.latest('disk_write')!,
+      network_read_current:
+        response.network_read - store.latest('network_read')!,
+      network_write_current:
+        response.network_write - store.latest('network_write')!
+    };
   };
 
-  // Establish a WebSocket connection and listen for data updates.
-  useWebSocket<ICPUResourceProps>(
+  // Stream the CPU data into its shared store and read the latest window.
+  const cpuData = useTimeSeries<ICPUResourceProps>(
     'cpu_resource',
     isPaused,
     updateFrequency,
-    processData,
-    isSettingsLoaded
+    isSettingsLoaded,
+    maxRecords,
+    transform
   );
 
   // Handle click events for the pause/play button.
@@ -192,22 +180,25 @@ const MachineResourceChart: React.FC<IChartProps> = ({ settingRegistry }) => {
                 alignItems: 'center'
               }}
             >
-              <LineChart
-                data={cpuData}
-                width={width * 0.95}
-                syncId="cpu-resource-sync"
-                height={50}
-                compact={true}
-              >
-                <XAxis dataKey="time" height={0} />
-                <YAxis height={0} />
-                <Brush
-                  dataKey={'time'}
-                  tickFormatter={formatDate}
-                  startIndex={Math.max(cpuData.length - 10, 0)}
-                  fill="none"
-                />
-              </LineChart>
+              {/* The canvas renderer draws the whole window */}
+              {getChartRenderer() !== 'canvas' && (
+                <LineChart
+                  data={cpuData}
+                  width={width * 0.95}
+                  syncId="cpu-resource-sync"
+                  height={50}
+                  compact={true}
+                >
+                  <XAxis dataKey="time" height={0} />
+                  <YAxis height={0} />
+                  <Brush
+                    dataKey={'time'}
+                    tickFormatter={formatDate}
+                    startIndex={Math.max(cpuData.length - 10, 0)}
+                    fill="none"
+                  />
+                </LineChart>
+              )}
               <Button
                 onClick={handlePauseClick}
                 className="gpu-dashboard-button gpu-dashboard-toolbar-button"
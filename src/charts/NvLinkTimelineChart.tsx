@@ -18,16 +18,17 @@ import {
 } from '../assets/constants';
 import { ISettingRegistry } from '@jupyterlab/settingregistry';
 import { IChartProps, INVLinkTimeLineProps } from '../assets/interfaces';
-import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
+import {
+  getChartRenderer,
+  loadSettingRegistry,
+  useTimeSeries
+} from '../assets/hooks';
 
 /**
  * Component to display Nvlink stats in a timeseries format in the Nvdashboard.
  */
 const NvLinkTimelineChart: React.FC<IChartProps> = ({ settingRegistry }) => {
-  const [nvlinkStats, setNvLinkStats] = useState<INVLinkTimeLineProps[]>([]);
-  const [tempData, setTempData] = useState<INVLinkTimeLineProps[]>([]);
   const [isPaused, setIsPaused] = useState(false);
-  const ngpus = nvlinkStats[0]?.nvlink_tx.length || 0;
   const [updateFrequency, setUpdateFrequency] = useState<number>(
     DEFAULT_UPDATE_FREQUENCY
   );
@@ -44,37 +45,17 @@ const NvLinkTimelineChart: React.FC<IChartProps> = ({ settingRegistry }) => {
     setMaxRecords
   );
 
-  // Process incoming data from the WebSocket and manage the nvlink stats.
-  const processData = (response: INVLinkTimeLineProps, isPaused: any) => {
-    response.time = Date.now();
-    if (!isPaused) {
-      setNvLinkStats(prevData => {
-        let newData;
-        if (tempData.length > 1) {
-          newData = [...prevData, ...tempData, response];
-        } else {
-          newData = [...prevData, response];
-        }
-        // Truncate data if it exceeds 1000 records
-        if (newData.length > maxRecords) {
-          newData = newData.slice(-1 * maxRecords);
-        }
-        return newData;
-      });
-      setTempData([]);
-    } else {
-      setTempData([...tempData, response]);
-    }
-  };
-
-  // Establish a WebSocket connection and listen for data updates.
-  useWebSocket<INVLinkTimeLineProps>(
+  // Stream the nvlink stats into their shared store and read the latest window.
+  const nvlinkStats = useTimeSeries<INVLinkTimeLineProps>(
     'nvlink_throughput',
     isPaused,
     updateFrequency,
-    processData,
-    isSettingsLoaded
+    isSettingsLoaded,
+    maxRecords,
+    // Backfilled samples carry the time they were recorded on the server
+    response => ({ ...response, time: response.time || Date.now() })
   );
+  const ngpus = nvlinkStats[0]?.nvlink_tx.length || 0;
 
   // Handle click events for the pause/play button.
   const handlePauseClick = () => {
@@ -150,22 +131,25 @@ const NvLinkTimelineChart: React.FC<IChartProps> = ({ settingRegistry }) => {
                 height: 50
               }}
             >
-              <LineChart
-                data={nvlinkStats}
-                width={width * 0.95}
-                syncId="gpu-resource-sync"
-                height={50}
-                compact={true}
-              >
-                <XAxis dataKey="time" height={0} />
-                <YAxis height={0} />
-                <Brush
-                  dataKey={'time'}
-                  tickFormatter={formatDate}
-                  startIndex={Math.max(nvlinkStats.length - 10, 0)}
-                  fill="none"
-                />
-              </LineChart>
+              {/* The canvas renderer draws the whole window */}
+              {getChartRenderer() !== 'canvas' && (
+                <LineChart
+                  data={nvlinkStats}
+                  width={width * 0.95}
+                  syncId="gpu-resource-sync"
+                  height={50}
+                  compact={true}
+                >
+                  <XAxis dataKey="time" height={0} />
+                  <YAxis height={0} />
+                  <Brush
+                    dataKey={'time'}
+                    tickFormatter={formatDate}
+                    startIndex={Math.max(nvlinkStats.length - 10, 0)}
+                    fill="none"
+                  />
+                </LineChart>
+              )}
               <Button
                 onClick={handlePauseClick}
                 className="gpu-dashboard-button gpu-dashboard-toolbar-button"
@@ -0,0 +1,292 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import React, { useEffect, useState } from 'react';
+import { ReactWidget } from '@jupyterlab/ui-components';
+import { URLExt } from '@jupyterlab/coreutils';
+import { ServerConnection } from '@jupyterlab/services';
+import { ISettingRegistry } from '@jupyterlab/settingregistry';
+import { scaleLinear } from 'd3-scale';
+import { format } from 'd3-format';
+import {
+  BAR_COLOR_LINEAR_RANGE,
+  DEFAULT_UPDATE_FREQUENCY
+} from '../assets/constants';
+import { loadSettingRegistry, useWebSocket } from '../assets/hooks';
+import {
+  IChartProps,
+  INVLinkThroughputProps,
+  ITopologyNvLink,
+  ITopologyProps
+} from '../assets/interfaces';
+
+// Layout of the topology graph, in SVG user units
+const WIDTH = 400;
+const HEIGHT = 300;
+const RADIUS = 110;
+const NODE_SIZE = 44;
+
+// Milliseconds between requests while the server is still discovering the GPUs
+const DISCOVERY_RETRY = 5000;
+
+/**
+ * Fetches the GPU topology, which the server discovers once and caches.
+ * Returns 'initializing' while the server is still discovering the GPUs.
+ */
+const fetchTopology = async (): Promise<
+  ITopologyProps | 'initializing' | null
+> => {
+  const settings = ServerConnection.makeSettings();
+  const url = URLExt.join(settings.baseUrl, 'nvdashboard', 'topology');
+  try {
+    const response = await ServerConnection.makeRequest(url, {}, settings);
+    if (response.status === 503) {
+      return 'initializing';
+    }
+    if (!response.ok) {
+      throw new ServerConnection.ResponseError(response);
+    }
+    return (await response.json()) as ITopologyProps;
+  } catch (error) {
+    console.error('Error fetching GPU topology:', error);
+    return null;
+  }
+};
+
+// TopologyChart component draws the NVLink graph of the GPUs, colored by live link utilization,
+// and lists how each GPU connects to the others and to the CPUs.
+const TopologyChart: React.FC<IChartProps> = ({ settingRegistry }) => {
+  const [topology, setTopology] = useState<ITopologyProps | null>(null);
+  const [nvlinkStats, setNvLinkStats] = useState<INVLinkThroughputProps>();
+  const [updateFrequency, setUpdateFrequency] = useState<number>(
+    DEFAULT_UPDATE_FREQUENCY
+  );
+  const [isSettingsLoaded, setIsSettingsLoaded] = useState<boolean>(false);
+
+  useEffect(() => {
+    let timeout: ReturnType<typeof setTimeout> | undefined;
+    let cancelled = false;
+    const load = async () => {
+      const result = await fetchTopology();
+      if (cancelled) {
+        return;
+      }
+      if (result === 'initializing') {
+        timeout = setTimeout(load, DISCOVERY_RETRY);
+      } else {
+        setTopology(result);
+      }
+    };
+    load();
+    return () => {
+      cancelled = true;
+      clearTimeout(timeout);
+    };
+  }, []);
+
+  // Load settings and initialize WebSocket connection
+  loadSettingRegistry(settingRegistry, setUpdateFrequency, setIsSettingsLoaded);
+  useWebSocket<INVLinkThroughputProps>(
+    'nvlink_throughput',
+    false,
+    updateFrequency,
+    setNvLinkStats,
+    isSettingsLoaded
+  );
+
+  if (!topology) {
+    return (
+      <div className="gradient-background">
+        <strong className="chart-title"> GPU Topology </strong>
+      </div>
+    );
+  }
+
+  const ngpus = topology.gpus.length;
+
+  // Per-link rates are laid out GPU-major over the active links
+  const linkRate = (gpu: number, link: number): number => {
+    const index = nvlinkStats?.nvlink_links?.indexOf(link) ?? -1;
+    if (!nvlinkStats || index < 0) {
+      return 0;
+    }
+    const offset = gpu * nvlinkStats.nvlink_links.length + index;
+    return (
+      (nvlinkStats.nvlink_rx_links[offset] || 0) +
+      (nvlinkStats.nvlink_tx_links[offset] || 0)
+    );
+  };
+
+  // Utilization of a bundle of links of one GPU, against their RX + TX bandwidth
+  const bundle = (gpu: number, links: ITopologyNvLink[]) => {
+    const rate = links.reduce(
+      (sum, link) => sum + linkRate(gpu, link.link),
+      0
+    );
+    const capacity = 2 * links.length * (nvlinkStats?.max_link_bw || 0);
+    return { rate, utilization: capacity ? Math.min(rate / capacity, 1) : 0 };
+  };
+
+  const position = (gpu: number) => {
+    const angle = (2 * Math.PI * gpu) / Math.max(ngpus, 1) - Math.PI / 2;
+    return {
+      x: WIDTH / 2 + RADIUS * Math.cos(angle),
+      y: HEIGHT / 2 + RADIUS * Math.sin(angle)
+    };
+  };
+
+  // One edge per connected pair of GPUs, and per GPU attached to the NVSwitch
+  const center = { x: WIDTH / 2, y: HEIGHT / 2 };
+  const edges = topology.nvlinks.flatMap((links, gpu) => {
+    const switchLinks = links.filter(link => link.remote === 'switch');
+    const switchEdge = switchLinks.length
+      ? [
+          {
+            from: position(gpu),
+            to: center,
+            links: switchLinks.length,
+            ...bundle(gpu, switchLinks)
+          }
+        ]
+      : [];
+    const peerEdges = Array.from(new Set(links.map(link => link.peer)))
+      .filter((peer): peer is number => peer !== null && peer > gpu)
+      .map(peer => {
+        const peerLinks = links.filter(link => link.peer === peer);
+        return {
+          from: position(gpu),
+          to: position(peer),
+          links: peerLinks.length,
+          ...bundle(gpu, peerLinks)
+        };
+      });
+    return [...switchEdge, ...peerEdges];
+  });
+  const hasSwitch = topology.nvlinks.some(links =>
+    links.some(link => link.remote === 'switch')
+  );
+
+  // Create a color scale for the edges
+  const colorScale = scaleLinear<string>()
+    .domain([0, 1])
+    .range(BAR_COLOR_LINEAR_RANGE);
+
+  // Formatter for displaying bytes
+  const formatBytes = (bytes: number): string => {
+    return `${format('.2s')(bytes)}B/s`;
+  };
+
+  return (
+    <div className="gradient-background nv-topology-container">
+      <strong className="chart-title"> GPU Topology </strong>
+      {edges.length > 0 && (
+        <svg
+          className="nv-topology-graph"
+          viewBox={`0 0 ${WIDTH} ${HEIGHT}`}
+          preserveAspectRatio="xMidYMid meet"
+        >
+          {edges.map((edge, index) => (
+            <line
+              key={index}
+              x1={edge.from.x}
+              y1={edge.from.y}
+              x2={edge.to.x}
+              y2={edge.to.y}
+              stroke={colorScale(edge.utilization)}
+              strokeOpacity={0.3 + 0.7 * edge.utilization}
+              strokeWidth={1 + Math.log2(edge.links + 1)}
+            >
+              <title>
+                {`${edge.links} links: ${formatBytes(edge.rate)} (${format('.0%')(edge.utilization)})`}
+              </title>
+            </line>
+          ))}
+          {hasSwitch && (
+            <g>
+              <rect
+                className="nv-topology-node"
+                x={center.x - NODE_SIZE}
+                y={center.y - NODE_SIZE / 4}
+                width={2 * NODE_SIZE}
+                height={NODE_SIZE / 2}
+              />
+              <text x={center.x} y={center.y}>
+                NVSwitch
+              </text>
+            </g>
+          )}
+          {topology.gpus.map(gpu => {
+            const { x, y } = position(gpu.index);
+            return (
+              <g key={gpu.index}>
+                <rect
+                  className="nv-topology-node"
+                  x={x - NODE_SIZE / 2}
+                  y={y - NODE_SIZE / 2}
+                  width={NODE_SIZE}
+                  height={NODE_SIZE}
+                  rx={4}
+                />
+                <text x={x} y={y - 7}>
+                  GPU {gpu.index}
+                </text>
+                <text x={x} y={y + 9}>
+                  {gpu.numa_node === null ? '' : `NUMA ${gpu.numa_node}`}
+                </text>
+              </g>
+            );
+          })}
+        </svg>
+      )}
+      <table className="nv-process-table">
+        <thead>
+          <tr>
+            <th></th>
+            {topology.gpus.map(gpu => (
+              <th key={gpu.index}>GPU{gpu.index}</th>
+            ))}
+            <th>CPU Affinity</th>
+            <th>NUMA</th>
+          </tr>
+        </thead>
+        <tbody>
+          {topology.gpus.map(gpu => (
+            <tr
+              key={gpu.index}
+              title={`${gpu.name ?? ''} ${gpu.bus_id ?? ''}`}
+            >
+              <th>GPU{gpu.index}</th>
+              {topology.paths[gpu.index].map((path, peer) => (
+                <td
+                  key={peer}
+                  className={
+                    path?.startsWith('NV') ? 'nv-topology-path-nvlink' : ''
+                  }
+                >
+                  {path ?? '?'}
+                </td>
+              ))}
+              <td>{gpu.cpus || '?'}</td>
+              <td>{gpu.numa_node ?? '?'}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+};
+
+// TopologyChartWidget is a ReactWidget that renders the TopologyChart component.
+export class TopologyChartWidget extends ReactWidget {
+  constructor(private settingRegistry: ISettingRegistry) {
+    super();
+    this.addClass('size-constrained-widgets');
+    this.settingRegistry = settingRegistry;
+  }
+
+  render(): JSX.Element {
+    return <TopologyChart settingRegistry={this.settingRegistry} />;
+  }
+}
@@ -0,0 +1,55 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+/**
+ * Tests for the GPU health chart helpers
+ */
+
+import { throttleReasonNames, throttleSpans } from '../GpuHealthChart';
+
+// Only the helpers are tested, not the widget
+jest.mock('@jupyterlab/ui-components', () => ({ ReactWidget: class {} }));
+jest.mock('../../assets/icons', () => ({}));
+jest.mock('../../assets/hooks', () => ({}));
+jest.mock('../../components/customLineChart', () => ({}));
+
+describe('throttleReasonNames', () => {
+  it('names the bits of the mask', () => {
+    expect(throttleReasonNames(0)).toEqual([]);
+    expect(throttleReasonNames(0x4 | 0x40)).toEqual([
+      'SW Power Cap',
+      'HW Thermal Slowdown'
+    ]);
+  });
+});
+
+describe('throttleSpans', () => {
+  const sample = (time: number, utilization: number, throttled: number) => ({
+    time,
+    gpu_utilization: [utilization, 50],
+    throttled: [throttled, 0]
+  });
+
+  it('groups consecutive throttled samples of each GPU', () => {
+    const data = [
+      sample(0, 90, 0),
+      sample(1, 90, 1),
+      sample(2, 85, 1),
+      sample(3, 90, 0),
+      sample(4, 90, 1),
+      sample(5, 40, 1)
+    ];
+
+    expect(throttleSpans(data, 2)).toEqual([
+      { gpu: 0, start: 1, end: 2, utilizationDrop: false },
+      // Utilization fell from 90% while throttled
+      { gpu: 0, start: 4, end: 5, utilizationDrop: true }
+    ]);
+  });
+
+  it('skips samples without throttle reasons', () => {
+    expect(throttleSpans([{ time: 0, gpu_utilization: [0] }], 1)).toEqual([]);
+  });
+});
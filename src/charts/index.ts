@@ -10,6 +10,10 @@ import { MachineResourceChartWidget } from './MachineResourceChart';
 import { PciThroughputChartWidget } from './PciThroughputChart';
 import { NvLinkThroughputChartWidget } from './NvLinkThroughputChart';
 import { NvLinkTimelineChartWidget } from './NvLinkTimelineChart';
+import { GpuProcessesChartWidget } from './GpuProcessesChart';
+import { TopologyChartWidget } from './TopologyChart';
+import { DiagnosticsChartWidget } from './DiagnosticsChart';
+import { GpuHealthChartWidget } from './GpuHealthChart';
 export {
   GpuMemoryChartWidget,
   GpuUtilizationChartWidget,
@@ -17,5 +21,9 @@ export {
   MachineResourceChartWidget,
   PciThroughputChartWidget,
   NvLinkThroughputChartWidget,
-  NvLinkTimelineChartWidget
+  NvLinkTimelineChartWidget,
+  GpuProcessesChartWidget,
+  TopologyChartWidget,
+  DiagnosticsChartWidget,
+  GpuHealthChartWidget
 };
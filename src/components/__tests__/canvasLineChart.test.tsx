@@ -0,0 +1,79 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+/**
+ * Tests for the canvas line chart helpers
+ */
+
+import React from 'react';
+import { decimate, niceCeil, seriesOf } from '../canvasLineChart';
+
+// Stand-in for the recharts <Line> children, which are only read for props
+const Line: React.FC<{ dataKey: string; name?: string; stroke?: string }> =
+  () => null;
+
+describe('seriesOf', () => {
+  it('reads the series of the children', () => {
+    const series = seriesOf([
+      <Line key={0} dataKey="cpu_utilization" name="CPU" stroke="#f00" />,
+      <Line key={1} dataKey="gpu_utilization_individual[3]" />
+    ]);
+
+    expect(series).toEqual([
+      { name: 'CPU', stroke: '#f00', field: 'cpu_utilization', index: null },
+      {
+        name: 'gpu_utilization_individual[3]',
+        stroke: '#000',
+        field: 'gpu_utilization_individual',
+        index: 3
+      }
+    ]);
+  });
+});
+
+describe('decimate', () => {
+  it('keeps the first, min, max and last value of each column', () => {
+    const data = [1, 5, -2, 3, 4, 7].map((value, time) => ({ time, value }));
+    // Two samples per pixel column, except the last sample
+    const columns = decimate(
+      data,
+      0,
+      row => row.value,
+      time => (time === 5 ? 3 : time / 2)
+    );
+
+    expect(columns).toEqual([
+      { x: 0, first: 1, min: 1, max: 5, last: 5 },
+      { x: 1, first: -2, min: -2, max: 3, last: 3 },
+      { x: 2, first: 4, min: 4, max: 4, last: 4 },
+      { x: 3, first: 7, min: 7, max: 7, last: 7 }
+    ]);
+  });
+
+  it('skips missing values', () => {
+    const data = [
+      { time: 0, value: [1] },
+      { time: 1 },
+      { time: 2, value: [3] }
+    ];
+    const columns = decimate(
+      data,
+      1,
+      (row: any) => row.value?.[0],
+      time => time
+    );
+
+    expect(columns.map(column => column.x)).toEqual([2]);
+  });
+});
+
+describe('niceCeil', () => {
+  it('rounds up to a round number', () => {
+    expect(niceCeil(0)).toBe(1);
+    expect(niceCeil(7)).toBe(10);
+    expect(niceCeil(180)).toBe(200);
+    expect(niceCeil(2.1e9)).toBe(2.5e9);
+  });
+});
@@ -0,0 +1,469 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import React, { useLayoutEffect, useRef, useState } from 'react';
+import { renderCustomTooltip } from './tooltipUtils';
+
+/**
+ * A line of the chart, as declared by a recharts `<Line>` child.
+ */
+export interface ISeries {
+  name: string;
+  stroke: string;
+  field: string;
+  // Position in a list field, e.g. 3 for `gpu_utilization_individual[3]`
+  index: number | null;
+}
+
+/**
+ * The samples of a series falling in one pixel column.
+ */
+export interface IColumn {
+  x: number;
+  first: number;
+  min: number;
+  max: number;
+  last: number;
+}
+
+// Space around the plot for the legend and the axis labels, in CSS pixels
+const MARGIN = { left: 70, right: 10, top: 28, bottom: 24 };
+const Y_TICKS = 5;
+const X_TICKS = 4;
+
+// Data keys of the `<Line>` children, a field or an item of a list field
+const DATA_KEY = /^(\w+)(?:\[(\d+)\])?$/;
+
+/**
+ * Returns the series declared by the recharts `<Line>` children of a chart.
+ */
+export const seriesOf = (children: React.ReactNode): ISeries[] =>
+  React.Children.toArray(children)
+    .filter(React.isValidElement)
+    .map(child => {
+      const { dataKey, name, stroke } = child.props as {
+        dataKey: string;
+        name?: string;
+        stroke?: string;
+      };
+      const match = DATA_KEY.exec(dataKey);
+      return {
+        name: name || dataKey,
+        stroke: stroke || '#000',
+        field: match ? match[1] : dataKey,
+        index: match && match[2] !== undefined ? Number(match[2]) : null
+      };
+    });
+
+const valueOf = (row: any, series: ISeries): number => {
+  const value = row[series.field];
+  return series.index === null ? value : value?.[series.index];
+};
+
+/**
+ * Returns the smallest of 1, 2, 2.5 and 5 times a power of ten that is at
+ * least `value`, to keep automatic axes on round numbers.
+ */
+export const niceCeil = (value: number): number => {
+  if (!(value > 0)) {
+    return 1;
+  }
+  const power = Math.pow(10, Math.floor(Math.log10(value)));
+  return [1, 2, 2.5, 5, 10].find(step => step * power >= value)! * power;
+};
+
+/**
+ * Returns the index of the first sample at or after `time`.
+ */
+const bisect = (data: any[], time: number): number => {
+  let low = 0;
+  let high = data.length;
+  while (low < high) {
+    const middle = (low + high) >>> 1;
+    if (data[middle].time < time) {
+      low = middle + 1;
+    } else {
+      high = middle;
+    }
+  }
+  return low;
+};
+
+/**
+ * Reduces samples `from` onwards to the first, min, max and last value of
+ * each pixel column they fall in, so that drawing costs at most four points
+ * per column however many samples the window holds.
+ */
+export const decimate = (
+  data: any[],
+  from: number,
+  value: (row: any) => number,
+  x: (time: number) => number
+): IColumn[] => {
+  const columns: IColumn[] = [];
+  let column: IColumn | null = null;
+  for (let i = from; i < data.length; i++) {
+    const y = value(data[i]);
+    if (typeof y !== 'number' || isNaN(y)) {
+      continue;
+    }
+    const px = Math.floor(x(data[i].time));
+    if (column && column.x === px) {
+      column.min = Math.min(column.min, y);
+      column.max = Math.max(column.max, y);
+      column.last = y;
+    } else {
+      column = { x: px, first: y, min: y, max: y, last: y };
+      columns.push(column);
+    }
+  }
+  return columns;
+};
+
+/**
+ * Draws the lines of a chart on a canvas, appending new samples instead of
+ * redrawing the window.
+ *
+ * The time axis scrolls by shifting the pixels already drawn, and only the
+ * columns of new samples are drawn. The whole window is redrawn when the
+ * size, series or y axis change, when the window jumps, e.g. on resume, and
+ * once per plot width scrolled, which also lets automatic axes shrink.
+ */
+class IncrementalRenderer {
+  private key = '';
+  // Time at the right edge of the plot and the scale of the time axis
+  private end = 0;
+  private msPerPixel = 0;
+  private scrolled = 0;
+  private lastTime = -Infinity;
+  domain: [number, number] = [0, 1];
+
+  constructor(private canvas: HTMLCanvasElement) {}
+
+  x(time: number, width: number): number {
+    return width - (this.end - time) / this.msPerPixel;
+  }
+
+  time(x: number, width: number): number {
+    return this.end - (width - x) * this.msPerPixel;
+  }
+
+  draw(
+    data: any[],
+    series: ISeries[],
+    width: number,
+    height: number,
+    yDomain?: [number, number]
+  ): void {
+    const ratio = window.devicePixelRatio || 1;
+    const key = `${width},${height},${ratio},${yDomain},${series.map(
+      s => s.name + s.stroke
+    )}`;
+    const n = data.length;
+    if (n === 0) {
+      this.resize(width, height, ratio);
+      this.key = '';
+      return;
+    }
+    const first = data[0].time;
+    const last = data[n - 1].time;
+    const span = Math.max(last - first, 1);
+    let from = bisect(data, this.lastTime);
+    let left = 0;
+    let full =
+      key !== this.key ||
+      first > this.lastTime ||
+      last < this.lastTime ||
+      this.scrolled >= width ||
+      Math.abs(span / width - this.msPerPixel) > 0.25 * this.msPerPixel;
+    if (
+      !full &&
+      !yDomain &&
+      this.maxOf(data, from, series) > this.domain[1]
+    ) {
+      full = true;
+    }
+
+    const context = this.canvas.getContext('2d')!;
+    if (full) {
+      this.key = key;
+      this.resize(width, height, ratio);
+      this.msPerPixel = span / width;
+      this.end = last;
+      this.scrolled = 0;
+      this.domain = yDomain || [0, niceCeil(this.maxOf(data, 0, series))];
+      from = 0;
+    } else {
+      const shift = Math.floor((last - this.end) / this.msPerPixel);
+      if (shift > 0) {
+        context.save();
+        context.setTransform(1, 0, 0, 1, 0, 0);
+        context.globalCompositeOperation = 'copy';
+        context.drawImage(this.canvas, -shift * ratio, 0);
+        context.restore();
+        this.end += shift * this.msPerPixel;
+        this.scrolled += shift;
+      }
+      // Redraw the column of the last drawn sample, which new samples may
+      // extend, and everything right of it
+      left = Math.floor(this.x(this.lastTime, width));
+      from = bisect(data, this.time(left, width));
+      context.clearRect(left, 0, width - left, height);
+    }
+    this.lastTime = last;
+
+    const x = (time: number) => this.x(time, width);
+    const [low, high] = this.domain;
+    const y = (value: number) =>
+      height - ((value - low) / (high - low || 1)) * height;
+    context.save();
+    context.beginPath();
+    context.rect(left, 0, width - left, height);
+    context.clip();
+    context.lineWidth = 1.5;
+    context.lineJoin = 'round';
+    series.forEach(s => {
+      // Start from the previous sample to connect to the line already drawn
+      const columns = decimate(
+        data,
+        Math.max(from - 1, 0),
+        row => valueOf(row, s),
+        x
+      );
+      context.beginPath();
+      columns.forEach((column, i) => {
+        const px = column.x + 0.5;
+        const move = i === 0 ? 'moveTo' : 'lineTo';
+        context[move](px, y(column.first));
+        context.lineTo(px, y(column.min));
+        context.lineTo(px, y(column.max));
+        context.lineTo(px, y(column.last));
+      });
+      context.strokeStyle = s.stroke;
+      context.stroke();
+    });
+    context.restore();
+  }
+
+  private resize(width: number, height: number, ratio: number): void {
+    this.canvas.width = Math.round(width * ratio);
+    this.canvas.height = Math.round(height * ratio);
+    this.canvas.style.width = `${width}px`;
+    this.canvas.style.height = `${height}px`;
+    this.canvas.getContext('2d')!.setTransform(ratio, 0, 0, ratio, 0, 0);
+  }
+
+  private maxOf(data: any[], from: number, series: ISeries[]): number {
+    let max = -Infinity;
+    for (let i = from; i < data.length; i++) {
+      for (const s of series) {
+        const value = valueOf(data[i], s);
+        if (value > max) {
+          max = value;
+        }
+      }
+    }
+    return max;
+  }
+}
+
+/**
+ * Draws the axes, grid and hover line over the plot, which is cheap enough
+ * to redraw on every update.
+ */
+const drawOverlay = (
+  canvas: HTMLCanvasElement,
+  renderer: IncrementalRenderer,
+  data: any[],
+  width: number,
+  height: number,
+  plot: { width: number; height: number },
+  xFormatter?: (value: number | string | undefined) => string,
+  yFormatter?: (value: number | undefined) => string,
+  hover?: number | null
+) => {
+  const ratio = window.devicePixelRatio || 1;
+  canvas.width = Math.round(width * ratio);
+  canvas.height = Math.round(height * ratio);
+  canvas.style.width = `${width}px`;
+  canvas.style.height = `${height}px`;
+  const context = canvas.getContext('2d')!;
+  context.setTransform(ratio, 0, 0, ratio, 0, 0);
+  const style = getComputedStyle(canvas);
+  context.font = `${style.fontSize} ${style.fontFamily}`;
+  context.fillStyle = style.color;
+  context.strokeStyle = style.color;
+  context.globalAlpha = 0.8;
+
+  const [low, high] = renderer.domain;
+  context.textAlign = 'right';
+  context.textBaseline = 'middle';
+  for (let i = 0; i <= Y_TICKS; i++) {
+    const value = low + ((high - low) * i) / Y_TICKS;
+    const y = MARGIN.top + plot.height - (plot.height * i) / Y_TICKS;
+    context.fillText(
+      yFormatter ? yFormatter(value) : `${value}`,
+      MARGIN.left - 8,
+      y
+    );
+  }
+
+  if (data.length === 0) {
+    return;
+  }
+  const first = data[0].time;
+  const last = data[data.length - 1].time;
+  context.textAlign = 'center';
+  context.textBaseline = 'top';
+  context.globalAlpha = 0.3;
+  for (let i = 0; i <= X_TICKS; i++) {
+    const x = MARGIN.left + (plot.width * i) / X_TICKS;
+    context.beginPath();
+    context.moveTo(x, MARGIN.top);
+    context.lineTo(x, MARGIN.top + plot.height);
+    context.stroke();
+  }
+  context.globalAlpha = 0.8;
+  for (let i = 1; i < X_TICKS; i++) {
+    const time = first + ((last - first) * i) / X_TICKS;
+    const x = MARGIN.left + renderer.x(time, plot.width);
+    context.fillText(
+      xFormatter ? xFormatter(time) : `${time}`,
+      x,
+      MARGIN.top + plot.height + 4
+    );
+  }
+  if (hover !== null && hover !== undefined) {
+    context.beginPath();
+    context.moveTo(MARGIN.left + hover, MARGIN.top);
+    context.lineTo(MARGIN.left + hover, MARGIN.top + plot.height);
+    context.stroke();
+  }
+};
+
+/**
+ * Canvas version of CustomLineChart, taking the same recharts `<Line>`
+ * children to declare its series. Suited to many series of many samples,
+ * whose SVG paths would otherwise be rebuilt on every update.
+ */
+export const CanvasLineChart = ({
+  data,
+  title = '',
+  yDomain,
+  xFormatter,
+  yFormatter,
+  width,
+  height,
+  children
+}: {
+  data: any[];
+  title?: string;
+  yDomain?: [number, number];
+  xFormatter?: (value: number | string | undefined) => string;
+  yFormatter?: (value: number | undefined) => string;
+  width: number;
+  height: number;
+  children?: React.ReactNode;
+}) => {
+  const plotRef = useRef<HTMLCanvasElement>(null);
+  const overlayRef = useRef<HTMLCanvasElement>(null);
+  const rendererRef = useRef<IncrementalRenderer | null>(null);
+  const [hover, setHover] = useState<number | null>(null);
+  const series = seriesOf(children);
+  const chartWidth = width * 0.95;
+  const plot = {
+    width: Math.max(chartWidth - MARGIN.left - MARGIN.right, 1),
+    height: Math.max(height - MARGIN.top - MARGIN.bottom, 1)
+  };
+
+  useLayoutEffect(() => {
+    if (!plotRef.current || !overlayRef.current) {
+      return;
+    }
+    if (!rendererRef.current) {
+      rendererRef.current = new IncrementalRenderer(plotRef.current);
+    }
+    const renderer = rendererRef.current;
+    renderer.draw(data, series, plot.width, plot.height, yDomain);
+    drawOverlay(
+      overlayRef.current,
+      renderer,
+      data,
+      chartWidth,
+      height,
+      plot,
+      xFormatter,
+      yFormatter,
+      hover
+    );
+  });
+
+  // Values of the sample nearest to the pointer, shown as a tooltip
+  let tooltip = null;
+  if (hover !== null && data.length > 0 && rendererRef.current) {
+    const time = rendererRef.current.time(hover, plot.width);
+    const index = Math.min(bisect(data, time), data.length - 1);
+    tooltip = renderCustomTooltip(
+      {
+        active: true,
+        label: data[index].time,
+        payload: series.map(s => ({
+          name: s.name,
+          value: valueOf(data[index], s),
+          color: s.stroke
+        }))
+      },
+      {
+        labelFormatter: xFormatter,
+        valueFormatter: yFormatter as (value: number) => string
+      }
+    );
+  }
+
+  return (
+    <>
+      <strong className="multi-chart-title">{title}</strong>
+      <div
+        className="nv-canvas-chart"
+        style={{ width: chartWidth, height }}
+        onMouseMove={event => {
+          const x =
+            event.clientX -
+            event.currentTarget.getBoundingClientRect().left -
+            MARGIN.left;
+          setHover(x >= 0 && x <= plot.width ? x : null);
+        }}
+        onMouseLeave={() => setHover(null)}
+      >
+        <canvas
+          ref={plotRef}
+          className="nv-canvas-chart-plot"
+          style={{ left: MARGIN.left, top: MARGIN.top }}
+        />
+        <canvas ref={overlayRef} className="nv-canvas-chart-overlay" />
+        <div className="nv-canvas-chart-legend">
+          {series.map(s => (
+            <span key={s.name} style={{ color: s.stroke }}>
+              {s.name}
+            </span>
+          ))}
+        </div>
+        {tooltip && (
+          <div
+            className="nv-canvas-chart-tooltip"
+            style={
+              hover! > plot.width / 2
+                ? { right: chartWidth - MARGIN.left - hover! + 10 }
+                : { left: MARGIN.left + hover! + 10 }
+            }
+          >
+            {tooltip}
+          </div>
+        )}
+      </div>
+      <hr className="gpu-dashboard-divider" />
+    </>
+  );
+};
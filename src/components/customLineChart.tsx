@@ -14,8 +14,10 @@ import {
   CartesianGrid
 } from 'recharts';
 import { renderCustomTooltip } from '../components/tooltipUtils';
+import { CanvasLineChart } from './canvasLineChart';
+import { getChartRenderer } from '../assets/hooks';
 
-export const CustomLineChart = ({
+const SvgLineChart = ({
   data,
   title = '',
   yDomain,
@@ -69,3 +71,16 @@ export const CustomLineChart = ({
     <hr className="gpu-dashboard-divider" />
   </>
 );
+
+/**
+ * Line chart of a time series, drawn with the renderer selected in the
+ * settings.
+ */
+export const CustomLineChart = (
+  props: React.ComponentProps<typeof SvgLineChart>
+) =>
+  getChartRenderer() === 'canvas' ? (
+    <CanvasLineChart {...props} />
+  ) : (
+    <SvgLineChart {...props} />
+  );
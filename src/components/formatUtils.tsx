@@ -12,3 +12,7 @@ export const formatBytes = (value: number | undefined): string => {
 export const formatDate = (value: number | string | undefined): string => {
   return value ? new Date(value).toLocaleTimeString() : '';
 };
+
+// Width of a category axis fitting its longest label, e.g. of a MIG device
+export const categoryAxisWidth = (labels: string[]): number =>
+  Math.max(60, ...labels.map(label => 8 * label.length));
@@ -18,7 +18,11 @@ import {
   MachineResourceChartWidget,
   PciThroughputChartWidget,
   NvLinkThroughputChartWidget,
-  NvLinkTimelineChartWidget
+  NvLinkTimelineChartWidget,
+  GpuProcessesChartWidget,
+  TopologyChartWidget,
+  DiagnosticsChartWidget,
+  GpuHealthChartWidget
 } from './charts';
 import { MainAreaWidget, WidgetTracker } from '@jupyterlab/apputils';
 import { gpuIcon, hBarIcon, vBarIcon, lineIcon } from './assets/icons';
@@ -122,6 +126,18 @@ const Control: React.FC<IControlProps> = ({
       case 'nvlink-throughput-timeseries-widget':
         widgetFunction = () => new NvLinkTimelineChartWidget(settingRegistry);
         break;
+      case 'gpu-processes-widget':
+        widgetFunction = () => new GpuProcessesChartWidget(settingRegistry);
+        break;
+      case 'gpu-topology-widget':
+        widgetFunction = () => new TopologyChartWidget(settingRegistry);
+        break;
+      case 'gpu-health-widget':
+        widgetFunction = () => new GpuHealthChartWidget(settingRegistry);
+        break;
+      case 'diagnostics-widget':
+        widgetFunction = () => new DiagnosticsChartWidget(settingRegistry);
+        break;
       default:
         return;
     }
@@ -205,6 +221,34 @@ const Control: React.FC<IControlProps> = ({
       >
         {IconTitle(lineIcon.react, 'NVLink Throughput')}
       </Button>
+      <Button
+        className="gpu-dashboard-button"
+        onClick={() =>
+          openWidgetById('gpu-processes-widget', 'GPU Processes')
+        }
+      >
+        {IconTitle(hBarIcon.react, 'GPU Processes')}
+      </Button>
+      <Button
+        className="gpu-dashboard-button"
+        onClick={() => openWidgetById('gpu-topology-widget', 'GPU Topology')}
+      >
+        {IconTitle(gpuIcon.react, 'GPU Topology')}
+      </Button>
+      <Button
+        className="gpu-dashboard-button"
+        onClick={() => openWidgetById('gpu-health-widget', 'GPU Health')}
+      >
+        {IconTitle(lineIcon.react, 'GPU Health')}
+      </Button>
+      <Button
+        className="gpu-dashboard-button"
+        onClick={() =>
+          openWidgetById('diagnostics-widget', 'Dashboard Diagnostics')
+        }
+      >
+        {IconTitle(lineIcon.react, 'Dashboard Diagnostics')}
+      </Button>
       <div className="gpu-dashboard-footer">
         <hr className="gpu-dashboard-divider" />
         <span className="gpu-dashboard-footer-body">
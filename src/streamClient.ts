@@ -0,0 +1,246 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: BSD-3-Clause
+ */
+
+import { connectToWebSocket } from './handler';
+
+// Delay in ms before reconnecting, doubling after each failed attempt
+const RECONNECT_DELAY = 1000;
+const RECONNECT_DELAY_MAX = 30000;
+
+/**
+ * Options of a subscription to a channel of the stream.
+ */
+export interface IStreamOptions {
+  updateFrequency: number;
+  isPaused: boolean;
+  // Number of samples recorded by the server to receive first
+  backfill?: number;
+}
+
+/**
+ * A subscription to a channel of the stream.
+ */
+export interface IStreamSubscription {
+  update(options: Partial<IStreamOptions>): void;
+  dispose(): void;
+}
+
+interface ISubscriber extends IStreamOptions {
+  channel: string;
+  listener: (sample: any) => void;
+  // Time in ms the last frame was delivered to the listener
+  delivered: number;
+}
+
+/**
+ * Client of the `nvdashboard/stream` websocket, shared by every widget of
+ * the page.
+ *
+ * Each channel is requested from the server once, at the fastest update
+ * frequency of the widgets subscribed to it, and each frame is parsed once
+ * and handed to the widgets whose own update frequency is due. The connection is opened with the first
+ * subscription, closed with the last, and reopened with a growing delay when
+ * it drops.
+ */
+export class StreamClient {
+  private ws: WebSocket | null = null;
+  // True once the server has accepted the connection
+  private connected = false;
+  private subscribers = new Set<ISubscriber>();
+  // Update frequency requested from the server, by channel
+  private frequencies: { [channel: string]: number } = {};
+  // Subscribers waiting for their backfill, by channel
+  private backfills = new Map<string, ISubscriber[]>();
+  private reconnectDelay = RECONNECT_DELAY;
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+
+  constructor(private endpoint = 'stream') {
+    document.addEventListener('visibilitychange', () => this.sync());
+  }
+
+  /**
+   * Calls `listener` with each sample of `channel` until disposed.
+   */
+  subscribe<T>(
+    channel: string,
+    listener: (sample: T) => void,
+    options: IStreamOptions
+  ): IStreamSubscription {
+    const subscriber: ISubscriber = {
+      ...options,
+      channel,
+      listener,
+      delivered: 0
+    };
+    this.subscribers.add(subscriber);
+    if (!this.ws) {
+      this.connect();
+    } else if (this.connected) {
+      this.requestBackfill([subscriber]);
+      this.sync();
+    }
+    return {
+      update: changes => {
+        Object.assign(subscriber, changes);
+        this.sync();
+      },
+      dispose: () => {
+        this.subscribers.delete(subscriber);
+        const waiting = this.backfills.get(channel);
+        if (waiting) {
+          this.backfills.set(
+            channel,
+            waiting.filter(other => other !== subscriber)
+          );
+        }
+        if (this.subscribers.size === 0) {
+          this.disconnect();
+        } else {
+          this.sync();
+        }
+      }
+    };
+  }
+
+  private connect(): void {
+    this.reconnectTimer = null;
+    const ws = connectToWebSocket(this.endpoint);
+    this.ws = ws;
+
+    ws.onopen = () => {
+      console.log(`WebSocket connected to ${this.endpoint}`);
+    };
+
+    ws.onmessage = event => {
+      const response = JSON.parse(event.data);
+      if (response.error) {
+        console.error(`WebSocket ${this.endpoint} error: ${response.error}`);
+      } else if (response.history) {
+        this.onHistory(response.history);
+      } else if (response.channels && response.status === undefined) {
+        this.onFrame(response.channels);
+      } else if (response.status === 'connected') {
+        this.connected = true;
+        this.reconnectDelay = RECONNECT_DELAY;
+        if (response.initializing?.length) {
+          // Their samples start once the server has discovered the GPUs
+          console.log(`WebSocket ${this.endpoint} initializing`);
+        }
+        this.requestBackfill(Array.from(this.subscribers));
+        this.sync();
+      }
+    };
+
+    ws.onerror = error => {
+      console.error(`WebSocket error on ${this.endpoint}:`, error);
+    };
+
+    ws.onclose = () => {
+      console.log(`WebSocket disconnected from ${this.endpoint}`);
+      if (this.ws !== ws) {
+        return;
+      }
+      this.ws = null;
+      this.connected = false;
+      if (this.subscribers.size > 0) {
+        this.reconnectTimer = setTimeout(
+          () => this.connect(),
+          this.reconnectDelay
+        );
+        this.reconnectDelay = Math.min(
+          this.reconnectDelay * 2,
+          RECONNECT_DELAY_MAX
+        );
+      }
+    };
+  }
+
+  private disconnect(): void {
+    if (this.reconnectTimer !== null) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    const ws = this.ws;
+    this.ws = null;
+    this.connected = false;
+    this.backfills.clear();
+    ws?.close();
+  }
+
+  /**
+   * Sends the channels of the active subscribers, each at the fastest
+   * frequency requested, replacing the previous subscriptions.
+   */
+  private sync(): void {
+    if (!this.ws || !this.connected) {
+      return;
+    }
+    const channels: { [channel: string]: number } = {};
+    this.subscribers.forEach(({ channel, updateFrequency, isPaused }) => {
+      if (!isPaused) {
+        channels[channel] = Math.min(
+          channels[channel] ?? Infinity,
+          updateFrequency
+        );
+      }
+    });
+    this.frequencies = channels;
+    this.ws.send(JSON.stringify({ channels, visible: !document.hidden }));
+  }
+
+  private requestBackfill(subscribers: ISubscriber[]): void {
+    const counts: { [channel: string]: number } = {};
+    subscribers.forEach(subscriber => {
+      if (!subscriber.backfill) {
+        return;
+      }
+      const { channel, backfill } = subscriber;
+      counts[channel] = Math.max(counts[channel] ?? 0, backfill);
+      this.backfills.set(channel, [
+        ...(this.backfills.get(channel) ?? []),
+        subscriber
+      ]);
+    });
+    if (this.ws && Object.keys(counts).length > 0) {
+      this.ws.send(JSON.stringify({ backfill: counts }));
+    }
+  }
+
+  private onHistory(history: { [channel: string]: any[] }): void {
+    Object.entries(history).forEach(([channel, samples]) => {
+      // Only the subscribers that asked for it, the others already have it
+      const waiting = this.backfills.get(channel) ?? [];
+      this.backfills.delete(channel);
+      waiting.forEach(subscriber => {
+        samples
+          .slice(-(subscriber.backfill ?? 0))
+          .forEach(sample => subscriber.listener(sample));
+      });
+    });
+  }
+
+  private onFrame(channels: { [channel: string]: any }): void {
+    const now = Date.now();
+    this.subscribers.forEach(subscriber => {
+      const { channel, listener, isPaused, updateFrequency } = subscriber;
+      if (isPaused || !(channel in channels)) {
+        return;
+      }
+      // Downsample to the subscriber's own frequency, allowing half a frame
+      // of jitter so slower subscribers keep their cadence
+      const frame = this.frequencies[channel] ?? 0;
+      if (now - subscriber.delivered + frame / 2 < updateFrequency) {
+        return;
+      }
+      subscriber.delivered = now;
+      listener(channels[channel]);
+    });
+  }
+}
+
+/**
+ * Stream client shared by the widgets of the page.
+ */
+export const streamClient = new StreamClient();